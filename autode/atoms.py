@@ -1,3 +1,4 @@
+import weakref
 import numpy as np
 from copy import deepcopy
 from typing import Union, Optional, List, Sequence, Any
@@ -79,6 +80,22 @@ class Atom:
     def __str__(self):
         return self.__repr__()
 
+    def __getstate__(self):
+        # Only the coordinate, not the set of atoms that stores it, is copied
+        state = self.__dict__.copy()
+        state.pop("_owner", None)
+        return state
+
+    def _release(self) -> None:
+        """Detach this atom's coordinate from the store of a set of atoms"""
+        owner = self.__dict__.pop("_owner", None)
+        owner = None if owner is None else owner()
+
+        if owner is not None:
+            owner._store = None
+
+        return None
+
     def __eq__(self, other: Any):
         """Equality of another atom to this one"""
         are_equal = (
@@ -180,7 +197,11 @@ class Atom:
         Raises:
             (ValueError): If the arguments cannot be coerced into a (3,) shape
         """
+        if len(args) == 1 and args[0] is self._coord:
+            return  # Modified in place e.g. atom.coord += vec
+
         self._coord = Coordinate(*args)
+        self._release()
 
     @property
     def is_metal(self) -> bool:
@@ -585,11 +606,82 @@ class DummyAtom(Atom):
         return Distance(0.0, units="Å")
 
 
+def _invalidates_store(method):
+    """Decorate a method of Atoms that changes the atoms in the list"""
+
+    def wrapped_method(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._store = None
+        return result
+
+    wrapped_method.__name__ = method.__name__
+    wrapped_method.__doc__ = method.__doc__
+    return wrapped_method
+
+
 class Atoms(list):
+    """
+    List of atoms. The coordinates of all the atoms are held in a single
+    contiguous (n_atoms, 3) array, built on first access, with the coordinate
+    of each atom a view of a row. Getting and setting the coordinates of all
+    the atoms is then a single array copy, rather than one per atom. The store
+    is rebuilt if the list changes or an atom's coordinate is replaced
+    """
+
+    _store: Optional[np.ndarray] = None
+
+    __setitem__ = _invalidates_store(list.__setitem__)
+    __delitem__ = _invalidates_store(list.__delitem__)
+    __iadd__ = _invalidates_store(list.__iadd__)
+    __imul__ = _invalidates_store(list.__imul__)
+    append = _invalidates_store(list.append)
+    extend = _invalidates_store(list.extend)
+    insert = _invalidates_store(list.insert)
+    pop = _invalidates_store(list.pop)
+    remove = _invalidates_store(list.remove)
+    clear = _invalidates_store(list.clear)
+    sort = _invalidates_store(list.sort)
+    reverse = _invalidates_store(list.reverse)
+
     def __repr__(self):
         """Representation"""
         return f"Atoms(n_atoms={len(self)}, {super().__repr__()})"
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_store", None)
+        return state
+
+    def _packed_coordinates(self) -> Optional[np.ndarray]:
+        """
+        Contiguous array backing the coordinates of these atoms, built if
+        required. None if the same atom appears more than once in this list,
+        as one atom cannot be a view of two rows
+
+        -----------------------------------------------------------------------
+        Returns:
+            (np.ndarray | None): shape = (n_atoms, 3)
+        """
+        if self._store is not None:
+            return self._store
+
+        if len(set(map(id, self))) != len(self):
+            return None
+
+        coords = [atom._coord for atom in self]
+        store = np.array(coords, dtype=float).reshape(-1, 3)
+        owner = weakref.ref(self)
+
+        for i, atom in enumerate(self):
+            atom._release()  # From any other set of atoms sharing this one
+
+            coord = store[i].view(Coordinate)
+            coord.units = atom._coord.units
+            atom._coord, atom._owner = coord, owner
+
+        self._store = store
+        return store
+
     def __add__(self, other):
         """Add another set of Atoms to this one. Can add None"""
         if other is None:
@@ -621,7 +713,12 @@ class Atoms(list):
 
     @property
     def coordinates(self) -> Coordinates:
-        return Coordinates(np.array([a.coord for a in self]))
+        store = self._packed_coordinates()
+
+        if store is None:
+            return Coordinates(np.array([a.coord for a in self]))
+
+        return Coordinates(store)
 
     @coordinates.setter
     def coordinates(self, value: np.ndarray):
@@ -647,8 +744,13 @@ class Atoms(list):
                 f"dimensional"
             )
 
-        for i, atom in enumerate(self):
-            atom.coord = Coordinate(*value[i])
+        store = self._packed_coordinates()
+
+        if store is None:
+            for i, atom in enumerate(self):
+                atom.coord = Coordinate(*value[i])
+        else:
+            store[:] = value
 
     @property
     def com(self) -> Coordinate:
@@ -719,7 +821,8 @@ class Atoms(list):
 
     def idxs_are_present(self, *args: int) -> bool:
         """Are all these indexes present in this set of atoms"""
-        return set(args).issubset(set(range(len(self))))
+        n_atoms = len(self)
+        return all(0 <= i < n_atoms and int(i) == i for i in args)
 
     def eqm_bond_distance(self, i: int, j: int) -> Distance:
         """
@@ -789,6 +892,133 @@ class Atoms(list):
 
         return Distance(np.linalg.norm(self[i].coord - self[j].coord))
 
+    def _coordinate_array(self) -> np.ndarray:
+        """Coordinates (Å) as a plain array, which must not be modified"""
+        store = self._packed_coordinates()
+
+        if store is None:
+            return np.array([a.coord for a in self], dtype=float)
+
+        return store
+
+    def _idxs_array(self, idxs: Any, n: int, name: str) -> np.ndarray:
+        """Validated (n_sets, n) integer array of atom indexes"""
+        idxs = np.asarray(idxs, dtype=int).reshape(-1, n)
+
+        if idxs.size > 0 and (idxs.min() < 0 or idxs.max() >= len(self)):
+            raise ValueError(
+                f"Cannot calculate {name}. At least one atom not present"
+            )
+
+        return idxs
+
+    def distances(self, pairs: Any) -> np.ndarray:
+        """
+        Distances between pairs of atoms (Å), as a plain array. Equivalent to
+        [float(atoms.distance(i, j)) for i, j in pairs] without creating a
+        Distance for each pair. Example:
+
+        .. code-block:: Python
+
+            >>> import autode as ade
+            >>> h2 = ade.Molecule(atoms=[ade.Atom('H'), ade.Atom('H', x=0.7)])
+            >>> h2.atoms.distances([(0, 1), (1, 0)])
+            array([0.7, 0.7])
+
+        -----------------------------------------------------------------------
+        Arguments:
+            pairs: Atom indexes. shape = (n, 2)
+
+        Returns:
+            (np.ndarray): Distances. shape = (n,)
+
+        Raises:
+            (ValueError): If any of the atom indexes are not present
+        """
+        idxs = self._idxs_array(pairs, n=2, name="distances")
+        x = self._coordinate_array()
+
+        return np.linalg.norm(x[idxs[:, 0]] - x[idxs[:, 1]], axis=1)
+
+    def angles(self, triples: Any) -> np.ndarray:
+        """
+        Angles i-j-k between triples of atoms (radians), as a plain array.
+        Equivalent to [float(atoms.angle(i, j, k)) for i, j, k in triples]
+
+        -----------------------------------------------------------------------
+        Arguments:
+            triples: Atom indexes. shape = (n, 3)
+
+        Returns:
+            (np.ndarray): Angles. shape = (n,)
+
+        Raises:
+            (ValueError): If any of the atom indexes are not present, or any
+                          angle is undefined
+        """
+        idxs = self._idxs_array(triples, n=3, name="angles")
+        x = self._coordinate_array()
+
+        vec1 = x[idxs[:, 0]] - x[idxs[:, 1]]
+        vec2 = x[idxs[:, 2]] - x[idxs[:, 1]]
+        norms = np.linalg.norm(vec1, axis=1) * np.linalg.norm(vec2, axis=1)
+
+        if np.any(np.isclose(norms, 0.0)):
+            raise ValueError(
+                "Cannot calculate angles - at least one zero vector"
+            )
+
+        # Cos(theta) must lie within [-1, 1]
+        cos_values = np.clip(
+            np.einsum("ij,ij->i", vec1, vec2) / norms, a_min=-1, a_max=1
+        )
+        return np.arccos(cos_values)
+
+    def dihedrals(self, quads: Any) -> np.ndarray:
+        """
+        Dihedral angles w-x-y-z between sets of four atoms (radians), as a
+        plain array. Equivalent to
+        [float(atoms.dihedral(w, x, y, z)) for w, x, y, z in quads]
+
+        -----------------------------------------------------------------------
+        Arguments:
+            quads: Atom indexes. shape = (n, 4)
+
+        Returns:
+            (np.ndarray): Dihedral angles in (-π, π]. shape = (n,)
+
+        Raises:
+            (ValueError): If any of the atom indexes are not present, or any
+                          dihedral is undefined
+        """
+        idxs = self._idxs_array(quads, n=4, name="dihedrals")
+        x = self._coordinate_array()
+
+        vec_xw = x[idxs[:, 0]] - x[idxs[:, 1]]
+        vec_yz = x[idxs[:, 3]] - x[idxs[:, 2]]
+        vec_xy = x[idxs[:, 2]] - x[idxs[:, 1]]
+
+        vec1, vec2 = np.cross(vec_xw, vec_xy), np.cross(-vec_xy, vec_yz)
+
+        # Normalise and ensure no zero vectors, for which the dihedral is not
+        # defined
+        vecs = []
+        for vec in (vec1, vec2, vec_xy):
+            norms = np.linalg.norm(vec, axis=1)
+
+            if np.any(np.isclose(norms, 0.0)):
+                raise ValueError(
+                    "Cannot calculate dihedral angles - one zero vector"
+                )
+            vecs.append(vec / norms[:, np.newaxis])
+
+        vec1, vec2, vec_xy = vecs
+        # Sign convention as in AtomCollection.dihedral
+        return -np.arctan2(
+            np.einsum("ij,ij->i", np.cross(vec1, vec_xy), vec2),
+            np.einsum("ij,ij->i", vec1, vec2),
+        )
+
     def vector(self, i: int, j: int) -> np.ndarray:
         """
         Vector from atom i to atom j
@@ -990,6 +1220,21 @@ class AtomCollection:
         assert self.atoms is not None, "Must have atoms"
         return self.atoms.eqm_bond_distance(i, j)
 
+    def distances(self, pairs: Any) -> np.ndarray:
+        """Distances between pairs of atoms (Å). See Atoms.distances"""
+        assert self.atoms is not None, "Must have atoms"
+        return self.atoms.distances(pairs)
+
+    def angles(self, triples: Any) -> np.ndarray:
+        """Angles between triples of atoms (radians). See Atoms.angles"""
+        assert self.atoms is not None, "Must have atoms"
+        return self.atoms.angles(triples)
+
+    def dihedrals(self, quads: Any) -> np.ndarray:
+        """Dihedrals of sets of four atoms (radians). See Atoms.dihedrals"""
+        assert self.atoms is not None, "Must have atoms"
+        return self.atoms.dihedrals(quads)
+
     def angle(self, i: int, j: int, k: int) -> Angle:
         r"""
         Angle between three atoms i-j-k, where the atoms are indexed from
@@ -1,5 +1,6 @@
 import itertools
 import os
+from collections import Counter
 from autode.geom import get_neighbour_list
 from autode.log import logger
 from autode.config import Config
@@ -8,6 +9,7 @@ from autode.mol_graphs import (
     get_fbonds,
     is_isomorphic,
     find_cycles,
+    graph_hash,
 )
 
 
@@ -103,6 +105,8 @@ def get_bond_rearrangs(reactant, product, name, save=True):
         )
         return None
 
+    graph_filter = ProductGraphFilter(reactant.graph, product.graph)
+
     for func in funcs:
         possible_brs = func(
             reactant,
@@ -113,6 +117,11 @@ def get_bond_rearrangs(reactant, product, name, save=True):
             possible_bbond_and_fbonds,
             bbond_atom_type_fbonds,
             fbond_atom_type_bbonds,
+            graph_filter=graph_filter,
+        )
+        logger.info(
+            f"Checked isomorphism of {graph_filter.n_isomorphism_checks} "
+            f"of {graph_filter.n_rearrangements} rearranged graphs"
         )
 
         if len(possible_brs) > 0:
@@ -220,7 +229,9 @@ def get_bond_rearrangs_from_file(filename="bond_rearrangs.txt"):
     return bond_rearrangs
 
 
-def add_bond_rearrangment(bond_rearrangs, reactant, product, fbonds, bbonds):
+def add_bond_rearrangment(
+    bond_rearrangs, reactant, product, fbonds, bbonds, graph_filter=None
+):
     """
     For a possible bond rearrangement, sees if the products are made, and
     adds it to the bond rearrang list if it does
@@ -238,6 +249,12 @@ def add_bond_rearrangment(bond_rearrangs, reactant, product, fbonds, bbonds):
 
         bbonds (list(tuple)): list of bonds to be broken
 
+    Keyword Arguments:
+        graph_filter (autode.bond_rearrangement.ProductGraphFilter | None):
+                     Filter used to reject rearrangements that cannot make
+                     the product without an isomorphism check. If None then
+                     one is created for this rearrangement
+
     Returns:
         (list(autode.bond_rearrangements.BondRearrangement)):
     """
@@ -256,11 +273,10 @@ def add_bond_rearrangment(bond_rearrangs, reactant, product, fbonds, bbonds):
                 # we don't need to run isomorphism
                 return bond_rearrangs
 
-    rearranged_graph = generate_rearranged_graph(
-        reactant.graph, fbonds=fbonds, bbonds=bbonds
-    )
+    if graph_filter is None:
+        graph_filter = ProductGraphFilter(reactant.graph, product.graph)
 
-    if is_isomorphic(rearranged_graph, product.graph):
+    if graph_filter.makes_product(fbonds=fbonds, bbonds=bbonds):
         ordered_fbonds = []
         ordered_bbonds = []
         for fbond in fbonds:
@@ -310,6 +326,159 @@ def generate_rearranged_graph(graph, fbonds, bbonds):
     return rearranged_graph
 
 
+class ProductGraphFilter:
+    """
+    Filter for rearrangements of the bonds in a reactant graph that cannot
+    make a graph isomorphic to the product graph, applied before a (slow)
+    isomorphism check. Rearrangements are rejected if the counts of atoms
+    with each label and degree or of each type of bond differ from the
+    product, which are updated from the counts in the reactant without
+    generating the rearranged graph, then if the Weisfeiler–Lehman hash of
+    the rearranged graph differs from that of the product. The result for
+    each set of forming and breaking bonds is only determined once
+    """
+
+    def __init__(self, reactant_graph, product_graph):
+        """
+        Filter for the rearrangements of a reactant graph
+
+        -----------------------------------------------------------------------
+        Arguments:
+            reactant_graph (autode.mol_graphs.MolecularGraph):
+
+            product_graph (autode.mol_graphs.MolecularGraph):
+        """
+        self.reactant_graph = reactant_graph
+        self.product_graph = product_graph
+
+        self._degree_counts = self._get_degree_counts(reactant_graph)
+        self._bond_counts = self._get_bond_counts(reactant_graph)
+        self._product_degree_counts = self._get_degree_counts(product_graph)
+        self._product_bond_counts = self._get_bond_counts(product_graph)
+        self._product_hash = None
+
+        self._results = {}
+        self.n_rearrangements = 0
+        self.n_isomorphism_checks = 0
+
+    def makes_product(self, fbonds, bbonds):
+        """
+        Does forming and breaking a set of bonds in the reactant graph make
+        a graph that is isomorphic to the product graph?
+
+        -----------------------------------------------------------------------
+        Arguments:
+            fbonds (list(tuple)): list of bonds to be made
+
+            bbonds (list(tuple)): list of bonds to be broken
+
+        Returns:
+            (bool):
+        """
+        key = (
+            tuple(sorted(tuple(sorted(bond)) for bond in fbonds)),
+            tuple(sorted(tuple(sorted(bond)) for bond in bbonds)),
+        )
+
+        if key not in self._results:
+            self._results[key] = self._makes_product(fbonds, bbonds)
+            self.n_rearrangements += 1
+
+        return self._results[key]
+
+    def _makes_product(self, fbonds, bbonds):
+        if self._only_changes_bonds(fbonds, bbonds) and not (
+            self._has_product_counts(fbonds, bbonds)
+        ):
+            return False
+
+        rearranged_graph = generate_rearranged_graph(
+            self.reactant_graph, fbonds=fbonds, bbonds=bbonds
+        )
+
+        if self._product_hash is None:
+            self._product_hash = graph_hash(self.product_graph)
+
+        if graph_hash(rearranged_graph) != self._product_hash:
+            return False
+
+        self.n_isomorphism_checks += 1
+        return is_isomorphic(rearranged_graph, self.product_graph)
+
+    def _only_changes_bonds(self, fbonds, bbonds):
+        """
+        Are all the forming bonds not in the reactant graph, and all the
+        breaking bonds in it, without any repeats? If not, the counts cannot
+        be updated from those of the reactant
+        """
+        graph = self.reactant_graph
+        bonds = {tuple(sorted(bond)) for bond in list(fbonds) + list(bbonds)}
+
+        return (
+            len(bonds) == len(fbonds) + len(bbonds)
+            and all(i in graph and j in graph for i, j in bonds)
+            and not any(graph.has_edge(*bond) for bond in fbonds)
+            and all(graph.has_edge(*bond) for bond in bbonds)
+        )
+
+    def _has_product_counts(self, fbonds, bbonds):
+        """
+        Are the counts of atoms with each label and degree, and of each type
+        of bond, in the rearranged reactant graph the same as in the product
+        """
+        graph = self.reactant_graph
+
+        bond_counts = self._bond_counts.copy()
+        for i, j in fbonds:
+            bond_counts[self._bond_type(graph, i, j, active=False)] += 1
+        for i, j in bbonds:
+            bond_counts[self._bond_type(graph, i, j)] -= 1
+
+        if +bond_counts != self._product_bond_counts:
+            return False
+
+        delta_degrees = Counter()
+        for sign, bonds in ((1, fbonds), (-1, bbonds)):
+            for i, j in bonds:
+                delta_degrees[i] += sign
+                delta_degrees[j] += sign
+
+        degree_counts = self._degree_counts.copy()
+        for idx, delta in delta_degrees.items():
+            label, degree = self._atom_type(graph, idx), graph.degree(idx)
+            degree_counts[(label, degree)] -= 1
+            degree_counts[(label, degree + delta)] += 1
+
+        return +degree_counts == self._product_degree_counts
+
+    @staticmethod
+    def _atom_type(graph, idx):
+        """Atom label and class, with the defaults used to match atoms"""
+        node = graph.nodes[idx]
+        return f'{node.get("atom_label", "C")}:{node.get("atom_class", None)}'
+
+    @classmethod
+    def _bond_type(cls, graph, i, j, active=None):
+        if active is None:
+            active = graph.edges[i, j].get("active", False)
+
+        atom_types = sorted(
+            (cls._atom_type(graph, i), cls._atom_type(graph, j))
+        )
+        return (*atom_types, bool(active))
+
+    @classmethod
+    def _get_degree_counts(cls, graph):
+        return Counter(
+            (cls._atom_type(graph, idx), degree)
+            for idx, degree in graph.degree
+        )
+
+    @classmethod
+    def _get_bond_counts(cls, graph):
+        return Counter(cls._bond_type(graph, i, j) for i, j in graph.edges)
+
+
 def get_fbonds_bbonds_1b(
     reac,
     prod,
@@ -319,13 +488,19 @@ def get_fbonds_bbonds_1b(
     possible_bbond_and_fbonds,
     bbond_atom_type_fbonds,
     fbond_atom_type_bbonds,
+    graph_filter=None,
 ):
     logger.info("Getting possible 1 breaking bond rearrangements")
 
     for bbond in all_possible_bbonds[0]:
         # Break one bond
         possible_brs = add_bond_rearrangment(
-            possible_brs, reac, prod, fbonds=[], bbonds=[bbond]
+            possible_brs,
+            reac,
+            prod,
+            fbonds=[],
+            bbonds=[bbond],
+            graph_filter=graph_filter,
         )
 
     return possible_brs
@@ -340,6 +515,7 @@ def get_fbonds_bbonds_2b(
     possible_bbond_and_fbonds,
     bbond_atom_type_fbonds,
     fbond_atom_type_bbonds,
+    graph_filter=None,
 ):
     logger.info("Getting possible 2 breaking bond rearrangements")
 
@@ -349,7 +525,12 @@ def get_fbonds_bbonds_2b(
             all_possible_bbonds[0], 2
         ):
             possible_brs = add_bond_rearrangment(
-                possible_brs, reac, prod, fbonds=[], bbonds=[bbond1, bbond2]
+                possible_brs,
+                reac,
+                prod,
+                fbonds=[],
+                bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     elif len(all_possible_bbonds) == 2:
@@ -358,7 +539,12 @@ def get_fbonds_bbonds_2b(
             all_possible_bbonds[0], all_possible_bbonds[1]
         ):
             possible_brs = add_bond_rearrangment(
-                possible_brs, reac, prod, fbonds=[], bbonds=[bbond1, bbond2]
+                possible_brs,
+                reac,
+                prod,
+                fbonds=[],
+                bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     return possible_brs
@@ -373,6 +559,7 @@ def get_fbonds_bbonds_1b1f(
     possible_bbond_and_fbonds,
     bbond_atom_type_fbonds,
     fbond_atom_type_bbonds,
+    graph_filter=None,
 ):
     logger.info(
         "Getting possible 1 breaking and 1 forming bond " "rearrangements"
@@ -384,7 +571,12 @@ def get_fbonds_bbonds_1b1f(
             all_possible_fbonds[0], all_possible_bbonds[0]
         ):
             possible_brs = add_bond_rearrangment(
-                possible_brs, reac, prod, fbonds=[fbond], bbonds=[bbond]
+                possible_brs,
+                reac,
+                prod,
+                fbonds=[fbond],
+                bbonds=[bbond],
+                graph_filter=graph_filter,
             )
 
     elif len(all_possible_bbonds) == 0 and len(all_possible_fbonds) == 0:
@@ -392,7 +584,12 @@ def get_fbonds_bbonds_1b1f(
         for bbonds, fbonds in possible_bbond_and_fbonds:
             for bbond, fbond in itertools.product(bbonds, fbonds):
                 possible_brs = add_bond_rearrangment(
-                    possible_brs, reac, prod, fbonds=[fbond], bbonds=[bbond]
+                    possible_brs,
+                    reac,
+                    prod,
+                    fbonds=[fbond],
+                    bbonds=[bbond],
+                    graph_filter=graph_filter,
                 )
 
     return possible_brs
@@ -407,6 +604,7 @@ def get_fbonds_bbonds_2b1f(
     possible_bbond_and_fbonds,
     bbond_atom_type_fbonds,
     fbond_atom_type_bbonds,
+    graph_filter=None,
 ):
     logger.info(
         "Getting possible 2 breaking and 1 forming bond rearrangements"
@@ -427,6 +625,7 @@ def get_fbonds_bbonds_2b1f(
                 prod,
                 fbonds=[fbond],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 1:
@@ -443,6 +642,7 @@ def get_fbonds_bbonds_2b1f(
                 prod,
                 fbonds=[fbond],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 0:
@@ -460,6 +660,7 @@ def get_fbonds_bbonds_2b1f(
                     prod,
                     fbonds=[fbond],
                     bbonds=[bbond1, bbond2],
+                    graph_filter=graph_filter,
                 )
 
         # Make and break two bonds, all of the same type
@@ -475,6 +676,7 @@ def get_fbonds_bbonds_2b1f(
                 prod,
                 fbonds=[fbond],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     return possible_brs
@@ -489,6 +691,7 @@ def get_fbonds_bbonds_2b2f(
     possible_bbond_and_fbonds,
     bbond_atom_type_fbonds,
     fbond_atom_type_bbonds,
+    graph_filter=None,
 ):
     logger.info(
         "Getting possible 2 breaking and 2 forming bond rearrangements"
@@ -510,6 +713,7 @@ def get_fbonds_bbonds_2b2f(
                 prod,
                 fbonds=[fbond1, fbond2],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     elif len(all_possible_bbonds) == 2 and len(all_possible_fbonds) == 1:
@@ -526,6 +730,7 @@ def get_fbonds_bbonds_2b2f(
                 prod,
                 fbonds=[fbond1, fbond2],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 2:
@@ -542,6 +747,7 @@ def get_fbonds_bbonds_2b2f(
                 prod,
                 fbonds=[fbond1, fbond2],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 1:
@@ -557,6 +763,7 @@ def get_fbonds_bbonds_2b2f(
                 prod,
                 fbonds=[fbond1, fbond2],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
         for bbonds, fbonds in possible_bbond_and_fbonds:
@@ -573,6 +780,7 @@ def get_fbonds_bbonds_2b2f(
                     prod,
                     fbonds=[fbond1, fbond2],
                     bbonds=[bbond1, bbond2],
+                    graph_filter=graph_filter,
                 )
 
         # Make a bond of one type, make and break two bonds of another type
@@ -588,6 +796,7 @@ def get_fbonds_bbonds_2b2f(
                 prod,
                 fbonds=[fbond1, fbond2],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
         two_f_possibles = itertools.combinations(all_possible_fbonds[0], 2)
@@ -604,6 +813,7 @@ def get_fbonds_bbonds_2b2f(
                 prod,
                 fbonds=[fbond1, fbond2],
                 bbonds=[bbond1, bbond2],
+                graph_filter=graph_filter,
             )
 
     elif len(all_possible_bbonds) == 0 and len(all_possible_fbonds) == 0:
@@ -621,6 +831,7 @@ def get_fbonds_bbonds_2b2f(
                     prod,
                     fbonds=[fbond1, fbond2],
                     bbonds=[bbond1, bbond2],
+                    graph_filter=graph_filter,
                 )
 
         for bbonds, fbonds in possible_bbond_and_fbonds:
@@ -637,6 +848,7 @@ def get_fbonds_bbonds_2b2f(
                     prod,
                     fbonds=[fbond1, fbond2],
                     bbonds=[bbond1, bbond2],
+                    graph_filter=graph_filter,
                 )
 
     return possible_brs
@@ -663,19 +875,20 @@ def strip_equiv_bond_rearrs(possible_brs, mol, depth=6):
         "rearrangements with equivalent atoms"
     )
 
-    unique_brs = []
+    # Neighbour lists of each active atom are only calculated once, and
+    # rearrangements with the same (hashable) lists are equivalent
+    neighbour_lists = _neighbour_lists(
+        mol, idxs={idx for br in possible_brs for idx in br.active_atoms}
+    )
+    unique_brs, signatures = [], set()
 
     for br in possible_brs:
-        bond_rearrang_is_unique = True
-
-        # Compare bond_rearrang to all those already considered to be unique,
-        for unique_br in unique_brs:
-            if unique_br.get_active_atom_neighbour_lists(
-                species=mol, depth=depth
-            ) == br.get_active_atom_neighbour_lists(species=mol, depth=depth):
-                bond_rearrang_is_unique = False
+        signature = tuple(
+            neighbour_lists[idx][:depth] for idx in br.active_atoms
+        )
 
-        if bond_rearrang_is_unique:
+        if signature not in signatures:
+            signatures.add(signature)
             unique_brs.append(br)
 
     logger.info(
@@ -685,6 +898,45 @@ def strip_equiv_bond_rearrs(possible_brs, mol, depth=6):
     return unique_brs
 
 
+def _neighbour_lists(species, idxs):
+    """
+    Neighbour lists of a set of atoms, as atom labels in ascending distance
+    from each atom, including only the atoms in the same molecule if the
+    species is a complex
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        species (autode.species.Species | autode.species.Complex):
+
+        idxs (collection(int)): Atom indexes
+
+    Returns:
+        (dict(int, tuple(str))): Neighbour lists keyed by atom index
+    """
+    mol_idxs = {}
+
+    try:
+        for i in range(species.n_molecules):
+            idxs_i = set(species.atom_indexes(i))
+            mol_idxs.update({idx: idxs_i for idx in idxs_i})
+
+    except AttributeError:
+        pass
+
+    neighbour_lists = {}
+    for idx in idxs:
+        if idx not in mol_idxs:
+            logger.warning("Active atom index not found in any molecules")
+
+        neighbour_lists[idx] = tuple(
+            get_neighbour_list(
+                species, atom_i=idx, index_set=mol_idxs.get(idx, None)
+            )
+        )
+
+    return neighbour_lists
+
+
 def prune_small_ring_rearrs(possible_brs, mol):
     """
     Remove any bond rearrangements that go via small (3, 4) rings if there is
@@ -780,25 +1032,10 @@ class BondRearrangement:
             (list(list(str))):
         """
 
-        def nl(idx):
-            mol_idxs = None
-
-            try:
-                mol_idxs = next(
-                    species.atom_indexes(i)
-                    for i in range(species.n_molecules)
-                    if idx in species.atom_indexes(i)
-                )
-
-            except (StopIteration, AttributeError):
-                logger.warning("Active atom index not found in any molecules")
-
-            nl_labels = get_neighbour_list(
-                species, atom_i=idx, index_set=mol_idxs
-            )
-            return nl_labels[:depth]
-
-        return [nl(idx) for idx in self.active_atoms]
+        neighbour_lists = _neighbour_lists(species, idxs=self.active_atoms)
+        return [
+            list(neighbour_lists[idx][:depth]) for idx in self.active_atoms
+        ]
 
     def n_membered_rings(self, mol):
         """
@@ -1,4 +1,6 @@
-from typing import Union, Optional, TYPE_CHECKING
+import numpy as np
+from time import time
+from typing import Union, Optional, List, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 from autode.values import Distance, GradientRMS
@@ -26,6 +28,7 @@ class BaseBracketMethod(ABC):
         gtol: Union[GradientRMS, float] = GradientRMS(1.0e-3, "ha/ang"),
         cineb_at_conv: bool = False,
         barrier_check: bool = True,
+        share_hessian: bool = False,
     ):
         """
         Bracketing methods find transition state by using two images, one
@@ -48,6 +51,9 @@ class BaseBracketMethod(ABC):
             barrier_check: Whether to stop the calculation if one image is
                            detected to have jumped over the barrier. Do not
                            turn this off unless you are absolutely sure!
+            share_hessian: Whether to seed the Hessian of one image from the
+                           Hessian of the other, rotated into its frame and
+                           updated, rather than calculating both
         """
         # imgpair type must be set by subclass
         self.imgpair: Optional["EuclideanImagePair"] = None
@@ -59,6 +65,10 @@ class BaseBracketMethod(ABC):
 
         self._should_run_cineb = bool(cineb_at_conv)
         self._barrier_check = bool(barrier_check)
+        self._share_hessian = bool(share_hessian)
+
+        # Wall times (s) of each macro-iteration
+        self.step_times: List[float] = []
 
     @property
     def _name(self) -> str:
@@ -113,7 +123,8 @@ class BaseBracketMethod(ABC):
             f"{self._name} Macro-iteration #{self._macro_iter}: "
             f"Distance = {self.imgpair.dist:.4f}; Energy (initial species) = "
             f"{self.imgpair.left_coords.e:.6f}; Energy (final species) = "
-            f"{self.imgpair.right_coords.e:.6f}"
+            f"{self.imgpair.right_coords.e:.6f}; Step time = "
+            f"{self.step_times[-1] if self.step_times else 0.0:.2f} s"
         )
 
     @property
@@ -165,15 +176,18 @@ class BaseBracketMethod(ABC):
 
         n_cores = Config.n_cores if n_cores is None else int(n_cores)
         self.imgpair.set_method_and_n_cores(method, n_cores)
+        self.imgpair.share_hessian = self._share_hessian
         self.imgpair.initialise_trj(
-            f"{self._name}_left_history.zip", f"{self._name}_right_history.zip"
+            f"{self._name}_left_history.trj", f"{self._name}_right_history.trj"
         )
         self._initialise_run()
 
         logger.info(f"Starting {self._name} method to find transition state")
 
         while not self.converged:
+            start_time = time()
             self._step()
+            self.step_times.append(time() - start_time)
 
             if self.imgpair.has_jumped_over_barrier:
                 # TODO: implement image pair regeneration
@@ -208,6 +222,11 @@ class BaseBracketMethod(ABC):
             f"iterations (optimiser steps). {self._name} is "
             f"{'converged' if self.converged else 'not converged'}"
         )
+        if len(self.step_times) > 0:
+            logger.info(
+                f"{self._name} steps took {np.mean(self.step_times):.2f} s "
+                f"on average and {np.sum(self.step_times):.2f} s in total"
+            )
         self.imgpair.close_trj()
         self.print_geometries()
         self.plot_energies()
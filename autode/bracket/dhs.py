@@ -10,7 +10,7 @@ from typing import Tuple, Union, Optional, Any, TYPE_CHECKING
 from enum import Enum
 
 from autode.values import Distance, Angle, GradientRMS, PotentialEnergy
-from autode.bracket.imagepair import EuclideanImagePair
+from autode.bracket.imagepair import EuclideanImagePair, _rotated_onto
 from autode.opt.coordinates import CartesianCoordinates
 from autode.opt.optimisers.utils import TruncatedTaylor
 from autode.opt.optimisers.hessian_update import BFGSSR1Update
@@ -534,6 +534,10 @@ class DHS(BaseBracketMethod):
 
             cineb_at_conv: Whether to run CI-NEB calculation from the end
                            points after the DHS is converged
+
+            share_hessian: Whether to seed the Hessian of the image being
+                           optimised from that of the other image, instead
+                           of calculating a low-level Hessian
         """
         super().__init__(initial_species, final_species, **kwargs)
 
@@ -595,6 +599,13 @@ class DHS(BaseBracketMethod):
             pivot = self.imgpair.left_coords
 
         old_coords: Any = self.imgpair.get_coord_by_side(side)
+        if (
+            old_coords.h is None
+            and self._share_hessian
+            and pivot.h is not None
+        ):
+            # seed from the other image, rather than a low-level Hessian
+            old_coords = _rotated_onto(pivot, old_coords)
         old_coords = old_coords if old_coords.h is not None else None
         # take a DHS step on the side with lower energy
         new_coord = self._get_dhs_step(side)
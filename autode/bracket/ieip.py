@@ -15,7 +15,7 @@ from autode.path.interpolation import CubicPathSpline
 from autode.bracket.imagepair import EuclideanImagePair
 from autode.opt.coordinates import CartesianCoordinates
 from autode.values import Distance, GradientRMS, PotentialEnergy
-from autode.utils import ProcessPool
+from autode.utils import WorkerPool
 from autode.log import logger
 
 if TYPE_CHECKING:
@@ -74,7 +74,7 @@ def _parallel_calc_energies(
     n_cores_per_pp = max(n_cores // len(points), 1)
     n_procs = min(n_cores, len(points))
 
-    with ProcessPool(max_workers=n_procs) as pool:
+    with WorkerPool(max_workers=n_procs) as pool:
         jobs = [
             pool.submit(
                 _calculate_low_sp_energy_for_species,
@@ -5,7 +5,7 @@ that require a pair of images
 import itertools
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, TYPE_CHECKING, Union, Iterator
+from typing import Optional, Tuple, TYPE_CHECKING, Union, Iterator, Callable
 from enum import Enum
 
 from autode.values import Distance, PotentialEnergy, Gradient
@@ -17,7 +17,7 @@ from autode.opt.optimisers.hessian_update import BofillUpdate
 from autode.opt.optimisers.utils import Polynomial2PointFit
 from autode.opt.optimisers.base import OptimiserHistory, print_geometries_from
 from autode.plotting import plot_bracket_method_energy_profile
-from autode.utils import work_in_tmp_dir, ProcessPool
+from autode.utils import work_in_tmp_dir, WorkerPool
 from autode.log import logger
 
 if TYPE_CHECKING:
@@ -87,6 +87,40 @@ def _calculate_hessian_for_species(
     return species.hessian
 
 
+def _rotated_onto(
+    coords: CartesianCoordinates, other: CartesianCoordinates
+) -> CartesianCoordinates:
+    """
+    Copy of a set of coordinates, with their energy, gradient and Hessian,
+    translated and rotated to best overlap with another set of coordinates
+    of the same atoms
+
+    Args:
+        coords (CartesianCoordinates): Coordinates to rotate
+        other (CartesianCoordinates): Coordinates to rotate onto
+
+    Returns:
+        (CartesianCoordinates):
+    """
+    x = np.array(coords).reshape(-1, 3)
+    x_other = np.array(other).reshape(-1, 3)
+    centre, other_centre = np.average(x, axis=0), np.average(x_other, axis=0)
+    rot_mat = get_rot_mat_kabsch(x - centre, x_other - other_centre)
+
+    rotated = CartesianCoordinates((x - centre).dot(rot_mat.T) + other_centre)
+    rotated.e = coords.e
+
+    if coords.g is not None:
+        rotated.g = coords.g.reshape(-1, 3).dot(rot_mat.T).flatten()
+
+    if coords.h is not None:
+        # Rotation of every atom's block of 3 Cartesian components
+        block_rot_mat = np.kron(np.eye(len(x)), rot_mat)
+        rotated.h = block_rot_mat.dot(coords.h).dot(block_rot_mat.T)
+
+    return rotated
+
+
 class BaseImagePair(ABC):
     """
     Base class for a pair of images (e.g., reactant and product) of
@@ -122,6 +156,10 @@ class BaseImagePair(ABC):
         self._hess_method = None
         self._n_cores = None
         self._hessian_update_types = [BofillUpdate]
+        self._pool: Optional[WorkerPool] = None
+
+        # Seed the Hessian of one image from that of the other
+        self.share_hessian = False
 
         self._left_history = OptimiserHistory()
         self._right_history = OptimiserHistory()
@@ -212,11 +250,16 @@ class BaseImagePair(ABC):
     def close_trj(self):
         """
         Put all coordinates in memory onto disk in the trajectory
-        save files, and close the trajectories
+        save files, and close the trajectories. Also shuts down the
+        workers used for calculations on both images
         """
         self._left_history.close()
         self._right_history.close()
 
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
     def set_method_and_n_cores(
         self,
         method: "Method",
@@ -257,6 +300,7 @@ class BaseImagePair(ABC):
         self._hess_method = hess_method
 
         self._n_cores = int(n_cores)
+        self._pool = None
         return None
 
     @property
@@ -347,25 +391,51 @@ class BaseImagePair(ABC):
     def has_jumped_over_barrier(self) -> bool:
         """Whether one image has jumped over the barrier on the other side"""
 
+    def _run_on_both_images(self, func: Callable, method: "Method") -> Tuple:
+        """
+        Run a calculation function on both images. Methods without external
+        input/output are run in this process, one image after the other,
+        while others are run in parallel on a pool of two workers that is
+        kept for the lifetime of the calculation
+
+        Args:
+            func (Callable): Function with species, method and n_cores
+                             arguments
+            method (Method): Method to use
+
+        Returns:
+            (tuple): Results for the left and right images
+        """
+        assert self._n_cores is not None
+        images = [self._left_image, self._right_image]
+
+        if not getattr(method, "uses_external_io", True):
+            return tuple(
+                func(species=img, method=method, n_cores=self._n_cores)
+                for img in images
+            )
+
+        if self._pool is None:
+            self._pool = WorkerPool(max_workers=1 if self._n_cores < 2 else 2)
+
+        n_cores_per_pp = self._n_cores // 2 if self._n_cores > 1 else 1
+        jobs = [
+            self._pool.submit(
+                func, species=img, method=method, n_cores=n_cores_per_pp
+            )
+            for img in images
+        ]
+        return tuple(job.result() for job in jobs)
+
     def update_both_img_engrad(self):
         """
         Update the energy/gradient for both images, with parallel processing
         """
         assert self._method is not None
         assert self._n_cores is not None
-        n_cores_per_pp = self._n_cores // 2 if self._n_cores > 1 else 1
-        n_procs = 1 if self._n_cores < 2 else 2
-        with ProcessPool(max_workers=n_procs) as pool:
-            jobs = [
-                pool.submit(
-                    _calculate_engrad_for_species,
-                    species=img,
-                    method=self._method,
-                    n_cores=n_cores_per_pp,
-                )
-                for img in [self._left_image, self._right_image]
-            ]
-            left_engrad, right_engrad = [job.result() for job in jobs]
+        left_engrad, right_engrad = self._run_on_both_images(
+            _calculate_engrad_for_species, self._method
+        )
 
         self.left_coords.e = left_engrad[0]
         self.left_coords.update_g_from_cart_g(left_engrad[1])
@@ -375,29 +445,56 @@ class BaseImagePair(ABC):
 
     def update_both_img_hessian_by_calc(self):
         """
-        Update the molecular hessian of both images by calculation
+        Update the molecular hessian of both images by calculation. If
+        the Hessian is shared then it is only calculated for the left
+        image, and the right image is seeded from it
         """
         # TODO: refactor into ll_hessian code
         assert self._hess_method is not None
         assert self._n_cores is not None
-        n_cores_per_pp = self._n_cores // 2 if self._n_cores > 1 else 1
-        n_procs = 1 if self._n_cores < 2 else 2
-        with ProcessPool(max_workers=n_procs) as pool:
-            jobs = [
-                pool.submit(
-                    _calculate_hessian_for_species,
-                    species=img,
-                    method=self._hess_method,
-                    n_cores=n_cores_per_pp,
-                )
-                for img in [self._left_image, self._right_image]
-            ]
-            left_hess, right_hess = [job.result() for job in jobs]
+
+        if self.share_hessian:
+            left_hess = _calculate_hessian_for_species(
+                species=self._left_image,
+                method=self._hess_method,
+                n_cores=self._n_cores,
+            )
+            self.left_coords.update_h_from_cart_h(left_hess)
+            self.seed_hessian(self.left_coords, self.right_coords)
+            return None
+
+        left_hess, right_hess = self._run_on_both_images(
+            _calculate_hessian_for_species, self._hess_method
+        )
 
         self.left_coords.update_h_from_cart_h(left_hess)
         self.right_coords.update_h_from_cart_h(right_hess)
         return None
 
+    def seed_hessian(
+        self, source: CartesianCoordinates, target: CartesianCoordinates
+    ) -> None:
+        """
+        Set the Hessian of one image from the Hessian of the other image,
+        rotated into its frame and updated with the differences in the
+        coordinates and gradients between the two images
+
+        Args:
+            source (CartesianCoordinates): Coordinates with a gradient
+                                           and Hessian
+            target (CartesianCoordinates): Coordinates with a gradient
+        """
+        assert source.h is not None, "Must have a Hessian to share"
+        rotated = _rotated_onto(source, target)
+
+        if rotated.g is None or target.g is None:
+            target.update_h_from_cart_h(rotated.h)
+            return None
+
+        target.update_h_from_old_h(rotated, self._hessian_update_types)
+        logger.info("Seeded the Hessian from the other image")
+        return None
+
     def update_both_img_hessian_by_formula(self):
         """
         Update the molecular hessian for both images by update formula
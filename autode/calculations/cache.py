@@ -0,0 +1,325 @@
+"""
+Persistent, content-addressed cache of calculation results. Entries are keyed
+on a hash of the full calculation input (atoms, charge, multiplicity, solvent,
+method and keywords) so identical calculations performed in different
+directories, or in a re-run of a reaction, are only ever performed once.
+
+Each entry is a single .npz file stored under Config.calc_cache_dir. Entries
+are written atomically and the total size of the cache is bounded by
+Config.calc_cache_max_size, with the least recently used entries evicted first.
+"""
+
+import os
+import hashlib
+import tempfile
+import numpy as np
+import autode.wrappers.keywords as kws
+
+from typing import Optional, List, Tuple, TYPE_CHECKING
+
+from autode.log import logger
+from autode.config import Config
+from autode.values import PotentialEnergy, Gradient, Allocation
+from autode.hessians import Hessian
+from autode.opt.optimisers.base import ExternalOptimiser
+
+if TYPE_CHECKING:
+    from autode.calculations.executors import CalculationExecutor
+
+
+class CalculationCache:
+    def __init__(
+        self,
+        root: str,
+        max_size: Optional[Allocation] = None,
+    ):
+        """
+        On-disk least recently used (LRU) cache of calculation results
+
+        -----------------------------------------------------------------------
+        Arguments:
+            root: Directory in which the cache is stored. Created if it does
+                  not exist
+
+            max_size: Maximum total size of all the cached entries. If None
+                      then the cache is unbounded
+        """
+        self.root = os.path.abspath(str(root))
+        self.max_size = None if max_size is None else Allocation(max_size)
+
+        os.makedirs(self.root, exist_ok=True)
+
+    @classmethod
+    def from_config(cls) -> Optional["CalculationCache"]:
+        """
+        Create a cache from the current configuration, if one is set
+
+        -----------------------------------------------------------------------
+        Returns:
+            (autode.calculations.cache.CalculationCache | None):
+        """
+        if Config.calc_cache_dir is None:
+            return None
+
+        return cls(Config.calc_cache_dir, max_size=Config.calc_cache_max_size)
+
+    @staticmethod
+    def key_for(calc: "CalculationExecutor") -> str:
+        """
+        Canonical hash of the input of a calculation. Coordinates are rounded
+        to 1E-6 Å, so numerically identical geometries hash identically
+
+        -----------------------------------------------------------------------
+        Arguments:
+            calc: Calculation executor
+
+        Returns:
+            (str): Hex digest
+        """
+        mol, method = calc.molecule, calc.method
+        coords = np.round(np.asarray(mol.coordinates, dtype=float), 6) + 0.0
+
+        keywords = calc.input.keywords
+        kwds_str = "|".join(
+            (
+                str(getattr(kwd, method.name, None) or kwd)
+                if isinstance(kwd, kws.Keyword)
+                else str(kwd)
+            )
+            for kwd in keywords
+        )
+
+        items = [
+            method.name,
+            str(method.implicit_solvation_type),
+            f"{keywords.__class__.__name__}:{kwds_str}",
+            f"{mol.charge}:{mol.mult}",
+            " ".join(atom.label for atom in mol.atoms),
+            " ".join(f"{x:.6f}" for x in coords.flatten()),
+            f"{mol.solvent}:{mol.is_explicitly_solvated}",
+            str(mol.constraints),
+            str(calc.input.added_internals),
+            str(calc.input.point_charges),
+        ]
+
+        return hashlib.sha256("\n".join(items).encode()).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """Path to the file of an entry in this cache"""
+        return os.path.join(self.root, key[:2], f"{key}.npz")
+
+    def __contains__(self, calc: "CalculationExecutor") -> bool:
+        return os.path.exists(self.path_for(self.key_for(calc)))
+
+    def load_into(self, calc: "CalculationExecutor") -> bool:
+        """
+        Set the properties of the molecule in a calculation from the cache,
+        if an entry with all the properties required by the calculation
+        exists
+
+        -----------------------------------------------------------------------
+        Arguments:
+            calc: Calculation executor
+
+        Returns:
+            (bool): If the properties were set
+        """
+        filepath = self.path_for(self.key_for(calc))
+
+        try:
+            data = dict(np.load(filepath, allow_pickle=False))
+        except (OSError, ValueError, EOFError):
+            return False
+
+        keywords = calc.input.keywords
+        if (
+            isinstance(keywords, kws.GradientKeywords)
+            and "gradient" not in data
+        ) or (
+            isinstance(keywords, kws.HessianKeywords) and "hessian" not in data
+        ):
+            logger.info("Cached entry did not have the required properties")
+            return False
+
+        if isinstance(keywords, kws.OptKeywords):
+            if "converged" not in data:
+                logger.info("Cached entry did not have the convergence")
+                return False
+
+            calc.optimiser = CachedOptimiser(
+                converged=bool(data["converged"]),
+                last_energy_change=float(data["last_energy_change"]),
+            )
+
+        mol = calc.molecule
+        mol.coordinates = data["coordinates"]
+        mol.energy = PotentialEnergy(
+            float(data["energy"]), method=calc.method, keywords=keywords
+        )
+
+        if "gradient" in data:
+            mol.gradient = Gradient(data["gradient"], units="Ha Å^-1")
+
+        if "hessian" in data:
+            mol.hessian = Hessian(
+                data["hessian"],
+                atoms=mol.atoms,
+                functional=keywords.functional,
+                units="Ha Å^-2",
+            )
+
+        if "partial_charges" in data:
+            mol.partial_charges = data["partial_charges"].tolist()
+
+        os.utime(filepath)  # Mark as recently used
+        logger.info(f"Loaded calculation results from {filepath}")
+        return True
+
+    def store(
+        self, calc: "CalculationExecutor", key: Optional[str] = None
+    ) -> None:
+        """
+        Store the properties of the molecule in a calculation, which must have
+        been run. Any properties that are not set are not stored. For an
+        optimisation the convergence of the optimiser is also stored
+
+        -----------------------------------------------------------------------
+        Arguments:
+            calc: Calculation executor
+
+            key: Key of the calculation, computed before it was run. Required
+                 if running the calculation changes its input e.g. the
+                 coordinates in an optimisation. If None then it is computed
+                 from the calculation
+        """
+        mol = calc.molecule
+
+        if mol.energy is None:
+            logger.warning("Cannot cache a calculation without an energy")
+            return None
+
+        data = {
+            "energy": np.array(float(mol.energy.to("Ha"))),
+            "coordinates": np.array(mol.coordinates.to("Å"), dtype=float),
+        }
+        if mol.gradient is not None:
+            data["gradient"] = np.array(mol.gradient.to("Ha Å^-1"))
+
+        if mol.hessian is not None:
+            data["hessian"] = np.array(mol.hessian.to("Ha Å^-2"))
+
+        charges = mol.partial_charges
+        if all(q is not None for q in charges):
+            data["partial_charges"] = np.array(charges, dtype=float)
+
+        if isinstance(calc.input.keywords, kws.OptKeywords):
+            data["converged"] = np.array(calc.optimiser.converged)
+            data["last_energy_change"] = np.array(
+                float(calc.optimiser.last_energy_change.to("Ha"))
+            )
+
+        if key is None:
+            key = self.key_for(calc)
+
+        filepath = self.path_for(key)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        # Write to a temporary file then rename, so concurrent readers never
+        # see a partially written entry
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(filepath), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.savez(file, **data)
+            os.replace(tmp_path, filepath)
+
+        except OSError:
+            logger.warning(f"Failed to write cache entry {filepath}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+        self.evict()
+        return None
+
+    @property
+    def entries(self) -> List[Tuple[str, os.stat_result]]:
+        """List of all the (filepath, stat) entries in this cache"""
+        entries = []
+
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if not filename.endswith(".npz"):
+                    continue
+
+                filepath = os.path.join(dirpath, filename)
+                try:
+                    entries.append((filepath, os.stat(filepath)))
+                except FileNotFoundError:  # Removed by another process
+                    continue
+
+        return entries
+
+    @property
+    def size(self) -> Allocation:
+        """Total size of all the entries in the cache"""
+        n_bytes = sum(stat.st_size for _, stat in self.entries)
+        return Allocation(max(n_bytes, 1), units="bytes")
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until under the max size"""
+        if self.max_size is None:
+            return None
+
+        max_n_bytes = float(self.max_size.to("bytes"))
+        entries = sorted(self.entries, key=lambda e: e[1].st_mtime)
+        n_bytes = sum(stat.st_size for _, stat in entries)
+
+        for filepath, stat in entries:
+            if n_bytes <= max_n_bytes:
+                break
+
+            logger.info(f"Evicting {filepath} from the calculation cache")
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                pass
+
+            n_bytes -= stat.st_size
+
+        return None
+
+    def clear(self) -> None:
+        """Remove all the entries in this cache"""
+        for filepath, _ in self.entries:
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                pass
+
+        return None
+
+
+class CachedOptimiser(ExternalOptimiser):
+    def __init__(self, converged: bool, last_energy_change: float):
+        """
+        Optimiser of a cached optimisation, with the convergence of the
+        optimiser that was run
+
+        -----------------------------------------------------------------------
+        Arguments:
+            converged: Whether the optimisation converged
+
+            last_energy_change: Final energy change (Ha)
+        """
+        self._converged = converged
+        self._last_energy_change = last_energy_change
+
+    @property
+    def converged(self) -> bool:
+        return self._converged
+
+    @property
+    def last_energy_change(self) -> PotentialEnergy:
+        return PotentialEnergy(self._last_energy_change, units="Ha")
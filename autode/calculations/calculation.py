@@ -7,6 +7,7 @@ from typing import Optional, List, TYPE_CHECKING
 from autode.point_charges import PointCharge
 from autode.log import logger
 from autode.calculations.types import CalculationType
+from autode.calculations.cache import CalculationCache
 from autode.calculations.executors import (
     CalculationExecutor,
     CalculationExecutorO,
@@ -74,6 +75,7 @@ class Calculation:
         self.n_cores = int(n_cores)
         self.point_charges = point_charges
         self._executor = self._executor_for(molecule, method, keywords)
+        self._from_cache = False
 
         self._check()
 
@@ -116,15 +118,45 @@ class Calculation:
         )
 
     def run(self) -> None:
-        """Run the calculation using the EST method"""
+        """
+        Run the calculation using the EST method. If Config.calc_cache_dir is
+        set and an identical calculation has been run before then the
+        properties are set from the cache and nothing is executed
+        """
         logger.info(f"Running calculation: {self.name}")
 
+        cache = self._cache
+
+        # The key is of the input, as an optimisation changes the coordinates
+        key = None if cache is None else cache.key_for(self._executor)
+
+        if cache is not None and cache.load_into(self._executor):
+            logger.info(f"Set the properties of {self.name} from the cache")
+            self._from_cache = True
+            self._add_to_comp_methods()
+            return None
+
         self._executor.run()
         self._check_properties_exist()
-        self._add_to_comp_methods()
 
+        if cache is not None:
+            cache.store(self._executor, key=key)
+
+        self._add_to_comp_methods()
         return None
 
+    @property
+    def _cache(self) -> Optional[CalculationCache]:
+        """
+        Cache of results for this calculation. Only calculations that are
+        executed directly by the method are cached, as indirect calculations
+        (e.g. autodE driven optimisations) are composed of cached ones
+        """
+        if type(self._executor) is not CalculationExecutor:
+            return None
+
+        return CalculationCache.from_config()
+
     def clean_up(self, force: bool = False, everything: bool = False) -> None:
         """
         Clean up input and output files, if Config.keep_input_files is False
@@ -159,6 +191,9 @@ class Calculation:
         Returns:
             (bool): Normal termination of the calculation?
         """
+        if self._from_cache:
+            return True
+
         return self._executor.terminated_normally
 
     @property
@@ -353,6 +353,13 @@ class CalculationExecutorO(_IndirectCalculationExecutor):
         """Run an optimisation with using default autodE optimisers"""
         from autode.opt.optimisers.crfo import CRFOptimiser
         from autode.opt.optimisers.prfo import PRFOptimiser
+        from autode.opt.optimisers.trajectory import convert_zip_trajectory
+
+        if os.path.exists(self._legacy_opt_trajectory_name):
+            convert_zip_trajectory(
+                self._legacy_opt_trajectory_name, self._opt_trajectory_name
+            )
+            os.remove(self._legacy_opt_trajectory_name)
 
         if self._opt_trajectory_exists:
             self.optimiser = CRFOptimiser.from_file(self._opt_trajectory_name)
@@ -375,11 +382,7 @@ class CalculationExecutorO(_IndirectCalculationExecutor):
             n_cores=self.n_cores,
             name=self._opt_trajectory_name,
         )
-        self.optimiser.print_geometries(
-            self._opt_trajectory_name[:-4]
-            if self._opt_trajectory_name.endswith(".zip")
-            else self._opt_trajectory_name
-        )
+        self.optimiser.print_geometries(f"{self.name}_opt_trj")
 
         if self.molecule.n_atoms == 1:
             return self._run_single_energy_evaluation()
@@ -448,6 +451,11 @@ class CalculationExecutorO(_IndirectCalculationExecutor):
 
     @property
     def _opt_trajectory_name(self) -> str:
+        return f"{self.name}_opt.trj"
+
+    @property
+    def _legacy_opt_trajectory_name(self) -> str:
+        """Trajectory saved by previous versions, in the zip format"""
         return f"{self.name}_opt_trj.zip"
 
     @property
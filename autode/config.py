@@ -1,6 +1,6 @@
 import os
 from typing import Any
-from autode.values import Frequency, Distance, Allocation
+from autode.values import Frequency, Distance, Allocation, GradientRMS
 from autode.wrappers.keywords import implicit_solvent_types as solv
 from autode.wrappers.keywords import KeywordsSet, MaxOptCycles
 from autode.wrappers.keywords.basis_sets import (
@@ -61,6 +61,17 @@ class _ConfigClass:
     #
     ll_tmp_dir = None
     # -------------------------------------------------------------------------
+    # Directory of a persistent cache of calculation results (energy, gradient,
+    # Hessian, final coordinates and partial charges) keyed on a hash of the
+    # calculation input, shared across runs and working directories. If None
+    # then no results are cached. For example, '~/.autode_cache'
+    #
+    calc_cache_dir = None
+    #
+    # Maximum total size of the calculation cache on disk. Once exceeded the
+    # least recently used entries are removed
+    calc_cache_max_size = Allocation(10, units="GB")
+    # -------------------------------------------------------------------------
     # By default templates are saved to /path/to/autode/transition_states/lib/
     # unless ts_template_folder_path is set
     #
@@ -126,6 +137,23 @@ class _ConfigClass:
     # sampling around the saddle point
     #
     adaptive_neb_k = True
+    #
+    # Images in a NEB with an RMS force below this value are frozen: their
+    # coordinates are held fixed and their energy and gradient are not
+    # re-evaluated until the force (recomputed as neighbouring images move)
+    # rises above it. If None then no images are frozen. For example,
+    # GradientRMS(1e-3, units="Ha Å^-1")
+    neb_freeze_tol = None
+    #
+    # Optimiser for the band of images in a NEB, one of: {"lbfgs", "fire"}.
+    # No atom in an image moves further than neb_max_step in a single step
+    neb_optimiser = "lbfgs"
+    neb_max_step = Distance(0.2, units="Å")
+    #
+    # Pairs of atoms further apart than this distance in all the images of a
+    # NEB are excluded from the IDPP relaxation of the initial band, which is
+    # much faster for large systems. If None then all pairs are included
+    idpp_cutoff = None
     # -------------------------------------------------------------------------
     # Minimum and maximum step size to use for the adaptive path search
     #
@@ -141,6 +169,23 @@ class _ConfigClass:
     #
     skip_small_ring_tss = True
     # -------------------------------------------------------------------------
+    # Number of cores used to locate the TS of each bond rearrangement. If
+    # set, and fewer than n_cores, then the TSs of n_cores // this value
+    # bond rearrangements are located concurrently, each in its own
+    # directory. If None then bond rearrangements are considered one after
+    # the other, each using all the cores
+    #
+    ts_n_cores_per_rearrangement = None
+    # -------------------------------------------------------------------------
+    # Race the methods of generating a TS guess for a bond rearrangement
+    # (template, low- and high-level adaptive paths and NEB) concurrently,
+    # with the cores split between them, rather than trying them cheapest
+    # first. Once one finds a true TS the others are terminated, along with
+    # any external processes they started. Uses more CPU time for a lower
+    # wall time. Only available on Linux and macOS
+    #
+    race_ts_guesses = False
+    # -------------------------------------------------------------------------
     # Minimum magnitude of the imaginary frequency (cm-1) to consider for a
     # 'true' TS. For very shallow saddle points this may need to be reduced
     # to e.g. -10 cm-1. Although most TSs have |v_imag| > 100 cm-1 this
@@ -469,6 +514,11 @@ class _ConfigClass:
             sp=["sp"],
         )
         implicit_solvation_type = None
+        # Run calculations in a long-lived provider daemon, one per autodE
+        # process, so the model is loaded once rather than once per
+        # calculation. If False then a fresh provider subprocess is started
+        # for every calculation
+        persistent = True
 
     class TeraChem:
         # ---------------------------------------------------------------------
@@ -531,6 +581,12 @@ class _ConfigClass:
         if key == "max_core":
             value = Allocation(value).to("MB")
 
+        if key == "calc_cache_dir" and value is not None:
+            value = os.path.abspath(os.path.expanduser(str(value)))
+
+        if key == "calc_cache_max_size" and value is not None:
+            value = Allocation(value).to("MB")
+
         if key == "freq_scale_factor":
             if value is not None:
                 if not (0.0 < value <= 1.0):
@@ -541,12 +597,42 @@ class _ConfigClass:
 
                 value = float(value)
 
-        if key in ("max_atom_displacement", "min_step_size", "max_step_size"):
+        if key in (
+            "max_atom_displacement",
+            "min_step_size",
+            "max_step_size",
+            "neb_max_step",
+        ):
             if float(value) < 0:
                 raise ValueError(f"Distances cannot be negative. Had: {value}")
 
             value = Distance(value).to("ang")
 
+        if key == "ts_n_cores_per_rearrangement" and value is not None:
+            if int(value) < 1:
+                raise ValueError(
+                    f"Must have at least one core per rearrangement. "
+                    f"Had: {value}"
+                )
+
+            value = int(value)
+
+        if key == "neb_freeze_tol" and value is not None:
+            value = GradientRMS(value).to("Ha Å^-1")
+
+        if key == "idpp_cutoff" and value is not None:
+            if float(value) <= 0:
+                raise ValueError(f"IDPP cutoff must be positive. Had: {value}")
+
+            value = Distance(value).to("ang")
+
+        if key == "neb_optimiser":
+            value = str(value).lower()
+            if value not in ("lbfgs", "fire"):
+                raise ValueError(
+                    f"Unknown NEB optimiser: {value}. Must be lbfgs or fire"
+                )
+
         return super().__setattr__(key, value)
 
 
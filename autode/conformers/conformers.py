@@ -1,15 +1,17 @@
 import numpy as np
 
-from typing import Optional, Union, TYPE_CHECKING
+from time import time
+from concurrent.futures import wait, FIRST_COMPLETED
+from typing import Optional, Union, Dict, List, TYPE_CHECKING
 from rdkit import Chem
 
 from autode.values import Distance, Energy
 from autode.atoms import Atom, Atoms
 from autode.config import Config
 from autode.mol_graphs import make_graph, is_isomorphic
-from autode.geom import calc_heavy_atom_rmsd
+from autode.geom import calc_heavy_atom_rmsd, pairs_within_rmsd
 from autode.log import logger
-from autode.utils import ProcessPool
+from autode.utils import WorkerPool
 from autode.exceptions import NoConformers, CouldNotGetProperty
 
 
@@ -33,7 +35,24 @@ def _calc_conformer(conformer, calc_type, method, keywords, n_cores=1):
     return conformer
 
 
+def _timed_calc_conformer(conformer, calc_type, method, keywords, n_cores=1):
+    """Run a calculation on a conformer and return it with the wall time"""
+    start_time = time()
+    conformer = _calc_conformer(
+        conformer, calc_type, method, keywords, n_cores
+    )
+
+    return conformer, time() - start_time
+
+
 class Conformers(list):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+        # Wall time (s) of the last calculation performed on each conformer,
+        # keyed by conformer name. Used to order subsequent calculations
+        self.wall_times: Dict[str, float] = {}
+
     @property
     def lowest_energy(self) -> Optional["Conformer"]:
         """
@@ -195,26 +214,77 @@ class Conformers(list):
             f"to any other (heavy atoms only, with no symmetry)"
         )
 
+        close_to = self._close_on_heavy_atom_rmsd(rmsd_tol)
+        is_removed = [False for _ in self]
+
         # Only enumerate up to but not including the final index, as at
         # least one of the conformers must be unique in geometry
         for idx in reversed(range(len(self) - 1)):
-            conf = self[idx]
-
-            if any(
-                calc_heavy_atom_rmsd(conf.atoms, other.atoms) < rmsd_tol
-                for o_idx, other in enumerate(self)
-                if o_idx != idx
-            ):
+            if any(not is_removed[o_idx] for o_idx in close_to[idx]):
                 logger.info(
                     f"Conformer {idx} was close in geometry to at "
                     f"least one other - removing"
                 )
+                is_removed[idx] = True
 
+        for idx in reversed(range(len(self))):
+            if is_removed[idx]:
                 del self[idx]
 
         logger.info(f"Pruned to {len(self)} unique conformer(s) on RMSD")
         return None
 
+    def _close_on_heavy_atom_rmsd(self, rmsd_tol: Distance) -> List[set]:
+        """
+        Indexes of the other conformers within an RMSD tolerance of each
+        conformer, considering only the heavy atoms. All the pairs are
+        aligned in batches if the conformers have the same heavy atoms
+
+        -----------------------------------------------------------------------
+        Arguments:
+            rmsd_tol: Tolerance
+
+        Returns:
+            (list(set(int))):
+        """
+        close_to: List[set] = [set() for _ in self]
+
+        n_atoms = {conf.n_atoms for conf in self}
+        if len(n_atoms) > 1:
+            raise ValueError(
+                "RMSD must be computed between conformers with the same "
+                f"number of atoms. Had: {n_atoms}"
+            )
+
+        is_heavy = [
+            np.array([atom.label != "H" for atom in conf.atoms])
+            for conf in self
+        ]
+
+        if all(np.array_equal(is_heavy[0], mask) for mask in is_heavy):
+            if not np.any(is_heavy[0]):
+                logger.warning("No heavy atoms! assuming a zero RMSD")
+
+            coords = np.array(
+                [conf.atoms.coordinates[is_heavy[0]] for conf in self]
+            ).reshape((len(self), -1, 3))
+            pairs = pairs_within_rmsd(coords, float(rmsd_tol.to("Å")))
+
+        else:
+            pairs = [
+                (i, j)
+                for i in range(len(self))
+                for j in range(i + 1, len(self))
+                if calc_heavy_atom_rmsd(self[i].atoms, self[j].atoms)
+                < rmsd_tol
+            ]
+
+        for i, j in pairs:
+            close_to[i].add(int(j))
+            close_to[j].add(int(i))
+
+        return close_to
+
     def prune_diff_graph(self, graph: "MolecularGraph") -> None:
         """
         Remove conformers with a different molecular graph to a defined
@@ -260,7 +330,11 @@ class Conformers(list):
         """
         Run a set of calculations (single point energy evaluations or geometry
         optimisations) in parallel over every conformer in this set. Will
-        attempt to use all autode.Config.n_cores as fully as possible
+        attempt to use all autode.Config.n_cores as fully as possible by
+        dispatching the most expensive calculations first and handing out
+        cores on demand, such that cores freed by completed calculations are
+        given to those yet to be started. The wall time of each calculation
+        is stored in self.wall_times
 
         Arguments:
             calc_type (str):
@@ -269,39 +343,88 @@ class Conformers(list):
 
             keywords (autode.wrappers.keywords.Keywords):
         """
-        # TODO: Test efficiency + improve with dynamic load balancing
         if len(self) == 0:
             logger.error(f"Cannot run {calc_type} over 0 conformers")
             return None
 
-        n_cores_pp = max(Config.n_cores // len(self), 1)
+        # Methods that implement batches (e.g. MLIP) evaluate all the energies
+        # in a single call
+        if calc_type == "single_point" and getattr(
+            method, "implements_batch", False
+        ):
+            start_time = time()
+            method.batch_energy_gradient(self, n_cores=Config.n_cores)
+
+            for conf in self:
+                self._set_wall_time(conf, (time() - start_time) / len(self))
+            return None
 
         # In-memory methods (e.g. GPU4PySCF) hold a CUDA context that cannot
         # survive process forking, so run them serially in this process rather
-        # than dispatching to a ProcessPool.
+        # than dispatching to a WorkerPool.
         if not getattr(method, "uses_external_io", True):
+            n_cores = max(Config.n_cores // len(self), 1)
             for idx, conf in enumerate(self):
-                self[idx] = _calc_conformer(
-                    conf, calc_type, method, keywords, n_cores=n_cores_pp
+                self[idx], wall_time = _timed_calc_conformer(
+                    conf, calc_type, method, keywords, n_cores=n_cores
                 )
+                self._set_wall_time(self[idx], wall_time)
             return None
 
-        with ProcessPool(max_workers=Config.n_cores // n_cores_pp) as pool:
-            jobs = [
-                pool.submit(
-                    _calc_conformer,
-                    conf,
-                    calc_type,
-                    method,
-                    keywords,
-                    n_cores=n_cores_pp,
-                )
-                for conf in self
-            ]
+        # Longest expected first, so short calculations fill in at the end
+        pending = sorted(
+            range(len(self)), key=self._expected_cost, reverse=True
+        )
+        n_free_cores = Config.n_cores
+        running = {}
+
+        with WorkerPool(max_workers=min(Config.n_cores, len(self))) as pool:
+            while len(pending) > 0 or len(running) > 0:
+                while len(pending) > 0 and n_free_cores > 0:
+                    # Round up, so the longest calculations get more cores
+                    n_cores = -(-n_free_cores // len(pending))
+                    idx = pending.pop(0)
+
+                    job = pool.submit(
+                        _timed_calc_conformer,
+                        self[idx],
+                        calc_type,
+                        method,
+                        keywords,
+                        n_cores=n_cores,
+                    )
+                    running[job] = (idx, n_cores)
+                    n_free_cores -= n_cores
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for job in finished:
+                    idx, n_cores = running.pop(job)
+                    self[idx], wall_time = job.result()
+                    self._set_wall_time(self[idx], wall_time, n_cores)
+                    n_free_cores += n_cores
 
-            for idx, res in enumerate(jobs):
-                self[idx] = res.result()
+        return None
 
+    def _expected_cost(self, idx: int) -> float:
+        """
+        Expected relative cost of a calculation on a conformer, from a
+        previous wall time if it exists, otherwise from the number of atoms
+        """
+        conf = self[idx]
+
+        if conf.name in self.wall_times:
+            return self.wall_times[conf.name]
+
+        # Previous timings are in seconds, so scale far above any time
+        return 1e10 * conf.n_atoms
+
+    def _set_wall_time(self, conf, wall_time: float, n_cores: int = 1):
+        logger.info(
+            f"Calculation on {conf.name} took {wall_time:.2f} s using "
+            f"{n_cores} core(s)"
+        )
+        self.wall_times[conf.name] = wall_time
         return None
 
     def optimise(
@@ -337,7 +460,9 @@ class Conformers(list):
         return self._parallel_calc("single_point", method, keywords)
 
     def copy(self) -> "Conformers":
-        return Conformers([conformer.copy() for conformer in self])
+        conformers = Conformers([conformer.copy() for conformer in self])
+        conformers.wall_times = self.wall_times.copy()
+        return conformers
 
 
 def atoms_from_rdkit_mol(rdkit_mol_obj: Chem.Mol, conf_id: int = 0) -> Atoms:
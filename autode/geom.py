@@ -231,6 +231,101 @@ def calc_rmsd(coords1: np.ndarray, coords2: np.ndarray) -> float:
     return np.sqrt(np.average(np.square(fitted_coords - q_mat)))
 
 
+def calc_rmsds(coords1: np.ndarray, coords2: np.ndarray) -> np.ndarray:
+    """
+    Calculate the RMSDs between a batch of pairs of coordinates using the
+    Kabsch algorithm, without forming the rotation matrices. As in calc_rmsd
+    the mean is over all 3n components, so the minimum mean squared deviation
+    is (|P|^2 + |Q|^2 - 2 Σσ)/3n, where σ are the singular values of P^T Q
+    with the smallest negated if the optimal transformation would be a
+    reflection
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        coords1 (np.ndarray): shape = (m, n, 3)
+
+        coords2 (np.ndarray): shape = (m, n, 3)
+
+    Returns:
+        (np.ndarray): Root mean squared distances. shape = (m,)
+    """
+    assert coords1.shape == coords2.shape and coords1.ndim == 3
+
+    p_mats = coords2 - np.average(coords2, axis=1)[:, np.newaxis, :]
+    q_mats = coords1 - np.average(coords1, axis=1)[:, np.newaxis, :]
+
+    h = np.einsum("mki,mkj->mij", p_mats, q_mats)
+    sigma = np.linalg.svd(h, compute_uv=False)
+    sigma[:, 2] *= np.sign(np.linalg.det(h))
+
+    msd = (
+        np.sum(np.square(p_mats), axis=(1, 2))
+        + np.sum(np.square(q_mats), axis=(1, 2))
+        - 2.0 * np.sum(sigma, axis=1)
+    ) / (3 * coords1.shape[1])
+
+    return np.sqrt(np.clip(msd, a_min=0.0, a_max=None))
+
+
+def pairs_within_rmsd(
+    coords: np.ndarray,
+    rmsd_tol: float,
+    max_batch_size: int = 1_000_000,
+) -> np.ndarray:
+    """
+    Find all pairs of structures with a Kabsch RMSD below a tolerance. As
+    rotation preserves the distance of each atom to the centroid, the RMSD
+    is bounded from below by the RMS difference in these distances, so pairs
+    with a lower bound above the tolerance are skipped without an alignment
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        coords (np.ndarray): Coordinates of each structure. shape = (m, n, 3)
+
+        rmsd_tol (float): Tolerance, in the same units as the coordinates
+
+        max_batch_size (int): Maximum number of floats held in each batch of
+                              coordinates
+
+    Returns:
+        (np.ndarray): Pairs (i, j) with i < j. shape = (k, 2)
+    """
+    m, n = coords.shape[0], coords.shape[1]
+    if m < 2:
+        return np.zeros(shape=(0, 2), dtype=int)
+
+    if n == 0:  # No coordinates, so all structures are identical
+        return np.array(np.triu_indices(m, k=1)).T
+
+    coords = coords - np.average(coords, axis=1)[:, np.newaxis, :]
+    r = np.linalg.norm(coords, axis=2)  # (m, n)
+    r_sq = np.sum(np.square(r), axis=1)
+
+    batch_size = max(1, max_batch_size // (3 * n))
+    max_lb_sq = rmsd_tol**2 + 1e-8  # Allow for rounding in the bound
+    pairs = []
+
+    for start in range(0, m, max(1, max_batch_size // m)):
+        rows = np.arange(start, min(start + max(1, max_batch_size // m), m))
+        lb_sq = r_sq[rows, None] + r_sq[None, :] - 2.0 * r[rows] @ r.T
+        lb_sq /= 3 * n
+
+        i, j = np.nonzero(lb_sq < max_lb_sq)
+        i = rows[i]
+        upper = j > i
+        candidates = np.stack((i[upper], j[upper]), axis=1)
+
+        for k in range(0, len(candidates), batch_size):
+            batch = candidates[k : k + batch_size]
+            rmsds = calc_rmsds(coords[batch[:, 0]], coords[batch[:, 1]])
+            pairs.append(batch[rmsds < rmsd_tol])
+
+    if len(pairs) == 0:
+        return np.zeros(shape=(0, 2), dtype=int)
+
+    return np.concatenate(pairs, axis=0)
+
+
 def get_points_on_sphere(n_points: int, r: float = 1) -> List[np.ndarray]:
     """
     Find n evenly spaced points on a sphere using the "How to generate
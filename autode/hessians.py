@@ -2,9 +2,13 @@
 Hessian diagonalisation and projection routines. See autode/common/hessians.pdf
 for mathematical background
 """
+import os
+import hashlib
+import tempfile
 import numpy as np
 import multiprocessing as mp
 
+from concurrent.futures import as_completed
 from functools import cached_property
 from typing import (
     List,
@@ -20,7 +24,7 @@ from autode.log import logger
 from autode.config import Config
 from autode.constants import Constants
 from autode.values import ValueArray, Frequency, Coordinates, Distance
-from autode.utils import work_in, hashable, ProcessPool
+from autode.utils import work_in, hashable, WorkerPool
 from autode.units import (
     Unit,
     wavenumber,
@@ -424,7 +428,34 @@ class NumericalHessianCalculator:
         do_c_diff: bool,
         shift: Distance,
         n_cores: Optional[int] = None,
+        rows: Optional[Sequence[int]] = None,
     ):
+        """
+        Calculator for a Hessian by finite differences of gradients. Each row
+        is written to a checkpoint file in the numerical_hessian directory
+        once calculated, so a calculation that is restarted only evaluates
+        the rows that are missing. Checkpoints are keyed on the geometry,
+        method, keywords and shift, so rows calculated elsewhere (e.g. with
+        a subset of rows on different nodes) are merged by copying their
+        files into the same directory.
+
+        -----------------------------------------------------------------------
+        Arguments:
+            species: Species to evaluate the Hessian for
+
+            method: Method used to calculate the gradients
+
+            keywords: Gradient keywords
+
+            do_c_diff: Use central, rather than one-sided, differences
+
+            shift: Numerical shift used in the finite differences
+
+            n_cores: Number of cores to use, defaults to Config.n_cores
+
+            rows: Indexes of the rows to calculate. If None then calculate
+                  all rows not already present in a checkpoint
+        """
         self._species = species
         self._method = method
         self._keywords = self._validated(keywords)
@@ -439,6 +470,16 @@ class NumericalHessianCalculator:
         )
 
         self._calculated_rows: List[int] = []
+        if rows is not None:
+            if not set(rows).issubset(set(range(self._n_rows))):
+                raise ValueError(
+                    "Cannot calculate a numerical Hessian with rows that are "
+                    "not present in the Hessian"
+                )
+
+            self._calculated_rows = [
+                idx for idx in range(self._n_rows) if idx not in set(rows)
+            ]
 
         self._n_total_cores = Config.n_cores if n_cores is None else n_cores
 
@@ -453,6 +494,16 @@ class NumericalHessianCalculator:
             f"Doing: {self._n_rows * (2 if self._do_c_diff else 1)} "
             f"gradient evaluations"
         )
+        self._load_checkpointed_rows()
+
+        if all(idx in self._calculated_rows for idx in range(self._n_rows)):
+            logger.info("All Hessian rows were present in checkpoints")
+            return None
+
+        # Methods that implement batches (e.g. MLIP) evaluate every displaced
+        # gradient in a single call
+        if getattr(self._method, "implements_batch", False):
+            return self._calculate_in_batch()
 
         if not self._do_c_diff:
             logger.info("Calculating gradient at current point")
@@ -466,32 +517,137 @@ class NumericalHessianCalculator:
             return self._calculate_in_serial()
 
         # Although n_rows may be < n_cores there will not be > n_rows processes
-        with ProcessPool(max_workers=self._n_total_cores) as pool:
+        with WorkerPool(max_workers=self._n_total_cores) as pool:
             func_name = "_cdiff_row" if self._do_c_diff else "_diff_row"
 
-            jobs = [
-                pool.submit(hashable(func_name, self), i, k)
+            jobs = {
+                pool.submit(hashable(func_name, self), i, k): 3 * i + k
                 for (i, k) in self._idxs_to_calculate()
-            ]
+            }
 
-            for row_idx, row in enumerate(jobs):
-                self._hessian[row_idx, :] = row.result()
+            # Checkpoint rows as they complete, so a failure in one row does
+            # not lose any others
+            for job in as_completed(jobs):
+                self._set_row(jobs[job], job.result())
 
         return None
 
     def _calculate_in_serial(self) -> None:
         """Calculate the Hessian rows in serial"""
 
-        for row_idx, (i, k) in enumerate(self._idxs_to_calculate()):
+        for i, k in self._idxs_to_calculate():
             row = (
                 self._cdiff_row(i, k)
                 if self._do_c_diff
                 else self._diff_row(i, k)
             )
+            self._set_row(3 * i + k, row)
+
+        return None
+
+    def _calculate_in_batch(self) -> None:
+        """Calculate all the Hessian rows from a single batch of gradients"""
+
+        idxs = list(self._idxs_to_calculate())
+        n = len(idxs)
+
+        species = [self._new_species(i, k, direction="+") for i, k in idxs]
+        if self._do_c_diff:
+            species += [
+                self._new_species(i, k, direction="-") for i, k in idxs
+            ]
+        else:
+            species.append(self._species)
+
+        self._method.batch_energy_gradient(
+            species, n_cores=self._n_total_cores
+        )
+        grads = np.array(
+            [np.array(s.gradient.to("Ha Å^-1")).flatten() for s in species]
+        )
+
+        if self._do_c_diff:
+            rows = (grads[:n] - grads[n:]) / (2 * self._shift)
+        else:
+            rows = (grads[:n] - grads[n]) / self._shift
+
+        for (i, k), row in zip(idxs, rows):
+            self._set_row(3 * i + k, row)
+
+        return None
+
+    def _set_row(self, row_idx: int, row: np.ndarray) -> None:
+        """Set a row of the Hessian and write it to a checkpoint file"""
+        self._hessian[row_idx, :] = row
+
+        filepath = self._checkpoint_filepath(row_idx)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(filepath), suffix=".tmp"
+        )
+        # Write to a temporary file then rename, so an interrupted write never
+        # leaves a partial row
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, np.asarray(row, dtype=float))
+            os.replace(tmp_path, filepath)
+
+        except OSError:
+            logger.warning(f"Failed to write Hessian row to {filepath}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return None
+
+    def _load_checkpointed_rows(self) -> None:
+        """Set any rows that have not been calculated from checkpoint files"""
+        n_loaded = 0
+
+        for row_idx in range(self._n_rows):
+            if row_idx in self._calculated_rows:
+                continue
+
+            try:
+                row = np.load(self._checkpoint_filepath(row_idx))
+            except (OSError, ValueError, EOFError):
+                continue
+
+            if row.shape != (self._n_rows,):
+                logger.warning(f"Hessian row {row_idx} had the wrong shape")
+                continue
+
             self._hessian[row_idx, :] = row
+            self._calculated_rows.append(row_idx)
+            n_loaded += 1
+
+        if n_loaded > 0:
+            logger.info(f"Loaded {n_loaded} Hessian rows from checkpoints")
 
         return None
 
+    def _checkpoint_filepath(self, row_idx: int) -> str:
+        """Path to the checkpoint file of a row in the current directory"""
+        return os.path.abspath(f"hessian_{self._checkpoint_key}_{row_idx}.npy")
+
+    @property
+    def _checkpoint_key(self) -> str:
+        """
+        Hash of everything that determines the value of a row: the atoms and
+        their coordinates (to 1E-6 Å), charge, multiplicity, method, keywords,
+        shift and type of finite difference
+        """
+        species = self._species
+        coords = np.round(np.asarray(species.coordinates, dtype=float), 6)
+
+        items = [
+            self._method.name,
+            str(self._keywords),
+            f"{species.charge}:{species.mult}:{species.solvent}",
+            " ".join(atom.label for atom in species.atoms),
+            " ".join(f"{x:.6f}" for x in coords.flatten() + 0.0),
+            f"{float(self._shift):.8f}:{self._do_c_diff}",
+        ]
+        return hashlib.sha256("\n".join(items).encode()).hexdigest()[:16]
+
     @property
     def hessian(self) -> Hessian:
         """Hessian matrix of {d^2E/dX_ij^2}. Must be symmetric"""
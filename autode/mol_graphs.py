@@ -1,4 +1,5 @@
 import itertools
+import hashlib
 import networkx as nx
 import numpy as np
 
@@ -7,8 +8,8 @@ from networkx.algorithms import isomorphism
 from typing import Optional, List, Tuple, TYPE_CHECKING
 from autode.utils import timeout
 import autode.exceptions as ex
-from scipy.spatial import distance_matrix
-from autode.atoms import Atom, metals
+from scipy.spatial import cKDTree, minkowski_distance
+from autode.atoms import Atom, metals, _bond_lengths
 from autode.log import logger
 
 if TYPE_CHECKING:
@@ -192,29 +193,12 @@ def make_graph(
         species.graph = graph
         return None
 
-    # Loop over the unique pairs of atoms and add 'bonds'
-    coords = species.coordinates
-    dist_mat = distance_matrix(coords, coords)
-
-    # Enumerate atoms low->high atomic weight for consistent graph generation
-    for i, _ in enumerate(
-        sorted(species.atoms, key=lambda _atom: _atom.weight)
-    ):
-        # Iterate through the closest atoms to atom i
-        for j in np.argsort(dist_mat[i]):
-            if i == j:  # Don't bond atoms to themselves
-                continue
-
-            # Get r_avg for this X-Y bond e.g. C-C -> 1.5 Å
-            avg_bond_length = species.atoms.eqm_bond_distance(i, j)
-
-            # If the distance between atoms i and j are less or equal to
-            # 1.25x average length add a 'bond'
-            if (
-                dist_mat[i, j] <= avg_bond_length * (1.0 + rel_tolerance)
-                and (i, j) not in graph.edges
-            ):
-                graph.add_edge(i, j, pi=False, active=False)
+    # Add a 'bond' between all pairs closer than (1 + rel_tolerance) x their
+    # equilibrium distance. Edges are added for each atom in turn from the
+    # closest atom outwards, for consistent graph generation
+    graph.add_edges_from(
+        _bonded_pairs(species, rel_tolerance), pi=False, active=False
+    )
 
     _set_graph_attributes(graph)
     species.graph = graph
@@ -225,6 +209,59 @@ def make_graph(
     return None
 
 
+def _bonded_pairs(
+    species: "Species", rel_tolerance: float
+) -> List[Tuple[int, int]]:
+    """
+    Ordered pairs of atoms (i, j) that are close enough to be bonded, sorted
+    by i then by the distance between i and j. Only pairs within the largest
+    possible bond cutoff are found, using a KD-tree, so this scales as O(N)
+    rather than O(N^2) in the number of atoms
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        species:
+
+        rel_tolerance: Relative tolerance on what is considered a bond
+
+    Returns:
+        (list(tuple(int, int))): Pairs of atom indexes
+    """
+    coords = np.asarray(species.coordinates, dtype=float)
+    symbols = [atom.atomic_symbol for atom in species.atoms]
+
+    # Equilibrium distance between two atoms is the sum of their covalent
+    # radii, unless there is an experimental distance for the homonuclear pair
+    radii = np.array([float(atom.covalent_radius) for atom in species.atoms])
+    dimer_lengths = np.array(
+        [_bond_lengths.get(2 * s, np.nan) for s in symbols], dtype=float
+    )
+
+    max_eqm_length = 2.0 * np.nanmax(np.append(dimer_lengths, radii.max()))
+    max_length = max_eqm_length * (1.0 + rel_tolerance) * (1.0 + 1e-8)
+
+    pairs = cKDTree(coords).query_pairs(r=max_length, output_type="ndarray")
+    if len(pairs) == 0:
+        return []
+
+    i, j = pairs[:, 0], pairs[:, 1]
+    eqm_lengths = radii[i] + radii[j]
+    is_dimer = (np.array(symbols)[i] == np.array(symbols)[j]) & ~np.isnan(
+        dimer_lengths[i]
+    )
+    eqm_lengths[is_dimer] = dimer_lengths[i][is_dimer]
+
+    dists = minkowski_distance(coords[i], coords[j])
+    bonded = dists <= eqm_lengths * (1.0 + rel_tolerance)
+
+    # Both directions of each pair, sorted by the first atom then distance
+    i, j, dists = i[bonded], j[bonded], dists[bonded]
+    i, j, dists = np.append(i, j), np.append(j, i), np.append(dists, dists)
+    order = np.lexsort((j, dists, i))
+
+    return list(zip(i[order].tolist(), j[order].tolist()))
+
+
 def remove_bonds_invalid_valancies(species):
     """
     Remove invalid valencies for atoms that exceed their maximum valencies e.g.
@@ -245,9 +282,10 @@ def remove_bonds_invalid_valancies(species):
         logger.warning(f"Atom {i} exceeds its maximal valence removing edges")
 
         # Get the atom indexes sorted by the closest to atom i
-        closest_atoms = sorted(
-            neighbours, key=lambda k: species.distance(i, k)
-        )
+        dists = species.distances([(i, k) for k in neighbours])
+        closest_atoms = [
+            neighbours[idx] for idx in np.argsort(dists, kind="stable")
+        ]
 
         # Delete all the bonds to atom(s) j that are above the maximal valance
         for j in closest_atoms[max_valance:]:
@@ -575,6 +613,55 @@ def is_isomorphic(
     return gm.is_isomorphic()
 
 
+def graph_hash(graph: MolecularGraph, n_iterations: int = 3) -> str:
+    """
+    Weisfeiler–Lehman hash of a molecular graph over the atom labels and
+    classes and whether bonds are active, i.e. the attributes matched in
+    is_isomorphic(). Isomorphic graphs have the same hash, but graphs with
+    the same hash are not necessarily isomorphic. Hashes are the same in
+    different processes
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        graph: Molecular graph
+
+        n_iterations: Number of neighbourhood aggregations i.e. the radius
+                      of the neighbourhood of each atom that is hashed
+
+    Returns:
+        (str): Hash
+    """
+
+    def digest(string):
+        return hashlib.blake2b(string.encode(), digest_size=16).hexdigest()
+
+    labels = {
+        i: f'{data.get("atom_label", "C")}:{data.get("atom_class", None)}'
+        for i, data in graph.nodes(data=True)
+    }
+    all_labels = sorted(labels.values())
+
+    for _ in range(n_iterations):
+        labels = {
+            i: digest(
+                labels[i]
+                + "".join(
+                    sorted(
+                        ("*" if active else "-") + labels[j]
+                        for j, active in (
+                            (j, graph.edges[i, j].get("active", False))
+                            for j in graph.neighbors(i)
+                        )
+                    )
+                )
+            )
+            for i in graph.nodes
+        }
+        all_labels += sorted(labels.values())
+
+    return digest(",".join(all_labels))
+
+
 def gm_is_isomorphic(gm, result):
     result[0] = gm.is_isomorphic()
 
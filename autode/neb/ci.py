@@ -2,7 +2,6 @@
 Climbing image (CI) nudged elastic band implementation from
 https://doi.org/10.1063/1.1329672
 """
-import numpy as np
 from scipy.optimize import OptimizeResult
 from typing import Optional, Any
 
@@ -12,6 +11,8 @@ from autode.values import ForceConstant
 
 
 class CImage(Image):
+    climbing = True
+
     def __init__(self, image: Image):
         """
         Construct a climbing image from a non-climbing one
@@ -24,23 +25,6 @@ class CImage(Image):
         # Set all the current attributes from the regular image
         self.__dict__.update(image.__dict__)
 
-    def get_force(self, im_l: Image, im_r: Image) -> np.ndarray:
-        """
-        Compute F_m
-
-        -----------------------------------------------------------------------
-        Arguments:
-            im_l (autode.neb.Image): Left image (i-1)
-            im_r (autode.neb.Image): Right image (i+1)
-        """
-        assert self.gradient is not None, "Image force requires a gradient"
-
-        # τ,  x_i-1,  x_i,   x_i+1
-        hat_tau, x_l, x, x_r = self._tau_xl_x_xr(im_l, im_r)
-
-        # F_m = ∇V(x_m) + (2∇V(x_m).τ)τ
-        return -self.gradient + 2.0 * np.dot(self.gradient, hat_tau) * hat_tau
-
 
 class CImages(Images):
     def __init__(
@@ -1,9 +1,11 @@
 import numpy as np
 
-from scipy.spatial import distance_matrix
-from typing import TYPE_CHECKING
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+from typing import Optional, Sequence, Tuple, TYPE_CHECKING
 
-from autode.values import PotentialEnergy
+from autode.log import logger
+from autode.values import PotentialEnergy, Distance
 
 if TYPE_CHECKING:
     from autode.neb.original import Image, Images
@@ -22,19 +24,34 @@ class IDPP:
     :math:`r_{ij}^{(k)} = r_{ij}^{(1)} + k(r_{ij}^{(N)} - r_{ij}^{(1)})/N` for
     :math:`N` images. The weight function is :math:`w(r_{ij}) = r_{ij}^{-4}`,
     as suggested in the paper.
+
+    Only the unique pairs of atoms are stored, so all the images in a band
+    are evaluated in a single set of array operations.
     """
 
-    def __init__(self, images: "Images"):
-        """Initialise a IDPP potential from a set of NEB images"""
+    def __init__(self, images: "Images", cutoff: Optional[Distance] = None):
+        """
+        Initialise a IDPP potential from a set of NEB images
+
+        -----------------------------------------------------------------------
+        Arguments:
+            images: Images in the NEB, at least two
+
+            cutoff: Only include pairs of atoms closer than this distance in
+                    any of the images. If None then all pairs are included
+        """
 
         if len(images) < 2:
             raise ValueError("Must have at least 2 images for IDPP")
 
-        # Distance matrices containing all r_{ij}^k
-        self._dists = {image_k.name: None for image_k in images}
-        self._diagonal_distance_matrix_idxs = None
+        x = np.array([image.coordinates for image in images])
+        self._n_atoms = x.shape[1]
+        self._idxs = {image.name: k for k, image in enumerate(images)}
 
-        self._set_distance_matrices(images)
+        self._i, self._j = self._pairs(x, cutoff)
+        self._incidence = self._incidence_matrix()
+        self._incidence_t = self._incidence.T.tocsr()
+        self._r_k = self._req_distances(x)
 
     def __call__(self, image: "Image") -> PotentialEnergy:
         r"""
@@ -54,10 +71,12 @@ class IDPP:
         Returns:
             (float): :math:`S_k`
         """
-        r_k, r = self._req_distance_matrix(image), self._distance_matrix(image)
-        w = self._weight_matrix(image)
-
-        return PotentialEnergy(0.5 * np.sum(w * (r_k - r) ** 2))
+        energies, _ = self._band_energies_gradients(
+            x=np.array(image.coordinates)[np.newaxis, :],
+            r_k=self._r_k[:, [self._idxs[image.name]]],
+            gradient=False,
+        )
+        return PotentialEnergy(energies[0])
 
     def grad(self, image: "Image") -> np.ndarray:
         r"""
@@ -81,92 +100,217 @@ class IDPP:
         Returns:
             (np.ndarray): :math:`\nabla S`
         """
+        _, gradients = self._band_energies_gradients(
+            x=np.array(image.coordinates)[np.newaxis, :],
+            r_k=self._r_k[:, [self._idxs[image.name]]],
+        )
+        return gradients[0]
+
+    def energies_gradients(
+        self, x: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Values and gradients of the IDPP objective function for every image
+        in a band
 
-        x = np.array(image.coordinates).flatten()
-        grad = np.zeros_like(x)
-
-        r = self._distance_matrix(image, unity_diagonal=True)
-        w = self._weight_matrix(image)
-        r_k = self._req_distance_matrix(image)
-
-        a = -2 * (2 * (r_k - r) ** 2 * r ** (-6) + w * (r_k - r) * r ** (-1))
+        -----------------------------------------------------------------------
+        Arguments:
+            x: Coordinates of all the images, in the same order as the images
+               used to construct this potential. shape = (n_images, n_atoms, 3)
 
+        Returns:
+            (np.ndarray, np.ndarray): Values, with shape = (n_images,) and
+                                      gradients, with the same shape as x
         """
-        The following numpy operations are the same as:
-        -----------------------------------------------------------------------
-        x = x.reshape((-1, 3))
-        grad = np.zeros_like(x)
+        return self._band_energies_gradients(np.asarray(x), r_k=self._r_k)
 
-        for i in range(n_atoms):
-            for j in range(n_atoms):
+    def set_energies_gradients(self, images: Sequence["Image"]) -> None:
+        """
+        Evaluate and set the energy and gradient of a set of images, which
+        must be images used to construct this potential, in a single call
 
-                if i != j:
-                    grad[i, :] += a[i, j] * (x[i, :] - x[j, :])
         -----------------------------------------------------------------------
+        Arguments:
+            images: NEB images
         """
+        idxs = [self._idxs[image.name] for image in images]
+        energies, gradients = self._band_energies_gradients(
+            x=np.array([image.coordinates for image in images]),
+            r_k=self._r_k[:, idxs],
+        )
 
-        a[self._diagonal_distance_matrix_idxs] = 0.0
-        delta = np.subtract.outer(x, x)
-
-        grad[0::3] = np.sum(a * delta[0::3, 0::3], axis=1)  # x
-        grad[1::3] = np.sum(a * delta[1::3, 1::3], axis=1)  # y
-        grad[2::3] = np.sum(a * delta[2::3, 2::3], axis=1)  # z
+        for image, energy, gradient in zip(images, energies, gradients):
+            image.energy = PotentialEnergy(energy)
+            image.gradient = gradient
 
-        return grad.reshape((-1, 3))
+        return None
 
-    def _set_distance_matrices(self, images: "Images") -> None:
+    def relax(
+        self,
+        x: np.ndarray,
+        k: float = 0.1,
+        gtol: float = 0.01,
+        maxiter: int = 1000,
+        max_step: Distance = Distance(0.1, units="Å"),
+    ) -> np.ndarray:
         """
-        For each image determine the optimum distance matrix using
+        Relax a band of images on this potential, with the end points fixed
+        and neighbouring images joined by springs
 
-        .. math::
+        -----------------------------------------------------------------------
+        Arguments:
+            x: Coordinates of all the images. shape = (n_images, n_atoms, 3)
 
-            r_{ij}^{(k)} = r_{ij}^{(1)} + k (r_{ij}^{(N)} - r_{ij}^{(1)}) / N
+            k: Force constant of the springs between images
 
-        and set the the diagonal indices of each distance matrix.
-        """
+            gtol: Tolerance on the largest component of the NEB force on any
+                  image, below which the band is converged
 
-        dist_mat_1 = self._distance_matrix(image=images[0])
-        dist_mat_n = self._distance_matrix(image=images[-1])
+            maxiter: Maximum number of iterations
 
-        delta = dist_mat_n - dist_mat_1
-        n = len(images)
+            max_step: Maximum distance any atom moves in a step. Limited to
+                      half the smallest distance between neighbouring
+                      images, such that images do not step past each other
 
-        for k, image in enumerate(images):
-            self._dists[image.name] = dist_mat_1 + k * delta / n
+        Returns:
+            (np.ndarray): Relaxed coordinates. Same shape as x
+        """
+        from autode.neb.original import band_forces
+        from autode.neb.optimisers import LBFGSBandOptimiser
+
+        x = np.array(x, dtype=float)
+        n_images = len(x)
+        ks, climbing = np.full(n_images, k), np.zeros(n_images, dtype=bool)
+
+        mask = np.zeros_like(x, dtype=bool)
+        mask[[0, -1]] = True
+        mask = mask.flatten()
+
+        # Largest atomic displacement between neighbouring images
+        spacing = np.max(np.linalg.norm(np.diff(x, axis=0), axis=2), axis=1)
+        max_step = float(Distance(max_step).to("Å"))
+        if np.min(spacing) > 0:
+            max_step = min(max_step, 0.5 * float(np.min(spacing)))
+
+        optimiser = LBFGSBandOptimiser(max_step=Distance(max_step, "Å"))
+        optimiser.reset(n_coords=x.size)
+
+        n_iterations, max_force = 0, np.inf
+        for n_iterations in range(1, maxiter + 1):
+            energies, gradients = self.energies_gradients(x)
+            forces = band_forces(
+                x=x.reshape(n_images, -1),
+                energies=energies,
+                gradients=gradients.reshape(n_images, -1),
+                ks=ks,
+                climbing=climbing,
+            )
+
+            max_force = np.max(np.abs(forces))
+            if max_force < gtol:
+                break
+
+            step = optimiser.step(
+                x.flatten(), -forces.flatten(), mask, n_images
+            )
+            x += step.reshape(x.shape)
+
+        logger.info(
+            f"IDPP relaxation finished after {n_iterations} iterations. "
+            f"max|F| = {max_force:.4f}"
+        )
+        return x
+
+    def _pairs(
+        self, x: np.ndarray, cutoff: Optional[Distance]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Indexes i < j of the pairs of atoms included in the potential"""
+
+        if cutoff is None:
+            return np.triu_indices(self._n_atoms, k=1)
+
+        cutoff = float(Distance(cutoff).to("Å"))
+        pairs = np.concatenate(
+            [
+                cKDTree(coords).query_pairs(r=cutoff, output_type="ndarray")
+                for coords in x
+            ]
+        )
+        pairs = np.unique(np.sort(pairs, axis=1), axis=0).reshape(-1, 2)
+
+        logger.info(
+            f"Using {len(pairs)} pairs of atoms within {cutoff:.2f} Å in IDPP"
+        )
+        return pairs[:, 0], pairs[:, 1]
+
+    def _incidence_matrix(self) -> csr_matrix:
+        """
+        Matrix D with shape (n_atoms, n_pairs), with elements D_ip = 1 and
+        D_jp = -1 for the pair p = (i, j), such that the differences x_i - x_j
+        of all pairs are D^T x and the gradient of an image is D multiplied by
+        the gradient with respect to x_i - x_j
+        """
+        n_pairs = len(self._i)
+        return csr_matrix(
+            (
+                np.concatenate((np.ones(n_pairs), -np.ones(n_pairs))),
+                (
+                    np.concatenate((self._i, self._j)),
+                    np.tile(np.arange(n_pairs), 2),
+                ),
+            ),
+            shape=(self._n_atoms, n_pairs),
+        )
+
+    def _req_distances(self, x: np.ndarray) -> np.ndarray:
+        """
+        For each image determine the optimum distances using
 
-        self._diagonal_distance_matrix_idxs = np.diag_indices_from(delta)
-        return None
+        .. math::
 
-    def _req_distance_matrix(self, image: "Image"):
-        """Required distance matrix for an image, with elements r_{ij}^k"""
-        return self._dists[image.name]
+            r_{ij}^{(k)} = r_{ij}^{(1)} + k (r_{ij}^{(N)} - r_{ij}^{(1)}) / N
 
-    def _distance_matrix(
-        self, image: "Image", unity_diagonal: bool = False
-    ) -> np.ndarray:
-        """Distance matrix for an image"""
+        Returns:
+            (np.ndarray): shape = (n_pairs, n_images)
+        """
+        dists_1 = np.linalg.norm(x[0, self._i] - x[0, self._j], axis=1)
+        dists_n = np.linalg.norm(x[-1, self._i] - x[-1, self._j], axis=1)
 
-        x = image.coordinates
-        r = distance_matrix(x, x)
+        n = len(x)
+        ks = np.arange(n)[np.newaxis, :]
+        delta = (dists_n - dists_1)[:, np.newaxis]
 
-        if unity_diagonal:
-            r[self._diagonal_distance_matrix_idxs] = 1.0
+        return dists_1[:, np.newaxis] + ks * delta / n
 
-        return r
+    def _band_energies_gradients(
+        self, x: np.ndarray, r_k: np.ndarray, gradient: bool = True
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Values and gradients of the potential for a set of n images with
+        coordinates x and required distances r_k, with shape (n_pairs, n).
+        Arrays are ordered pair-major so no copies are required
+        """
+        n_images = len(x)
 
-    def _weight_matrix(self, image: "Image") -> np.ndarray:
-        r"""
-        Weight matrix with elements
+        # x_i - x_j for all pairs. shape = (n_pairs, n_images, 3)
+        x = x.transpose(1, 0, 2).reshape(self._n_atoms, 3 * n_images)
+        delta = (self._incidence_t @ x).reshape(-1, n_images, 3)
 
-        .. math::
+        inv_r = 1.0 / np.sqrt(np.einsum("pki,pki->pk", delta, delta))
+        w = np.square(np.square(inv_r))
+        diff = r_k - 1.0 / inv_r  # r_ij^(k) - r_ij
 
-            w_{ij} = 1/r_{ij}^4
+        energies = np.sum(w * np.square(diff), axis=0)
 
+        if not gradient:
+            return energies, None
 
-        for :math:`i \ne j` otherwise :math:`w_{ii} = 0`
-        """
-        r = self._distance_matrix(image, unity_diagonal=True)
-        w = r ** (-4.0)
-        w[self._diagonal_distance_matrix_idxs] = 0.0  # Zero w_ii elements
+        # -2(2(c - r)^2 r^-6 + w (c - r) r^-1) with c = r_ij^(k)
+        a = -2.0 * w * diff * (2.0 * diff * np.square(inv_r) + inv_r)
 
-        return w
+        # Sum a_ij (x_i - x_j) onto atom i and subtract it from atom j
+        g = self._incidence @ (a[:, :, np.newaxis] * delta).reshape(
+            -1, 3 * n_images
+        )
+        gradients = g.reshape(self._n_atoms, n_images, 3).transpose(1, 0, 2)
+        return energies, gradients
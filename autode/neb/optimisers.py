@@ -0,0 +1,321 @@
+"""
+Optimisers for a band of NEB images, which require a single energy and
+gradient evaluation of the band per iteration and limit the step taken by
+each image. Forces on the images are not the gradient of any function, so
+no line search is performed. FIRE is from:
+
+E. Bitzek et al., Phys. Rev. Lett. 97, 170201 (2006)
+"""
+import numpy as np
+
+from abc import ABC, abstractmethod
+from typing import Optional, List, Tuple, TYPE_CHECKING
+from scipy.optimize import OptimizeResult
+
+from autode.log import logger
+from autode.values import Distance
+from autode.neb.original import total_energy, derivative
+
+if TYPE_CHECKING:
+    from autode.neb.original import Images
+    from autode.wrappers.methods import Method
+
+
+class BandOptimiser(ABC):
+    def __init__(
+        self,
+        maxiter: int = 30,
+        etol: float = 1e-3,
+        max_step: Distance = Distance(0.2, units="Å"),
+    ):
+        """
+        Optimiser for all the images in a NEB
+
+        -----------------------------------------------------------------------
+        Arguments:
+            maxiter: Maximum number of iterations, each of which is one energy
+                     and gradient evaluation on every image that is not frozen
+
+            etol: Tolerance on the change in the total path energy (Ha)
+                  between two iterations, below which the band is converged
+
+            max_step: Maximum distance any atom in an image may move in a
+                      single step
+        """
+        self.maxiter = int(maxiter)
+        self.etol = float(etol)
+        self.max_step = float(Distance(max_step).to("Å"))
+
+    def run(
+        self,
+        images: "Images",
+        method: "Method",
+        n_cores: int,
+        plot_energies: bool = True,
+    ) -> OptimizeResult:
+        """
+        Optimise the band of images
+
+        -----------------------------------------------------------------------
+        Arguments:
+            images: Images with energies set on the end points
+
+            method: Method used to evaluate the energy and gradient
+
+            n_cores: Total number of cores to use
+
+            plot_energies: Plot the path energy at every iteration
+
+        Returns:
+            (scipy.optimize.OptimizeResult): With x, fun, nit and nfev (the
+                                             number of band evaluations)
+        """
+        self.reset(n_coords=len(images.coords()))
+        x = images.coords()
+        energy, prev_energy = np.inf, np.inf
+        message = "Maximum number of iterations reached"
+        n_evals = 0
+
+        for iteration in range(self.maxiter):
+            energy = total_energy(x, images, method, n_cores, plot_energies)
+            grad = derivative(x, images, method, n_cores, plot_energies)
+            n_evals += 1
+
+            # Coordinates of frozen images may not have been set
+            x = images.coords()
+
+            if abs(prev_energy - energy) < self.etol:
+                message = "Change in path energy below tolerance"
+                break
+
+            if all(image.frozen for image in images[1:-1]):
+                message = "All images are frozen"
+                break
+
+            if self._climbing_idxs_changed(images):
+                logger.info("Climbing image changed. Resetting optimiser")
+                self.reset(n_coords=len(x))
+
+            if iteration == self.maxiter - 1:
+                break
+
+            x = x + self.step(x, grad, self._frozen_mask(images), len(images))
+            prev_energy = energy
+
+        logger.info(
+            f"{self.__class__.__name__}: {message}. Path energy = "
+            f"{energy:.5f} Ha after {n_evals} band evaluations and "
+            f"{images.n_evaluations} image evaluations in total"
+        )
+        return OptimizeResult(
+            x=x,
+            fun=energy,
+            nit=n_evals,
+            nfev=n_evals,
+            message=message,
+            success=not message.startswith("Maximum"),
+        )
+
+    def step(
+        self, x: np.ndarray, grad: np.ndarray, mask: np.ndarray, n_images: int
+    ) -> np.ndarray:
+        """
+        Step to take from a band, limited such that no atom in any image moves
+        further than max_step. The optimiser must have been reset
+
+        -----------------------------------------------------------------------
+        Arguments:
+            x: Flat coordinates of all the images (Å)
+
+            grad: Negative of the NEB forces on all the images. Same shape
+                  as x
+
+            mask: Boolean array of the coordinates that are fixed. Same shape
+                  as x
+
+            n_images: Number of images in the band
+
+        Returns:
+            (np.ndarray): Step. Same shape as x
+        """
+        step = self._step(x, grad, mask=mask)
+        return self._capped(step, n_images=n_images)
+
+    @abstractmethod
+    def reset(self, n_coords: int) -> None:
+        """Initialise or reset the state of the optimiser"""
+
+    @abstractmethod
+    def _step(
+        self, x: np.ndarray, grad: np.ndarray, mask: np.ndarray
+    ) -> np.ndarray:
+        """
+        Step to take given the coordinates and gradient of the band. Where
+        mask is True the components are fixed and the step must be zero
+        """
+
+    def _capped(self, step: np.ndarray, n_images: int) -> np.ndarray:
+        """Scale the step of each image such that no atom in it moves more
+        than max_step"""
+        step = step.reshape(n_images, -1, 3)
+        max_disp = np.max(np.linalg.norm(step, axis=2), axis=1)
+
+        factors = np.ones(n_images)
+        too_large = max_disp > self.max_step
+        factors[too_large] = self.max_step / max_disp[too_large]
+
+        if np.any(too_large):
+            logger.info(f"Scaled the steps of {np.sum(too_large)} images")
+
+        return (step * factors[:, None, None]).flatten()
+
+    @staticmethod
+    def _frozen_mask(images: "Images") -> np.ndarray:
+        """Boolean mask of the coordinates that do not move"""
+        n = 3 * images[0].n_atoms
+        mask = np.zeros(shape=(len(images), n), dtype=bool)
+        mask[0] = mask[-1] = True
+
+        for i, image in enumerate(images):
+            if image.frozen:
+                mask[i] = True
+
+        return mask.flatten()
+
+    def _climbing_idxs_changed(self, images: "Images") -> bool:
+        """Have the climbing images changed since the last iteration?"""
+        from autode.neb.ci import CImage
+
+        idxs = [i for i, im in enumerate(images) if isinstance(im, CImage)]
+        prev_idxs = getattr(self, "_climbing_idxs", idxs)
+        self._climbing_idxs = idxs
+
+        return idxs != prev_idxs
+
+
+class FIREBandOptimiser(BandOptimiser):
+    """Fast inertial relaxation engine (FIRE) for a band of images"""
+
+    # Parameters from the original paper. Time steps are larger than those
+    # commonly used with eV Å^-1 forces, by √(Ha / eV), as forces here are
+    # in Ha Å^-1
+    dt_init = 0.5
+    dt_max = 5.0
+    n_min = 5
+    f_inc = 1.1
+    f_dec = 0.5
+    alpha_init = 0.1
+    f_alpha = 0.99
+
+    def reset(self, n_coords: int) -> None:
+        self._v = np.zeros(shape=(n_coords,))
+        self._dt = self.dt_init
+        self._alpha = self.alpha_init
+        self._n_positive = 0
+
+    def _step(
+        self, x: np.ndarray, grad: np.ndarray, mask: np.ndarray
+    ) -> np.ndarray:
+        force = -grad
+        force[mask] = 0.0
+        self._v[mask] = 0.0
+
+        power = np.dot(force, self._v)
+
+        if power > 0:
+            f_norm, v_norm = np.linalg.norm(force), np.linalg.norm(self._v)
+            self._v = (1.0 - self._alpha) * self._v + self._alpha * (
+                force / f_norm * v_norm
+            )
+
+            self._n_positive += 1
+            if self._n_positive > self.n_min:
+                self._dt = min(self._dt * self.f_inc, self.dt_max)
+                self._alpha *= self.f_alpha
+        else:
+            self._v[:] = 0.0
+            self._dt *= self.f_dec
+            self._alpha = self.alpha_init
+            self._n_positive = 0
+
+        self._v += self._dt * force
+        return self._dt * self._v
+
+
+class LBFGSBandOptimiser(BandOptimiser):
+    """Limited memory BFGS for a band of images, with no line search"""
+
+    def __init__(self, *args, n_memory: int = 10, **kwargs):
+        """
+        L-BFGS band optimiser. See BandOptimiser for the other arguments
+
+        -----------------------------------------------------------------------
+        Arguments:
+            n_memory: Number of previous steps used to build the inverse
+                      Hessian
+        """
+        super().__init__(*args, **kwargs)
+        self.n_memory = int(n_memory)
+
+    # Initial inverse Hessian (Å^2 Ha^-1), corresponding to a curvature of
+    # 70 eV Å^-2 that is typical for molecular systems
+    h0_inv = 0.39
+
+    def reset(self, n_coords: int) -> None:
+        self._history: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._x: Optional[np.ndarray] = None
+        self._g: Optional[np.ndarray] = None
+
+    def _step(
+        self, x: np.ndarray, grad: np.ndarray, mask: np.ndarray
+    ) -> np.ndarray:
+        grad = grad.copy()
+        grad[mask] = 0.0
+
+        if self._x is not None and self._g is not None:
+            s, y = x - self._x, grad - self._g
+
+            # Forces are not conservative, so a step with negative curvature
+            # means the model is no longer valid. Only positive curvature
+            # pairs are kept to ensure the inverse Hessian is positive definite
+            if np.dot(s, y) > 1e-10:
+                self._history = self._history[-(self.n_memory - 1) :]
+                self._history.append((s, y))
+
+            else:
+                logger.info("Negative curvature. Resetting the memory")
+                self._history.clear()
+
+        self._x, self._g = x.copy(), grad.copy()
+        step = -self._inverse_hessian_product(grad)
+
+        if np.dot(step, grad) > 0:
+            logger.info("L-BFGS step was uphill. Resetting the memory")
+            self._history.clear()
+            step = -self.h0_inv * grad
+
+        step[mask] = 0.0
+        return step
+
+    def _inverse_hessian_product(self, grad: np.ndarray) -> np.ndarray:
+        """H^-1 g from the two loop recursion"""
+        q = grad.copy()
+        alphas = []
+
+        for s, y in reversed(self._history):
+            rho = 1.0 / np.dot(y, s)
+            alpha = rho * np.dot(s, q)
+            q -= alpha * y
+            alphas.append((rho, alpha))
+
+        if len(self._history) > 0:
+            s, y = self._history[-1]
+            q *= np.dot(s, y) / np.dot(y, y)
+        else:
+            q *= self.h0_inv
+
+        for (s, y), (rho, alpha) in zip(self._history, reversed(alphas)):
+            beta = rho * np.dot(y, q)
+            q += (alpha - beta) * s
+
+        return q
@@ -6,6 +6,7 @@ import numpy as np
 
 from typing import Optional, Sequence, List, Any, TYPE_CHECKING, Union, Type
 from copy import deepcopy
+from concurrent.futures import wait, FIRST_COMPLETED
 
 from autode.log import logger
 from autode.calculations import Calculation
@@ -13,11 +14,15 @@ from autode.wrappers.methods import Method
 from autode.species.species import Species
 from autode.input_output import xyz_file_to_molecules
 from autode.path import Path
-from autode.utils import work_in, ProcessPool
+from autode.utils import work_in, WorkerPool
 from autode.config import Config
 from autode.neb.idpp import IDPP
-from scipy.optimize import minimize
-from autode.values import Distance, PotentialEnergy, ForceConstant
+from autode.values import (
+    Distance,
+    PotentialEnergy,
+    ForceConstant,
+    GradientRMS,
+)
 
 if TYPE_CHECKING:
     from autode.wrappers.methods import Method
@@ -87,39 +92,42 @@ def total_energy(flat_coords, images, method, n_cores, plot_energies):
     """Compute the total energy across all images"""
     images.set_coords(flat_coords)
 
-    # Number of cores per process is the floored total divided by n images
-    # minus the two end points that will be fixed
-    n_cores_pp = 1
-    if len(images) > 2:
-        n_cores_pp = max(int(n_cores // (len(images) - 2)), 1)
+    # Frozen images have not moved, so their energy and gradient are current
+    idxs = [i for i in range(1, len(images) - 1) if not images[i].frozen]
 
     logger.info(
-        f"Calculating energy and forces for all images with "
-        f"{n_cores} total cores and {n_cores_pp} per process"
+        f"Calculating energy and forces for {len(idxs)} images with "
+        f"{n_cores} total cores. {len(images) - 2 - len(idxs)} are frozen"
     )
 
-    # Run an energy + gradient evaluation across all images. IDPP and in-memory
-    # methods are evaluated serially in this process; in particular GPU4PySCF
-    # holds a CUDA context that cannot survive process forking, so it must not
-    # be dispatched to a ProcessPool. Only external-program methods (ORCA, etc.,
-    # uses_external_io=True) are parallelised across images.
-    in_process = isinstance(method, IDPP) or not getattr(
-        method, "uses_external_io", True
-    )
-    if in_process:
-        images[1:-1] = [
-            energy_gradient(images[i], method, n_cores_pp)
-            for i in range(1, len(images) - 1)
-        ]
-    else:
-        with ProcessPool(max_workers=n_cores) as pool:
-            results = [
-                pool.submit(energy_gradient, images[i], method, n_cores_pp)
-                for i in range(1, len(images) - 1)
-            ]
+    # Run an energy + gradient evaluation across all images. IDPP is evaluated
+    # on all the images at once and in-memory methods serially in this
+    # process; in particular GPU4PySCF holds a CUDA context that cannot survive
+    # process forking, so it must not be dispatched to a WorkerPool. Only
+    # external-program methods (ORCA, etc., uses_external_io=True) are
+    # parallelised across images, while methods that implement batches (e.g.
+    # MLIP) evaluate all images in a single call.
+    in_process = not getattr(method, "uses_external_io", True)
+    if len(idxs) == 0:
+        pass
 
-            images[1:-1] = [res.result() for res in results]
+    elif isinstance(method, IDPP):
+        method.set_energies_gradients([images[i] for i in idxs])
 
+    elif isinstance(method, Method) and method.implements_batch:
+        method.batch_energy_gradient(
+            [images[i] for i in idxs], n_cores=n_cores
+        )
+
+    elif in_process:
+        n_cores_pp = max(n_cores // len(idxs), 1)
+        for i in idxs:
+            images[i] = energy_gradient(images[i], method, n_cores_pp)
+
+    else:
+        _parallel_energy_gradient(images, idxs, method, n_cores)
+
+    images.n_evaluations += len(idxs)
     images.increment()
 
     if plot_energies:
@@ -132,6 +140,53 @@ def total_energy(flat_coords, images, method, n_cores, plot_energies):
     return sum(rel_energies)
 
 
+def _parallel_energy_gradient(
+    images: "Images",
+    idxs: List[int],
+    method: "Method",
+    n_cores: int,
+) -> None:
+    """
+    Evaluate the energy and gradient of a set of images in parallel. Cores
+    are handed out on demand, so those freed by an image that finishes
+    early are given to images yet to be started
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        images: Images in the NEB, updated in place
+
+        idxs: Indexes of the images to evaluate
+
+        method: Electronic structure method
+
+        n_cores: Total number of cores
+    """
+    pending = list(idxs)
+    n_free_cores = n_cores
+    running = {}
+
+    with WorkerPool(max_workers=min(n_cores, len(idxs))) as pool:
+        while len(pending) > 0 or len(running) > 0:
+            while len(pending) > 0 and n_free_cores > 0:
+                n_cores_pp = max(n_free_cores // len(pending), 1)
+                idx = pending.pop(0)
+
+                job = pool.submit(
+                    energy_gradient, images[idx], method, n_cores_pp
+                )
+                running[job] = (idx, n_cores_pp)
+                n_free_cores -= n_cores_pp
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for job in finished:
+                idx, n_cores_pp = running.pop(job)
+                images[idx] = job.result()
+                n_free_cores += n_cores_pp
+
+    return None
+
+
 def derivative(flat_coords, images, method, n_cores, plot_energies):
     """
     Compute the derivative of the total energy with respect to all
@@ -139,24 +194,121 @@ def derivative(flat_coords, images, method, n_cores, plot_energies):
     function to have the same signature as the function that's being minimised.
     See: https://tinyurl.com/scipyopt
     """
-
-    # Forces for the first image are fixed at zero
-    forces = np.zeros(shape=images[0].gradient.shape)
-
     # No need to calculate gradient as should already be there from energy eval
+    forces = band_forces(
+        x=np.array([image.coordinates.flatten() for image in images]),
+        energies=np.array([float(image.energy) for image in images]),
+        gradients=np.array([image.gradient for image in images]),
+        ks=np.array([float(image.k) for image in images]),
+        climbing=np.array([image.climbing for image in images]),
+    )
+
     for i in range(1, len(images) - 1):
-        force = images[i].get_force(im_l=images[i - 1], im_r=images[i + 1])
-        forces = np.append(forces, force)
+        images.update_frozen(i, forces[i])
 
-    # Final zero set of forces
-    forces = np.append(forces, np.zeros(shape=images[-1].gradient.shape))
+        if images[i].frozen:
+            forces[i] = 0.0
 
     # dV/dx is negative of the force
     logger.info(f"|F| = {np.linalg.norm(forces):.4f} Ha Å-1")
-    return -forces
+    return -forces.flatten()
+
+
+def band_forces(
+    x: np.ndarray,
+    energies: np.ndarray,
+    gradients: np.ndarray,
+    ks: np.ndarray,
+    climbing: np.ndarray,
+) -> np.ndarray:
+    """
+    Forces on all the images in a band, computed in a single pass over every
+    image. Notation from:
+    Henkelman and H. J ́onsson, J. Chem. Phys. 113, 9978 (2000)
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        x: Coordinates of the images. shape = (n_images, 3N)
+
+        energies: Energies of the images. shape = (n_images,)
+
+        gradients: Gradients of the images. shape = (n_images, 3N)
+
+        ks: Force constants of the springs. shape = (n_images,)
+
+        climbing: Boolean array of which images are climbing images.
+                  shape = (n_images,)
+
+    Returns:
+        (np.ndarray): Forces, which are zero on the end points.
+                      shape = (n_images, 3N)
+
+    Raises:
+        (RuntimeError): If the tangent cannot be defined, e.g. for an
+                        image with an undefined energy
+    """
+    forces = np.zeros_like(x, dtype=float)
+    if len(x) < 3:
+        return forces
+
+    # x_i-1,   x_i,   x_i+1  and   E_i-1,  E_i,  E_i+1  for interior images
+    x_l, x_m, x_r = x[:-2], x[1:-1], x[2:]
+    e_l, e, e_r = energies[:-2], energies[1:-1], energies[2:]
+
+    # τ_i+  and  τ_i-
+    tau_plus, tau_minus = x_r - x_m, x_m - x_l
+
+    # ΔV_i^max  and  ΔV_i^min
+    dv_max = np.maximum(np.abs(e_r - e), np.abs(e_l - e))[:, None]
+    dv_min = np.minimum(np.abs(e_r - e), np.abs(e_l - e))[:, None]
+
+    # An image between two images with the same energy, e.g. the middle of a
+    # symmetric band or an image on a plateau, has the bisecting tangent
+    conditions = [
+        (e_l < e) & (e < e_r),
+        (e_r < e) & (e < e_l),
+        e_l < e_r,
+        e_r < e_l,
+        e_l == e_r,
+    ]
+    if not np.all(np.any(conditions, axis=0)):
+        raise RuntimeError("Something went very wrong in the NEB!")
+
+    tau = np.select(
+        [c[:, None] for c in conditions],
+        [
+            tau_plus,
+            tau_minus,
+            tau_plus * dv_max + tau_minus * dv_min,
+            tau_plus * dv_min + tau_minus * dv_max,
+            tau_plus + tau_minus,
+        ],
+    )
+    hat_tau = tau / np.linalg.norm(tau, axis=1)[:, None]
+
+    # F_i^s||
+    f_parallel = (
+        np.linalg.norm(tau_plus, axis=1) * ks[2:]
+        - np.linalg.norm(tau_minus, axis=1) * ks[:-2]
+    )[:, None] * hat_tau
+
+    # (∇V(x)_i•τ) τ
+    grad = gradients[1:-1]
+    grad_parallel = np.sum(grad * hat_tau, axis=1)[:, None] * hat_tau
+
+    # F_i = F_i^s|| -  ∇V(x)_i|_|_  or for a climbing image
+    # F_m = -∇V(x_m) + (2∇V(x_m).τ)τ
+    forces[1:-1] = np.where(
+        climbing[1:-1, None],
+        -grad + 2.0 * grad_parallel,
+        f_parallel - (grad - grad_parallel),
+    )
+    return forces
 
 
 class Image(Species):
+    climbing = False  #: Is this a climbing image?
+
     def __init__(
         self,
         species: Species,
@@ -186,80 +338,18 @@ class Image(Species):
 
         self.iteration = 0  #: Current optimisation iteration of this image
         self.k = k
+        self.frozen = False  #: Coordinates fixed and gradient not updated
 
     def _generate_conformers(self, *args, **kwargs):
         raise RuntimeError("Cannot create conformers of an image")
 
-    def _tau_xl_x_xr(
-        self,
-        im_l: "Image",
-        im_r: "Image",
-    ) -> tuple:
-        """
-        Calculate the normalised τ vector, along with the coordinates of the
-        left, this and right images
-
-        -----------------------------------------------------------------------
-        Arguments:
-            im_l: (autode.neb.Image)
-            im_r: (autode.neb.Image)
-
-        Returns:
-            (np.ndarray, np.ndarray, np.ndarray, np.ndarray)
-        """
-        assert self.energy is not None, "Energy must be set to calculate tau"
-        assert im_l.energy is not None, "Left image energy must be set"
-        assert im_r.energy is not None, "Right image energy must be set"
-
-        # ΔV_i^max
-        dv_max = max(
-            np.abs(im_r.energy - self.energy),
-            np.abs(im_l.energy - self.energy),
-        )
-
-        # ΔV_i^min
-        dv_min = min(
-            np.abs(im_r.energy - self.energy),
-            np.abs(im_l.energy - self.energy),
-        )
-
-        # x_i-1,   x_i,   x_i+1
-        x_l, x, x_r = [
-            image.coordinates.flatten() for image in (im_l, self, im_r)
-        ]
-        # τ_i+
-        tau_plus = x_r - x
-        # τ_i-
-        tau_minus = x - x_l
-
-        if im_l.energy < self.energy < im_r.energy:
-            tau = tau_plus
-
-        elif im_r.energy < self.energy < im_l.energy:
-            tau = tau_minus
-
-        elif im_l.energy < im_r.energy:
-            tau = tau_plus * dv_max + tau_minus * dv_min
-
-        elif im_r.energy < im_l.energy:
-            tau = tau_plus * dv_min + tau_minus * dv_max
-
-        else:
-            raise RuntimeError("Something went very wrong in the NEB!")
-
-        # Normalised τ vector and coordinates of the images
-        return tau / np.linalg.norm(tau), x_l, x, x_r
-
     def get_force(
         self,
         im_l: "Image",
         im_r: "Image",
     ) -> np.ndarray:
         """
-        Compute F_i. Notation from:
-        Henkelman and H. J ́onsson, J. Chem. Phys. 113, 9978 (2000)
-
-        also a copy in autode/common
+        Compute F_i, or F_m if this is a climbing image. See band_forces
 
         -----------------------------------------------------------------------
         Arguments:
@@ -267,20 +357,17 @@ class Image(Species):
             im_r (autode.neb.Image): Right image (i+1)
         """
         assert self.gradient is not None, "Gradient must be set to calc force"
-
-        # τ,  x_i-1,  x_i,   x_i+1
-        hat_tau, x_l, x, x_r = self._tau_xl_x_xr(im_l, im_r)
-
-        # F_i^s||
-        f_parallel = (
-            np.linalg.norm(x_r - x) * im_r.k - np.linalg.norm(x - x_l) * im_l.k
-        ) * hat_tau
-
-        # ∇V(x)_i|_|_ = ∇V(x)_i - (∇V(x)_i•τ) τ
-        grad_perp = self.gradient - np.dot(self.gradient, hat_tau) * hat_tau
-
-        # F_i = F_i^s|| -  ∇V(x)_i|_|_
-        return f_parallel - grad_perp
+        assert im_l.energy is not None and im_r.energy is not None
+
+        images, zeros = (im_l, self, im_r), np.zeros(3 * self.n_atoms)
+        forces = band_forces(
+            x=np.array([image.coordinates.flatten() for image in images]),
+            energies=np.array([float(image.energy) for image in images]),
+            gradients=np.array([zeros, self.gradient, zeros]),
+            ks=np.array([float(image.k) for image in images]),
+            climbing=np.array([False, self.climbing, False]),
+        )
+        return forces[1]
 
     @property
     def gradient(self) -> Optional[np.ndarray]:
@@ -319,6 +406,9 @@ class Images(Path):
             self.max_k > self.min_k
         ), "Can't set the min force constant above the max"
 
+        self.freeze_tol: Optional[GradientRMS] = None
+        self.n_evaluations = 0  #: Number of image energy+gradient evaluations
+
     def __eq__(self, other):
         """Equality od two climbing image NEB paths"""
         if not isinstance(other, Images):
@@ -363,6 +453,31 @@ class Images(Path):
                     )
         return None
 
+    def update_frozen(self, idx: int, force: np.ndarray) -> None:
+        """
+        Freeze or unfreeze an image given its current force. Images are frozen
+        if the RMS force is below freeze_tol and released once it rises above
+
+        -----------------------------------------------------------------------
+        Arguments:
+            idx: Index of the image
+
+            force: Force on the image (Ha Å^-1)
+        """
+        if self.freeze_tol is None:
+            return None
+
+        image = self[idx]
+        is_converged = np.sqrt(np.mean(np.square(force))) < self.freeze_tol
+
+        if is_converged != image.frozen:
+            logger.info(
+                f"{'Freezing' if is_converged else 'Unfreezing'} image {idx}"
+            )
+            image.frozen = is_converged
+
+        return None
+
     def plot_energies(
         self, save=False, name="None", color=None, xlabel="NEB coordinate"
     ):
@@ -380,14 +495,12 @@ class Images(Path):
 
     def coords(self):
         """Get a flat array of all components of every atom"""
-        coords = np.array([])
-        for image in self:
-            coords = np.append(coords, image.coordinates.flatten())
-        return coords
+        return np.concatenate([image.coordinates.flatten() for image in self])
 
     def set_coords(self, coords):
         """
-        Set the flat array of coordinates to the species in the images
+        Set the flat array of coordinates to the species in the images. The
+        coordinates of frozen images are not changed
 
         -----------------------------------------------------------------------
         Arguments:
@@ -398,7 +511,8 @@ class Images(Path):
         coords = coords.reshape((len(self), n_atoms, 3))
 
         for i, image in enumerate(self):
-            image.coordinates = coords[i]
+            if not image.frozen:
+                image.coordinates = coords[i]
 
         return None
 
@@ -545,17 +659,22 @@ class NEB:
 
     def _minimise(self, method, n_cores, etol, max_n=30) -> Any:
         """Minimise the energy of every image in the NEB"""
+        from autode.neb.optimisers import (
+            FIREBandOptimiser,
+            LBFGSBandOptimiser,
+        )
+
         logger.info(f"Minimising to ∆E < {etol:.4f} Ha on all NEB coordinates")
 
-        result = minimize(
-            total_energy,
-            x0=self.images.coords(),
-            method="L-BFGS-B",
-            jac=derivative,
-            args=(self.images, method, n_cores, True),
-            tol=etol,
-            options={"maxfun": max_n},
+        optimiser_type = {
+            "lbfgs": LBFGSBandOptimiser,
+            "fire": FIREBandOptimiser,
+        }[Config.neb_optimiser]
+
+        optimiser = optimiser_type(
+            maxiter=max_n, etol=etol, max_step=Config.neb_max_step
         )
+        result = optimiser.run(self.images, method, n_cores)
 
         logger.info(f"NEB path energy = {result.fun:.5f} Ha, {result.message}")
         return result
@@ -694,12 +813,20 @@ class NEB:
                 etol_per_image.to("Ha")
             )  # use float for scipy
 
+        self.images.freeze_tol = Config.neb_freeze_tol
         result = self._minimise(
             method, n_cores, etol=etol_per_image * len(self.images)
         )
 
         # Set the optimised coordinates for all the images
         self.images.set_coords(result.x)
+        for image in self.images:
+            image.frozen = False
+
+        logger.info(
+            f"NEB required {self.images.n_evaluations} image energy and "
+            f"gradient evaluations"
+        )
         self.print_geometries(name=f"{name_prefix}neb_optimised")
 
         # and save the plot
@@ -723,7 +850,9 @@ class NEB:
 
     def idpp_relax(self) -> None:
         """
-        Relax the NEB using the image dependent pair potential
+        Relax the NEB using the image dependent pair potential, evaluated on
+        all the images at once. Pairs of atoms are limited to those within
+        Config.idpp_cutoff, if set
 
         -----------------------------------------------------------------------
         See Also:
@@ -731,30 +860,10 @@ class NEB:
         """
         logger.info(f"Minimising NEB with IDPP potential")
 
-        images = self.images.copy()
-        images.min_k = images.max_k = ForceConstant(0.1, units="Ha / Å^2")
-        idpp = IDPP(images=images)
-
-        for i, image in enumerate(images):
-            image.energy = idpp(image)
-            image.gradient = idpp.grad(image)
-
-            # Initial and final images are fixed, with zero gradient
-            if i == 0 or i == len(images) - 1:
-                image.gradient[:] = 0.0
-
-        result = minimize(
-            total_energy,
-            x0=images.coords(),
-            method="L-BFGS-B",
-            jac=derivative,
-            args=(images, idpp, Config.n_cores, False),
-            options={"gtol": 0.01},
-        )
-
-        logger.info(f"IDPP minimisation successful: {result.success}")
+        idpp = IDPP(images=self.images, cutoff=Config.idpp_cutoff)
+        x = idpp.relax(np.array([image.coordinates for image in self.images]))
 
-        self.images.set_coords(result.x)
+        self.images.set_coords(x.flatten())
         return None
 
     def _max_atom_distance_between_images(
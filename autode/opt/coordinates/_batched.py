@@ -0,0 +1,538 @@
+"""
+Batched evaluation of primitive internal coordinates and their derivatives.
+Primitives are grouped by type and the values, first (Wilson B matrix) and
+optionally second derivatives of each group evaluated in a single pass over
+NumPy arrays, using hyper-dual numbers that hold the derivatives of every
+primitive in the group with respect to the Cartesian components of its atoms.
+Formulae are identical to those in autode.opt.coordinates.primitives, the
+per-primitive hyper-dual evaluation of which is the reference.
+"""
+import numpy as np
+from typing import Any, Optional, List, Tuple, Dict, Sequence, TYPE_CHECKING
+from scipy.sparse import csr_matrix
+from autode.opt.coordinates._autodiff import DerivativeOrder
+from autode.opt.coordinates.primitives import (
+    Primitive,
+    PrimitiveDistance,
+    ConstrainedPrimitiveDistance,
+    PrimitiveInverseDistance,
+    PrimitiveBondAngle,
+    ConstrainedPrimitiveBondAngle,
+    PrimitiveDihedralAngle,
+    PrimitiveImproperDihedral,
+    PrimitiveLinearAngle,
+    PrimitiveDummyLinearAngle,
+    LinearBendType,
+)
+
+if TYPE_CHECKING:
+    from autode.opt.coordinates import CartesianCoordinates
+
+
+class BatchedHyperDual:
+    """
+    Set of m hyper-dual numbers, each a function of k variables, with values
+    of shape (m,), first derivatives (m, k) and second derivatives (m, k, k)
+    """
+
+    def __init__(
+        self,
+        value: np.ndarray,
+        first_der: Optional[np.ndarray] = None,
+        second_der: Optional[np.ndarray] = None,
+    ):
+        self.value = value
+        self.first_der = first_der
+        self.second_der = second_der
+
+    @classmethod
+    def variables(
+        cls, values: np.ndarray, order: DerivativeOrder
+    ) -> List["BatchedHyperDual"]:
+        """
+        Independent variables from an array of shape (m, k), i.e. the k
+        variables of each of m functions
+
+        -----------------------------------------------------------------------
+        Arguments:
+            values: Values of the variables
+
+            order: Highest order of derivatives to be propagated
+
+        Returns:
+            (list[BatchedHyperDual]): k variables
+        """
+        m, k = values.shape
+        variables = []
+
+        for i in range(k):
+            first_der, second_der = None, None
+
+            if order.value >= 1:
+                first_der = np.zeros(shape=(m, k))
+                first_der[:, i] = 1.0
+
+            if order.value >= 2:
+                second_der = np.zeros(shape=(m, k, k))
+
+            variables.append(cls(values[:, i], first_der, second_der))
+
+        return variables
+
+    @classmethod
+    def constant(
+        cls, values: np.ndarray, like: "BatchedHyperDual"
+    ) -> "BatchedHyperDual":
+        """Constants with zero derivatives, with the same shape as another"""
+        return cls(
+            values,
+            None if like.first_der is None else np.zeros_like(like.first_der),
+            (
+                None
+                if like.second_der is None
+                else np.zeros_like(like.second_der)
+            ),
+        )
+
+    def apply(
+        self, f: np.ndarray, df: np.ndarray, d2f: np.ndarray
+    ) -> "BatchedHyperDual":
+        """
+        Apply a function to these numbers given its value, first and second
+        derivative evaluated at the value of each number
+        """
+        first_der, second_der = None, None
+
+        if self.first_der is not None:
+            first_der = df[:, None] * self.first_der
+
+        if self.second_der is not None:
+            second_der = df[:, None, None] * self.second_der + d2f[
+                :, None, None
+            ] * np.einsum("mi,mj->mij", self.first_der, self.first_der)
+
+        return BatchedHyperDual(f, first_der, second_der)
+
+    def __add__(self, other) -> "BatchedHyperDual":
+        if not isinstance(other, BatchedHyperDual):
+            return BatchedHyperDual(
+                self.value + other, self.first_der, self.second_der
+            )
+
+        return BatchedHyperDual(
+            self.value + other.value,
+            _sum_or_none(self.first_der, other.first_der),
+            _sum_or_none(self.second_der, other.second_der),
+        )
+
+    def __radd__(self, other) -> "BatchedHyperDual":
+        return self.__add__(other)
+
+    def __neg__(self) -> "BatchedHyperDual":
+        return self * -1.0
+
+    def __sub__(self, other) -> "BatchedHyperDual":
+        return self.__add__(-other)
+
+    def __rsub__(self, other) -> "BatchedHyperDual":
+        return (-self).__add__(other)
+
+    def __mul__(self, other) -> "BatchedHyperDual":
+        if not isinstance(other, BatchedHyperDual):
+            c = np.asarray(other, dtype=float)
+            return BatchedHyperDual(
+                self.value * c,
+                None if self.first_der is None else _scale(self.first_der, c),
+                (
+                    None
+                    if self.second_der is None
+                    else _scale(self.second_der, c)
+                ),
+            )
+
+        a, b = self, other
+        first_der, second_der = None, None
+
+        if a.first_der is not None and b.first_der is not None:
+            first_der = _scale(a.first_der, b.value) + _scale(
+                b.first_der, a.value
+            )
+
+        if a.second_der is not None and b.second_der is not None:
+            outer = np.einsum("mi,mj->mij", a.first_der, b.first_der)
+            second_der = (
+                _scale(a.second_der, b.value)
+                + _scale(b.second_der, a.value)
+                + outer
+                + outer.transpose(0, 2, 1)
+            )
+
+        return BatchedHyperDual(a.value * b.value, first_der, second_der)
+
+    def __rmul__(self, other) -> "BatchedHyperDual":
+        return self.__mul__(other)
+
+    def __truediv__(self, other) -> "BatchedHyperDual":
+        if not isinstance(other, BatchedHyperDual):
+            return self * (1.0 / np.asarray(other, dtype=float))
+
+        return self * other.reciprocal()
+
+    def reciprocal(self) -> "BatchedHyperDual":
+        """1 / x"""
+        x = self.value
+        return self.apply(1.0 / x, -1.0 / x**2, 2.0 / x**3)
+
+    def sqrt(self) -> "BatchedHyperDual":
+        """√x"""
+        f = np.sqrt(self.value)
+        return self.apply(f, 0.5 / f, -0.25 / f**3)
+
+    def acos(self) -> "BatchedHyperDual":
+        """arccos(x), for -1 < x < 1"""
+        x = self.value
+        return self.apply(
+            np.arccos(x),
+            -1.0 / np.sqrt(1.0 - x**2),
+            -x / (1.0 - x**2) ** 1.5,
+        )
+
+    @staticmethod
+    def atan2(
+        y: "BatchedHyperDual", x: "BatchedHyperDual"
+    ) -> "BatchedHyperDual":
+        """atan2(y, x) of two sets of hyper-dual numbers"""
+        r_sq = x.value**2 + y.value**2
+        df_dy, df_dx = x.value / r_sq, -y.value / r_sq
+
+        first_der, second_der = None, None
+        if y.first_der is not None and x.first_der is not None:
+            first_der = _scale(y.first_der, df_dy) + _scale(x.first_der, df_dx)
+
+        if y.second_der is not None and x.second_der is not None:
+            d2f_dy2 = -2.0 * x.value * y.value / r_sq**2
+            d2f_dxdy = (y.value**2 - x.value**2) / r_sq**2
+
+            xx = np.einsum("mi,mj->mij", x.first_der, x.first_der)
+            yy = np.einsum("mi,mj->mij", y.first_der, y.first_der)
+            xy = np.einsum("mi,mj->mij", x.first_der, y.first_der)
+
+            second_der = (
+                _scale(y.second_der, df_dy)
+                + _scale(x.second_der, df_dx)
+                + _scale(yy - xx, d2f_dy2)
+                + _scale(xy + xy.transpose(0, 2, 1), d2f_dxdy)
+            )
+
+        return BatchedHyperDual(
+            np.arctan2(y.value, x.value), first_der, second_der
+        )
+
+
+class BatchedVector3D:
+    """3D vectors with components that are batched hyper-dual numbers"""
+
+    def __init__(self, items: Sequence[BatchedHyperDual]):
+        self._data = list(items)
+        assert len(self._data) == 3
+
+    def __add__(self, other: "BatchedVector3D") -> "BatchedVector3D":
+        return BatchedVector3D(
+            [a + b for a, b in zip(self._data, other._data)]
+        )
+
+    def __sub__(self, other: "BatchedVector3D") -> "BatchedVector3D":
+        return BatchedVector3D(
+            [a - b for a, b in zip(self._data, other._data)]
+        )
+
+    def __mul__(self, other) -> "BatchedVector3D":
+        return BatchedVector3D([a * other for a in self._data])
+
+    def __truediv__(self, other) -> "BatchedVector3D":
+        if isinstance(other, BatchedHyperDual):
+            return self * other.reciprocal()
+
+        return self * (1.0 / other)
+
+    def dot(self, other: "BatchedVector3D") -> BatchedHyperDual:
+        a, b = self._data, other._data
+        return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+    def norm(self) -> BatchedHyperDual:
+        return self.dot(self).sqrt()
+
+    def cross(self, other: "BatchedVector3D") -> "BatchedVector3D":
+        a, b = self._data, other._data
+        return BatchedVector3D(
+            [
+                a[1] * b[2] - a[2] * b[1],
+                a[2] * b[0] - a[0] * b[2],
+                a[0] * b[1] - a[1] * b[0],
+            ]
+        )
+
+
+class PrimitiveDerivatives:
+    """Values and derivatives of a set of primitive internal coordinates"""
+
+    def __init__(self, n_primitives: int, n_cartesian: int):
+        self.values = np.zeros(shape=(n_primitives,))
+        self.n_cartesian = n_cartesian
+
+        self._rows: List[np.ndarray] = []
+        self._cols: List[np.ndarray] = []
+        self._data: List[np.ndarray] = []
+
+        # Dense blocks of second derivatives over (cartesian idxs, block)
+        self._second_ders: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def B(self) -> csr_matrix:
+        """
+        Sparse Wilson B matrix, with shape (n_primitives, n_cartesian)
+
+        -----------------------------------------------------------------------
+        Returns:
+            (scipy.sparse.csr_matrix):
+        """
+        shape = (len(self.values), self.n_cartesian)
+        if len(self._data) == 0:
+            return csr_matrix(shape)
+
+        return csr_matrix(
+            (
+                np.concatenate(self._data),
+                (np.concatenate(self._rows), np.concatenate(self._cols)),
+            ),
+            shape=shape,
+        )
+
+    def second_derivative(self, idx: int) -> np.ndarray:
+        """
+        Second derivatives of a primitive with respect to the Cartesian
+        coordinates, evaluated with DerivativeOrder.second
+
+        -----------------------------------------------------------------------
+        Arguments:
+            idx: Index of the primitive
+
+        Returns:
+            (np.ndarray): Matrix with shape (n_cartesian, n_cartesian)
+        """
+        if idx not in self._second_ders:
+            raise ValueError(f"No second derivatives for primitive {idx}")
+
+        cart_idxs, block = self._second_ders[idx]
+        derivs = np.zeros(shape=(self.n_cartesian, self.n_cartesian))
+        np.add.at(derivs, np.ix_(cart_idxs, cart_idxs), block)
+
+        return derivs
+
+    def _add(
+        self, idxs: np.ndarray, cart_idxs: np.ndarray, res: BatchedHyperDual
+    ) -> None:
+        """Add the results for primitives with indexes idxs, which are
+        functions of Cartesian components cart_idxs with shape (m, k)"""
+        self.values[idxs] = res.value
+
+        if res.first_der is not None:
+            self._rows.append(np.repeat(idxs, cart_idxs.shape[1]))
+            self._cols.append(cart_idxs.ravel())
+            self._data.append(res.first_der.ravel())
+
+        if res.second_der is not None:
+            for i, idx in enumerate(idxs):
+                self._second_ders[int(idx)] = (cart_idxs[i], res.second_der[i])
+
+        return None
+
+    def _add_by_primitive(
+        self,
+        idx: int,
+        primitive: Primitive,
+        x: np.ndarray,
+        order: DerivativeOrder,
+    ) -> None:
+        """Add the results for a primitive evaluated on its own"""
+        self.values[idx] = primitive(x)
+
+        if order.value >= 1:
+            derivs = primitive.derivative(x)
+            (cols,) = np.nonzero(derivs)
+            self._rows.append(np.full_like(cols, idx))
+            self._cols.append(cols)
+            self._data.append(derivs[cols])
+
+        if order.value >= 2:
+            all_idxs = np.arange(self.n_cartesian)
+            self._second_ders[idx] = (all_idxs, primitive.second_derivative(x))
+
+        return None
+
+
+def _sum_or_none(a: Optional[np.ndarray], b: Optional[np.ndarray]):
+    return None if a is None or b is None else a + b
+
+
+def _scale(arr: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Multiply an array of shape (m, ...) by c with shape (m,) or ()"""
+    c = np.asarray(c, dtype=float)
+    return arr * c.reshape(c.shape + (1,) * (arr.ndim - c.ndim))
+
+
+def _distance(m, o) -> BatchedHyperDual:
+    """|x_m - x_o|"""
+    return (m - o).norm()
+
+
+def _inverse_distance(m, o) -> BatchedHyperDual:
+    """1 / |x_m - x_o|"""
+    return (m - o).norm().reciprocal()
+
+
+def _bond_angle(m, o, n) -> BatchedHyperDual:
+    """m - o - n angle"""
+    u, v = m - o, n - o
+    return (u.dot(v) / (u.norm() * v.norm())).acos()
+
+
+def _dihedral(m, o, p, n) -> BatchedHyperDual:
+    """Dihedral m-o-p-n"""
+    u_1, u_2, u_3 = o - m, p - o, n - p
+    v1 = u_2.cross(u_3)
+    v2 = u_1.cross(u_2)
+    v3 = u_1 * u_2.norm()
+    return BatchedHyperDual.atan2(v3.dot(v1), v2.dot(v1))
+
+
+def _linear_bend(m, o, n, r, axis: LinearBendType) -> BatchedHyperDual:
+    """Linear bend m-o-n against a reference point r"""
+    o_m, o_n, o_r = m - o, n - o, r - o
+
+    u = o_m.cross(o_r)
+    u = u / u.norm()
+
+    if axis == LinearBendType.BEND:
+        return u.dot(o_n) / o_n.norm()
+
+    return u.dot(o_n.cross(o_m)) / (o_n.norm() * o_m.norm())
+
+
+_distance_types = (ConstrainedPrimitiveDistance, PrimitiveDistance)
+_angle_types = (ConstrainedPrimitiveBondAngle, PrimitiveBondAngle)
+_dihedral_types = (PrimitiveDihedralAngle, PrimitiveImproperDihedral)
+
+
+def _group_key(primitive: Primitive) -> Optional[tuple]:
+    """
+    Key of the group a primitive is evaluated in and its atom indexes, or
+    None if it must be evaluated on its own. Only exact types are grouped, as
+    a subclass may override the evaluation
+    """
+    p: Any = primitive
+    p_type = type(p)
+
+    if p_type in _distance_types:
+        return _distance, (p.i, p.j)
+
+    if p_type is PrimitiveInverseDistance:
+        return _inverse_distance, (p.i, p.j)
+
+    if p_type in _angle_types:
+        return _bond_angle, (p.m, p.o, p.n)
+
+    if p_type in _dihedral_types:
+        return _dihedral, (p.m, p.o, p.p, p.n)
+
+    if p_type is PrimitiveLinearAngle:
+        return (_linear_bend, p.axis), (p.m, p.o, p.n, p.r)
+
+    if p_type is PrimitiveDummyLinearAngle:
+        return (_linear_bend, p.axis, "dummy"), (p.m, p.o, p.n)
+
+    return None
+
+
+def evaluate_primitives(
+    primitives: Sequence[Primitive],
+    x: "CartesianCoordinates",
+    deriv_order: DerivativeOrder = DerivativeOrder.first,
+) -> PrimitiveDerivatives:
+    """
+    Evaluate the values and derivatives of a set of primitive internal
+    coordinates with respect to Cartesian coordinates
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        primitives: Primitive internal coordinates
+
+        x: Cartesian coordinates, with shape (3N,) or (N, 3)
+
+        deriv_order: Highest order of derivatives to evaluate
+
+    Returns:
+        (PrimitiveDerivatives):
+    """
+    _x = np.asarray(x, dtype=float).ravel()
+    result = PrimitiveDerivatives(len(primitives), n_cartesian=len(_x))
+
+    groups: Dict[tuple, List[Tuple[int, tuple]]] = {}
+    for idx, primitive in enumerate(primitives):
+        key = _group_key(primitive)
+
+        if key is None:
+            result._add_by_primitive(idx, primitive, _x, deriv_order)
+        else:
+            groups.setdefault(key[0], []).append((idx, key[1]))
+
+    for func, members in groups.items():
+        idxs = np.array([idx for idx, _ in members], dtype=int)
+        atom_idxs = np.array([a for _, a in members], dtype=int)
+
+        # Flat Cartesian indexes of the atoms in each primitive, (m, 3 n_atoms)
+        cart_idxs = (3 * atom_idxs[:, :, None] + np.arange(3)).reshape(
+            len(members), -1
+        )
+        variables = BatchedHyperDual.variables(_x[cart_idxs], deriv_order)
+        vecs = [
+            BatchedVector3D(variables[i : i + 3])
+            for i in range(0, len(variables), 3)
+        ]
+
+        if isinstance(func, tuple):
+            dummies = func[2:] == ("dummy",)
+            if dummies:
+                vecs.append(_dummy_atoms(primitives, idxs, _x, variables[0]))
+
+            res = func[0](*vecs, axis=func[1])
+        else:
+            res = func(*vecs)
+
+        result._add(idxs, cart_idxs, res)
+
+    return result
+
+
+def _dummy_atoms(
+    primitives: Sequence[Primitive],
+    idxs: np.ndarray,
+    x: np.ndarray,
+    like: BatchedHyperDual,
+) -> BatchedVector3D:
+    """Fixed positions of the dummy atoms of a set of linear bends, which are
+    placed the first time each primitive is evaluated"""
+    coords = np.zeros(shape=(len(idxs), 3))
+
+    for i, idx in enumerate(idxs):
+        primitive = primitives[idx]
+        assert isinstance(primitive, PrimitiveDummyLinearAngle)
+
+        if primitive._vec_r is None:
+            primitive._vec_r = primitive._get_dummy_atom(x)
+
+        coords[i] = [float(c) for c in primitive._vec_r._data]
+
+    return BatchedVector3D(
+        [BatchedHyperDual.constant(coords[:, k], like) for k in range(3)]
+    )
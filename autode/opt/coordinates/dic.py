@@ -17,7 +17,7 @@ summarised below:
 """
 import numpy as np
 from time import time
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Tuple, TYPE_CHECKING
 
 from autode.geom import proj
 from autode.log import logger
@@ -29,6 +29,7 @@ from autode.opt.coordinates.internals import (
 from autode.exceptions import CoordinateTransformFailed
 
 if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
     from autode.opt.coordinates import CartesianCoordinates, OptCoordinates
     from autode.values import Gradient
     from autode.hessians import Hessian
@@ -70,25 +71,21 @@ class DIC(InternalCoordinates):  # lgtm [py/missing-equals]
         Returns:
             (np.ndarray): U
         """
-        # calculate spectroscopic G matrix
-        B = primitives.get_B(x)
-        G = np.dot(B, B.T)
-        lambd, u = np.linalg.eigh(G)
+        B = primitives.get_sparse_B(x)
+        lambd, u = _nonredundant_eigenpairs(B)
 
         # Form a transform matrix from the primitive internals by removing the
         # redundant subspace comprised of small eigenvalues. This forms a set
         # of 3N - 6 non-redundant internals for a system of N atoms
-        idxs = np.where(np.abs(lambd) > 1e-10)[0]
-
-        if len(idxs) < x.expected_number_of_dof:
+        if len(lambd) < x.expected_number_of_dof:
             raise RuntimeError(
                 "Failed to create a complete set of delocalised internal "
-                f"coordinates. {len(idxs)} < 3 N_atoms - 6. Likely due to "
+                f"coordinates. {len(lambd)} < 3 N_atoms - 6. Likely due to "
                 f"missing primitives"
             )
 
-        logger.info(f"Removed {len(lambd) - len(idxs)} redundant vectors")
-        return u[:, idxs]
+        logger.info(f"Removed {B.shape[0] - len(lambd)} redundant vectors")
+        return u
 
     @classmethod
     def from_cartesian(
@@ -126,7 +123,7 @@ class DIC(InternalCoordinates):  # lgtm [py/missing-equals]
 
         dic.U = U  # Transform matrix primitives -> non-redundant
 
-        dic.B = np.matmul(U.T, primitives.get_B(x))
+        dic.B = _u_transpose_b(U, primitives.get_sparse_B(x))
         dic.B_T_inv = np.linalg.pinv(dic.B)
         dic._q = q.copy()
         dic._x = x.copy()
@@ -246,7 +243,8 @@ class DIC(InternalCoordinates):  # lgtm [py/missing-equals]
 
                 # Rebuild the B matrix every 10 steps
                 if i % 10 == 0:
-                    self.B = np.matmul(self.U.T, self.primitives.get_B(x_k))
+                    B = self.primitives.get_sparse_B(x_k)
+                    self.B = _u_transpose_b(self.U, B)
                     self.B_T_inv = np.linalg.pinv(self.B)
 
                 rms_s_old = rms_s
@@ -288,7 +286,7 @@ class DIC(InternalCoordinates):  # lgtm [py/missing-equals]
 
         q_k = self.primitives.close_to(x_k, q_init)
         s_k = np.matmul(self.U.T, q_k)
-        self.B = np.matmul(self.U.T, self.primitives.get_B(x_k))
+        self.B = _u_transpose_b(self.U, self.primitives.get_sparse_B(x_k))
         self.B_T_inv = np.linalg.pinv(self.B)
 
         self[:] = s_k
@@ -513,6 +511,44 @@ class DICWithConstraints(DIC):
         return None
 
 
+def _nonredundant_eigenpairs(
+    B: "csr_matrix", tol: float = 1e-10
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Eigenvalues (λ > tol) and eigenvectors of G = B B^T, in ascending order
+    of eigenvalue. The non-zero eigenvalues of G are those of B^T B, which
+    is 3N x 3N rather than n_primitives x n_primitives, so if there are more
+    primitives than Cartesian components the eigenvectors are obtained from
+    those of B^T B (v) as u = B v / √λ
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        B: Wilson B matrix, with shape (n_primitives, 3N)
+
+        tol: Eigenvalues below which eigenvectors are redundant
+
+    Returns:
+        (tuple(np.ndarray, np.ndarray)): λ with shape (n,) and u with shape
+                                         (n_primitives, n)
+    """
+    n_primitives, n_cartesian = B.shape
+
+    if n_primitives <= n_cartesian:
+        lambd, u = np.linalg.eigh((B @ B.T).toarray())
+        idxs = np.where(np.abs(lambd) > tol)[0]
+        return lambd[idxs], u[:, idxs]
+
+    lambd, v = np.linalg.eigh((B.T @ B).toarray())
+    idxs = np.where(lambd > tol)[0]
+    u = (B @ v[:, idxs]) / np.sqrt(lambd[idxs])
+    return lambd[idxs], np.asarray(u)
+
+
+def _u_transpose_b(U: np.ndarray, B: "csr_matrix") -> np.ndarray:
+    """U^T B for a dense U and sparse B"""
+    return np.asarray((B.T @ U).T)
+
+
 def _schmidt_orthogonalise(arr: np.ndarray, *indexes: int) -> np.ndarray:
     """
     Perform Schmidt orthogonalization to generate orthogonal vectors
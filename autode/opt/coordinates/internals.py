@@ -15,6 +15,8 @@ from typing import Any, Optional, Type, List, TYPE_CHECKING
 from abc import ABC, abstractmethod
 from autode.values import Angle, Distance
 from autode.opt.coordinates.base import OptCoordinates
+from autode.opt.coordinates._autodiff import DerivativeOrder
+from autode.opt.coordinates._batched import evaluate_primitives
 from autode.opt.coordinates.primitives import (
     PrimitiveInverseDistance,
     Primitive,
@@ -29,6 +31,7 @@ from autode.opt.coordinates.primitives import (
 )
 
 if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
     from autode.species import Species
     from autode.opt.coordinates.cartesian import CartesianCoordinates
     from autode.opt.coordinates.primitives import (
@@ -168,7 +171,8 @@ class PIC(list, ABC):
         if len(self) == 0:
             self._populate_all(x)
 
-        return np.array([q(x) for q in self])
+        res = evaluate_primitives(self, x, deriv_order=DerivativeOrder.zeroth)
+        return res.values
 
     @abstractmethod
     def _populate_all(self, x: np.ndarray) -> None:
@@ -176,6 +180,21 @@ class PIC(list, ABC):
 
     def get_B(self, x: np.ndarray) -> np.ndarray:
         """Calculate the Wilson B matrix"""
+        return self.get_sparse_B(x).toarray()
+
+    def get_sparse_B(self, x: np.ndarray) -> "csr_matrix":
+        """
+        Calculate the Wilson B matrix as a sparse matrix. Primitives of the
+        same type are evaluated together, see
+        autode.opt.coordinates._batched.evaluate_primitives
+
+        -----------------------------------------------------------------------
+        Arguments:
+            x: Cartesian coordinates
+
+        Returns:
+            (scipy.sparse.csr_matrix): Matrix with shape (n_primitives, 3N)
+        """
 
         if len(self) == 0:
             raise ValueError(
@@ -183,14 +202,8 @@ class PIC(list, ABC):
                 "primitive internal coordinates"
             )
 
-        cart_coords = x.ravel()
-
-        B = np.zeros(shape=(len(self), len(cart_coords)))
-
-        for i, primitive in enumerate(self):
-            B[i] = primitive.derivative(x=cart_coords)
-
-        return B
+        res = evaluate_primitives(self, x, deriv_order=DerivativeOrder.first)
+        return res.B
 
     @staticmethod
     def _are_all_primitive_coordinates(args: tuple) -> bool:
@@ -327,23 +340,30 @@ class AnyPIC(PIC):
 
         # otherwise get all atoms in 4 A radius except a, b, c
         else:
+            idxs = np.arange(mol.n_atoms)
+            dists = mol.distances([(b, idx) for idx in idxs])
+            max_dist = float(Distance(dist_thresh).to("Å"))
             near_atoms = [
-                idx
-                for idx in range(mol.n_atoms)
-                if mol.distance(b, idx) < dist_thresh and idx not in (a, b, c)
+                int(idx)
+                for idx in idxs[dists < max_dist]
+                if idx not in (a, b, c)
             ]
 
+        if len(near_atoms) == 0:
+            return None
+
         # get atoms closest to perpendicular
+        i_b_a = mol.angles([(atom, b, a) for atom in near_atoms])
+        i_b_c = mol.angles([(atom, b, c) for atom in near_atoms])
+
         deviations_from_90 = {}
-        for atom in near_atoms:
-            i_b_a = mol.angle(atom, b, a)
-            if i_b_a > _lin_thresh or i_b_a < (np.pi - _lin_thresh):
+        for atom, angle_a, angle_c in zip(near_atoms, i_b_a, i_b_c):
+            if angle_a > _lin_thresh or angle_a < (np.pi - _lin_thresh):
                 continue
-            i_b_c = mol.angle(atom, b, c)
-            if i_b_c > _lin_thresh or i_b_c < (np.pi - _lin_thresh):
+            if angle_c > _lin_thresh or angle_c < (np.pi - _lin_thresh):
                 continue
-            deviation_a = abs(i_b_a - np.pi / 2)
-            deviation_b = abs(i_b_c - np.pi / 2)
+            deviation_a = abs(angle_a - np.pi / 2)
+            deviation_b = abs(angle_c - np.pi / 2)
             avg_dev = (deviation_a + deviation_b) / 2
             deviations_from_90[atom] = avg_dev
 
@@ -365,51 +385,49 @@ class AnyPIC(PIC):
         """
         assert mol.graph is not None
 
-        for o in range(mol.n_atoms):
-            for n, m in itertools.combinations(mol.graph.neighbors(o), r=2):
-                if mol.angle(m, o, n) < _lin_thresh:
-                    self.add(PrimitiveBondAngle(m=m, o=o, n=n))
-                else:
-                    # If central atom is connected to another atom, then the
-                    # linear angle is skipped and instead an out-of-plane
-                    # (improper dihedral) coordinate is used
-                    r = self._get_ref_for_linear_angle(
-                        mol, m, o, n, bonded=True
-                    )
-                    if r is not None:
-                        self.add(PrimitiveImproperDihedral(m, r, o, n))
-                        continue
+        triples = [
+            (m, o, n)
+            for o in range(mol.n_atoms)
+            for n, m in itertools.combinations(mol.graph.neighbors(o), r=2)
+        ]
+        angles = mol.angles(triples) if len(triples) > 0 else []
 
-                    # Otherwise, we use a nearby (< 4.0 A) reference atom to
-                    # define two orthogonal linear bends
-                    r = self._get_ref_for_linear_angle(
-                        mol, m, o, n, bonded=False
+        for (m, o, n), angle in zip(triples, angles):
+            if angle < _lin_thresh:
+                self.add(PrimitiveBondAngle(m=m, o=o, n=n))
+            else:
+                # If central atom is connected to another atom, then the
+                # linear angle is skipped and instead an out-of-plane
+                # (improper dihedral) coordinate is used
+                r = self._get_ref_for_linear_angle(mol, m, o, n, bonded=True)
+                if r is not None:
+                    self.add(PrimitiveImproperDihedral(m, r, o, n))
+                    continue
+
+                # Otherwise, we use a nearby (< 4.0 A) reference atom to
+                # define two orthogonal linear bends
+                r = self._get_ref_for_linear_angle(mol, m, o, n, bonded=False)
+                if r is not None:
+                    self.add(
+                        PrimitiveLinearAngle(m, o, n, r, LinearBendType.BEND)
                     )
-                    if r is not None:
-                        self.add(
-                            PrimitiveLinearAngle(
-                                m, o, n, r, LinearBendType.BEND
-                            )
-                        )
-                        self.add(
-                            PrimitiveLinearAngle(
-                                m, o, n, r, LinearBendType.COMPLEMENT
-                            )
+                    self.add(
+                        PrimitiveLinearAngle(
+                            m, o, n, r, LinearBendType.COMPLEMENT
                         )
+                    )
 
-                    # For completely linear molecules (CO2), there will be no such
-                    # reference atoms, so use dummy atoms instead
-                    else:
-                        self.add(
-                            PrimitiveDummyLinearAngle(
-                                m, o, n, LinearBendType.BEND
-                            )
-                        )
-                        self.add(
-                            PrimitiveDummyLinearAngle(
-                                m, o, n, LinearBendType.COMPLEMENT
-                            )
+                # For completely linear molecules (CO2), there will be no such
+                # reference atoms, so use dummy atoms instead
+                else:
+                    self.add(
+                        PrimitiveDummyLinearAngle(m, o, n, LinearBendType.BEND)
+                    )
+                    self.add(
+                        PrimitiveDummyLinearAngle(
+                            m, o, n, LinearBendType.COMPLEMENT
                         )
+                    )
 
         return None
 
@@ -478,18 +496,24 @@ class AnyPIC(PIC):
                     continue
             return None
 
+        triples = [
+            (a, b, c)
+            for b in range(mol.n_atoms)
+            for a, c in itertools.combinations(mol.graph.neighbors(b), r=2)
+        ]
+        angles = mol.angles(triples) if len(triples) > 0 else []
+
         linear_chains: List[list] = []
-        for b in range(mol.n_atoms):
-            for a, c in itertools.combinations(mol.graph.neighbors(b), r=2):
-                if any(
-                    a in chain and b in chain and c in chain
-                    for chain in linear_chains
-                ):
-                    continue
-                if mol.angle(a, b, c) > _lin_thresh:
-                    chain = [a, b, c]
-                    extend_chain(chain)
-                    linear_chains.append(chain)
+        for (a, b, c), angle in zip(triples, angles):
+            if any(
+                a in chain and b in chain and c in chain
+                for chain in linear_chains
+            ):
+                continue
+            if angle > _lin_thresh:
+                chain = [a, b, c]
+                extend_chain(chain)
+                linear_chains.append(chain)
 
         return linear_chains
 
@@ -546,15 +570,22 @@ def _connect_graph_for_species(mol: "Species") -> None:
 
     # join hydrogen bonds
     h_bond_x = ["N", "O", "F", "P", "S", "Cl"]
-    for i, j in itertools.combinations(range(mol.n_atoms), r=2):
+    h_bond_pairs = [
+        (i, j)
+        for i, j in itertools.combinations(range(mol.n_atoms), r=2)
         if (
             mol.atoms[i].label in h_bond_x
             and mol.atoms[j].label == "H"
             or mol.atoms[j].label in h_bond_x
             and mol.atoms[i].label == "H"
-        ):
-            vdw_sum = mol.atoms[i].vdw_radius + mol.atoms[j].vdw_radius
-            if mol.distance(i, j) < 0.9 * vdw_sum:
+        )
+    ]
+    if len(h_bond_pairs) > 0:
+        vdw_radii = [float(atom.vdw_radius) for atom in mol.atoms]
+        dists = mol.distances(h_bond_pairs)
+
+        for (i, j), dist in zip(h_bond_pairs, dists):
+            if dist < 0.9 * (vdw_radii[i] + vdw_radii[j]):
                 if not mol.graph.has_edge(i, j):
                     mol.graph.add_edge(i, j, pi=False, active=False)
 
@@ -562,12 +593,8 @@ def _connect_graph_for_species(mol: "Species") -> None:
     if not mol.graph.is_connected:
         components = mol.graph.connected_components()
         for comp_i, comp_j in itertools.combinations(components, r=2):
-            min_dist = float("inf")
-            min_pair = (-1, -1)
-            for i, j in itertools.product(list(comp_i), list(comp_j)):
-                if mol.distance(i, j) < min_dist:
-                    min_dist = mol.distance(i, j)
-                    min_pair = (i, j)
+            pairs = list(itertools.product(list(comp_i), list(comp_j)))
+            min_pair = pairs[int(np.argmin(mol.distances(pairs)))]
             mol.graph.add_edge(*min_pair, pi=False, active=False)
 
     assert mol.graph.is_connected, "Unknown error in connecting graph"
@@ -597,12 +624,6 @@ def _is_dihedral_well_defined(mol, a, b, c, d) -> bool:
         (bool): True if well-defined otherwise False
     """
     zero_angle_thresh = np.pi - _lin_thresh
-    is_linear_1 = (
-        mol.angle(a, b, c) > _lin_thresh
-        or mol.angle(a, b, c) < zero_angle_thresh
-    )
-    is_linear_2 = (
-        mol.angle(b, c, d) > _lin_thresh
-        or mol.angle(b, c, d) < zero_angle_thresh
-    )
-    return not (is_linear_1 or is_linear_2)
+    angles = mol.angles([(a, b, c), (b, c, d)])
+    is_linear = (angles > _lin_thresh) | (angles < zero_angle_thresh)
+    return not np.any(is_linear)
@@ -14,6 +14,7 @@ from autode.config import Config
 from autode.values import GradientRMS, PotentialEnergy, method_string, Distance
 from autode.opt.coordinates.base import OptCoordinates
 from autode.opt.optimisers.hessian_update import NullUpdate
+from autode.opt.optimisers.trajectory import BinaryTrajectory
 from autode.exceptions import CalculationException
 from autode.plotting import plot_optimiser_profile
 
@@ -48,6 +49,11 @@ class BaseOptimiser(ABC):
 class Optimiser(BaseOptimiser, ABC):
     """Abstract base class for an optimiser"""
 
+    # Suffix of the default trajectory file name. Binary trajectories store
+    # Cartesian coordinates, so optimisers in coordinates that cannot be
+    # converted to Cartesians must store the pickled coordinates in a .zip
+    _trajectory_suffix = f"_opt{BinaryTrajectory.ext}"
+
     def __init__(
         self,
         maxiter: int,
@@ -151,7 +157,7 @@ class Optimiser(BaseOptimiser, ABC):
             return None
 
         if name is None:
-            name = f"{self._species.name}_opt_trj.zip"
+            name = f"{self._species.name}{self._trajectory_suffix}"
 
         self._history.open(filename=name)
         self._history.save_opt_params(self.optimiser_params)
@@ -918,7 +924,9 @@ class OptimiserHistory:
     Sequential trajectory of coordinates with a maximum length for
     storage on memory. Shunts data to disk if trajectory file is
     opened, otherwise old coordinates more than the maximum number
-    are lost.
+    are lost. Trajectory files with a .trj extension are append-only
+    binary trajectories (see autode.opt.optimisers.trajectory), while
+    .zip files store the pickled coordinates
     """
 
     def __init__(self, maxlen: Optional[int] = 2) -> None:
@@ -927,6 +935,7 @@ class OptimiserHistory:
         self._maxlen = maxlen if maxlen is not None else float("inf")
         self._is_closed = False  # whether trajectory is open
         self._len = 0  # count of total number of coords
+        self._trj: Optional[BinaryTrajectory] = None  # binary storage
 
     @property
     def final(self):
@@ -966,6 +975,9 @@ class OptimiserHistory:
         if self._filename is None:
             return 0
 
+        if self._trj is not None:
+            return len(self._trj)
+
         with ZipFile(self._filename, "r") as file:
             names = file.namelist()
         n_coords = 0
@@ -983,14 +995,19 @@ class OptimiserHistory:
         Initialise the trajectory file and write it on disk.
 
         Args:
-            filename (str): The name of the trajectory file,
-                            should be .zip, and NOT a path
+            filename (str): The name of the trajectory file, should be
+                            .trj or .zip (the default), and NOT a path
         """
         if self._filename is not None:
             raise RuntimeError("Already initialised, cannot initialise again!")
 
         # filename should not be a path
         assert "\\" not in filename and "/" not in filename
+        if filename.lower().endswith(BinaryTrajectory.ext):
+            self._trj = BinaryTrajectory.create(filename)
+            self._filename = self._trj.dirname
+            return None
+
         if not filename.lower().endswith(".zip"):
             filename += ".zip"
 
@@ -1013,13 +1030,27 @@ class OptimiserHistory:
         Reload the state of the trajectory from a file
 
         Args:
-            filename: The name of the trajectory .zip file,
+            filename: The name of the trajectory .trj or .zip file,
                     could also be a relative path
 
         Returns:
 
         """
         trj = cls()
+        if filename.lower().endswith(BinaryTrajectory.ext):
+            trj._trj = BinaryTrajectory(filename)
+            trj._filename = trj._trj.dirname
+            trj._len = len(trj._trj)
+            trj._is_closed = True
+            try:
+                trj._memory.extend(trj._trj.load_object("memory"))
+            except FileNotFoundError:
+                trj._memory.extend(
+                    trj._trj[idx]
+                    for idx in range(max(trj._len - 2, 0), trj._len)
+                )
+            return trj
+
         if not filename.lower().endswith(".zip"):
             filename += ".zip"
         if not os.path.isfile(filename):
@@ -1054,6 +1085,10 @@ class OptimiserHistory:
 
     def clean_up(self):
         """Remove the disk file associated with this history"""
+        if self._trj is not None:
+            self._trj.remove()
+            return None
+
         os.remove(self._filename)
         return None
 
@@ -1069,6 +1104,16 @@ class OptimiserHistory:
         if self._filename is None:
             raise RuntimeError("File not opened - cannot store data")
 
+        if self._trj is not None:
+            try:
+                self._trj.save_object("opt_params", params)
+            except FileExistsError:
+                raise FileExistsError(
+                    "Optimiser parameters are already stored -"
+                    " cannot overwrite!"
+                )
+            return None
+
         # python's ZipFile does not allow overwriting files
         with ZipFile(self._filename, "a") as file:
             names = file.namelist()
@@ -1093,6 +1138,12 @@ class OptimiserHistory:
         if self._filename is None:
             raise RuntimeError("File not opened - cannot get data")
 
+        if self._trj is not None:
+            try:
+                return self._trj.load_object("opt_params")
+            except FileNotFoundError:
+                raise FileNotFoundError("Optimiser parameters are not found!")
+
         # python's ZipFile does not allow overwriting files
         with ZipFile(self._filename, "r") as file:
             names = file.namelist()
@@ -1124,6 +1175,11 @@ class OptimiserHistory:
             self._memory.append(coords)
             return None
 
+        if self._trj is not None:
+            self._trj.append(self._memory[0])
+            self._memory.append(coords)
+            return None
+
         n_stored = self._n_stored
         with ZipFile(self._filename, "a") as file:
             with file.open(f"coords_{n_stored}", "w") as fh:
@@ -1139,6 +1195,15 @@ class OptimiserHistory:
         if self._filename is None:
             raise RuntimeError("Cannot close - had no trajectory file!")
 
+        if self._trj is not None:
+            for coords in self._memory:
+                self._trj.append(coords)
+
+            # keep the coordinates in their own type, to restart from
+            self._trj.save_object("memory", list(self._memory), overwrite=True)
+            self._is_closed = True
+            return None
+
         idx = self._n_stored
         with ZipFile(self._filename, "a") as file:
             for coords in self._memory:
@@ -1187,6 +1252,9 @@ class OptimiserHistory:
         if self._filename is None:
             return None
 
+        if self._trj is not None:
+            return self._trj[item]
+
         with ZipFile(self._filename, "r") as file:
             with file.open(f"coords_{item}") as fh:
                 coords = pickle.load(fh)
@@ -1195,10 +1263,21 @@ class OptimiserHistory:
 
     def __iter__(self):
         """
-        Iterate through the coordinates of this trajectory
+        Iterate through the coordinates of this trajectory. Coordinates
+        in a binary trajectory are streamed from disk in chunks
         """
-        for i in range(len(self)):
-            yield self[i]
+        if self._trj is None:
+            for i in range(len(self)):
+                yield self[i]
+            return
+
+        n_on_disk = self._len - len(self._memory)
+        for i, coords in enumerate(self._trj.frames()):
+            if i >= n_on_disk:
+                break
+            yield coords
+
+        yield from self._memory
 
     def __reversed__(self):
         """
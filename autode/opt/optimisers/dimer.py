@@ -30,6 +30,9 @@ if TYPE_CHECKING:
 class Dimer(Optimiser):
     """Dimer spanning two points on the PES with a TS at the midpoint"""
 
+    # Dimer coordinates cannot be converted to Cartesians, so are pickled
+    _trajectory_suffix = "_opt_trj.zip"
+
     def __init__(
         self,
         maxiter: int,
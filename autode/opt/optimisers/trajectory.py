@@ -0,0 +1,400 @@
+"""
+Append-only binary trajectory of optimiser coordinates. A trajectory is a
+directory with one stream (file) of float64 values for each of the Cartesian
+coordinates, gradients, energies and the optional Hessians, such that the
+number of frames and any single frame are read without reading the others
+and the streams may be memory-mapped
+"""
+import os
+import pickle
+import shutil
+import numpy as np
+
+from typing import Any, Iterator, Optional, TYPE_CHECKING
+from zipfile import ZipFile, is_zipfile
+
+from autode.log import logger
+from autode.opt.coordinates.cartesian import CartesianCoordinates
+
+if TYPE_CHECKING:
+    from autode.opt.coordinates.base import OptCoordinates
+
+
+class BinaryTrajectory:
+    """
+    Trajectory on disk of Cartesian coordinates, with their energies,
+    gradients and Hessians, that frames may only be appended to
+    """
+
+    ext = ".trj"
+
+    _header = "ade_opt_trj"
+    _x_stream = "coordinates.bin"
+    _g_stream = "gradients.bin"
+    _e_stream = "energies.bin"
+    _h_stream = "hessians.bin"
+    _h_idx_stream = "hessian_idxs.bin"
+
+    def __init__(self, dirname: str):
+        """
+        Trajectory in an existing directory. Use create() for a new one
+
+        -----------------------------------------------------------------------
+        Arguments:
+            dirname: Name of the trajectory directory, may be a path
+
+        Raises:
+            (FileNotFoundError): If the directory does not exist
+
+            (ValueError): If the directory is not an autodE trajectory
+        """
+        dirname = os.path.abspath(
+            os.path.expanduser(os.path.expandvars(dirname))
+        )
+        if not os.path.isdir(dirname):
+            raise FileNotFoundError(
+                f"The trajectory {dirname} does not exist!"
+            )
+
+        if not os.path.isfile(os.path.join(dirname, self._header)):
+            raise ValueError(f"{dirname} is not an autodE trajectory!")
+
+        self.dirname = dirname
+        self._n_coords: Optional[int] = None
+
+    @classmethod
+    def create(cls, dirname: str) -> "BinaryTrajectory":
+        """
+        Create a new, empty, trajectory, overwriting any existing one
+
+        -----------------------------------------------------------------------
+        Arguments:
+            dirname: Name of the trajectory directory
+
+        Returns:
+            (autode.opt.optimisers.trajectory.BinaryTrajectory):
+        """
+        if os.path.exists(dirname):
+            logger.warning(f"Trajectory {dirname} already exists, overwriting")
+            shutil.rmtree(dirname)
+
+        os.mkdir(dirname)
+        with open(os.path.join(dirname, cls._header), "w") as file:
+            print("Trajectory from autodE", file=file)
+
+        for name in (
+            cls._x_stream,
+            cls._g_stream,
+            cls._e_stream,
+            cls._h_stream,
+            cls._h_idx_stream,
+        ):
+            open(os.path.join(dirname, name), "wb").close()
+
+        return cls(dirname)
+
+    def __len__(self) -> int:
+        """Number of frames in this trajectory"""
+        return os.path.getsize(self._path(self._e_stream)) // 8
+
+    @property
+    def n_coords(self) -> Optional[int]:
+        """Number of Cartesian coordinates (3N) in each frame"""
+        if self._n_coords is None and len(self) > 0:
+            n_bytes = os.path.getsize(self._path(self._x_stream))
+            self._n_coords = n_bytes // (8 * len(self))
+
+        return self._n_coords
+
+    def append(self, coords: "OptCoordinates") -> None:
+        """
+        Append a frame with a set of coordinates, converted to Cartesians.
+        Missing energies and gradients are stored as NaN. The energy is
+        written last, so an interrupted append does not add a frame
+
+        -----------------------------------------------------------------------
+        Arguments:
+            coords: Coordinates, with an energy, gradient and Hessian if
+                    they are available
+        """
+        cart_coords = coords.to("cart")
+        x = np.array(cart_coords, dtype=np.float64).flatten()
+
+        if self.n_coords is not None and len(x) != self.n_coords:
+            raise ValueError(
+                f"Cannot append {len(x)} coordinates to a trajectory with "
+                f"{self.n_coords} in each frame"
+            )
+
+        g = np.full_like(x, np.nan)
+        if cart_coords.g is not None:
+            g[:] = np.array(cart_coords.g).flatten()
+
+        h_idx = -1
+        if cart_coords._h is not None or cart_coords._h_inv is not None:
+            h_size = os.path.getsize(self._path(self._h_stream))
+            h_idx = h_size // (8 * len(x) ** 2)
+            self._write(self._h_stream, np.array(cart_coords.h).flatten())
+
+        self._write(self._x_stream, x)
+        self._write(self._g_stream, g)
+        self._write(self._h_idx_stream, np.array([h_idx], dtype=np.int64))
+        self._write(
+            self._e_stream,
+            np.array([np.nan if coords.e is None else float(coords.e)]),
+        )
+        self._n_coords = len(x)
+        return None
+
+    def __getitem__(self, idx: int) -> CartesianCoordinates:
+        """
+        Frame in this trajectory, read from disk
+
+        -----------------------------------------------------------------------
+        Arguments:
+            idx: Index of the frame, may be negative
+
+        Returns:
+            (autode.opt.coordinates.CartesianCoordinates):
+
+        Raises:
+            (IndexError): If the frame does not exist
+        """
+        n_frames = len(self)
+        if idx < 0:
+            idx += n_frames
+        if idx < 0 or idx >= n_frames:
+            raise IndexError("Trajectory index out of range")
+
+        n = self.n_coords
+        assert n is not None
+
+        x = self._read(self._x_stream, offset=idx * n, count=n)
+        g = self._read(self._g_stream, offset=idx * n, count=n)
+        e = self._read(self._e_stream, offset=idx, count=1)[0]
+        h_idx = self._read(
+            self._h_idx_stream, offset=idx, count=1, dtype=np.int64
+        )[0]
+
+        h = None
+        if h_idx >= 0:
+            h = self._read(
+                self._h_stream, offset=h_idx * n**2, count=n**2
+            ).reshape(n, n)
+
+        return self._cartesian_coordinates(x, g, e, h)
+
+    def frames(self, chunk_size: int = 100) -> Iterator[CartesianCoordinates]:
+        """
+        Iterate through the frames of this trajectory, reading a chunk of
+        frames at a time from memory-mapped streams
+
+        -----------------------------------------------------------------------
+        Arguments:
+            chunk_size: Number of frames to read at once
+
+        Yields:
+            (autode.opt.coordinates.CartesianCoordinates):
+        """
+        n_frames = len(self)
+        if n_frames == 0:
+            return
+
+        xs, gs, es = self.coordinates, self.gradients, self.energies
+        h_idxs = np.fromfile(self._path(self._h_idx_stream), dtype=np.int64)
+        hs = self.hessians
+
+        for start in range(0, n_frames, chunk_size):
+            end = min(start + chunk_size, n_frames)
+            x_chunk, g_chunk = np.array(xs[start:end]), np.array(gs[start:end])
+
+            for i in range(end - start):
+                h_idx = h_idxs[start + i]
+                yield self._cartesian_coordinates(
+                    x_chunk[i],
+                    g_chunk[i],
+                    es[start + i],
+                    None if h_idx < 0 else np.array(hs[h_idx]),
+                )
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Memory-mapped Cartesian coordinates. shape = (n_frames, 3N)"""
+        return self._memmap(self._x_stream, n_per_frame=self.n_coords)
+
+    @property
+    def gradients(self) -> np.ndarray:
+        """Memory-mapped Cartesian gradients, NaN where not available.
+        shape = (n_frames, 3N)"""
+        return self._memmap(self._g_stream, n_per_frame=self.n_coords)
+
+    @property
+    def energies(self) -> np.ndarray:
+        """Energies (Ha), NaN where not available. shape = (n_frames,)"""
+        return np.fromfile(self._path(self._e_stream), count=len(self))
+
+    @property
+    def hessians(self) -> np.ndarray:
+        """Memory-mapped Cartesian Hessians of the frames that have one.
+        shape = (n_hessians, 3N, 3N)"""
+        n = self.n_coords
+        if n is None or os.path.getsize(self._path(self._h_stream)) == 0:
+            return np.zeros(shape=(0, 0, 0))
+
+        return (
+            np.memmap(self._path(self._h_stream), mode="r")
+            .view(np.float64)
+            .reshape(-1, n, n)
+        )
+
+    def save_object(self, name: str, obj: Any, overwrite: bool = False):
+        """
+        Save a pickled object alongside the frames, e.g. optimiser parameters
+
+        -----------------------------------------------------------------------
+        Arguments:
+            name: Name of the object
+
+            obj: Object to save
+
+            overwrite: Whether an existing object with the same name may be
+                       overwritten
+
+        Raises:
+            (FileExistsError): If the object exists and cannot be overwritten
+        """
+        filepath = self._path(f"{name}.pkl")
+        if os.path.exists(filepath) and not overwrite:
+            raise FileExistsError(f"{name} is already stored")
+
+        with open(f"{filepath}.tmp", "wb") as file:
+            pickle.dump(obj, file, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(f"{filepath}.tmp", filepath)
+        return None
+
+    def load_object(self, name: str) -> Any:
+        """
+        Load a pickled object saved alongside the frames
+
+        -----------------------------------------------------------------------
+        Arguments:
+            name: Name of the object
+
+        Returns:
+            (Any):
+
+        Raises:
+            (FileNotFoundError): If the object has not been saved
+        """
+        filepath = self._path(f"{name}.pkl")
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"{name} is not found!")
+
+        with open(filepath, "rb") as file:
+            return pickle.load(file)
+
+    def remove(self) -> None:
+        """Remove this trajectory from disk"""
+        shutil.rmtree(self.dirname)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.dirname, name)
+
+    def _write(self, name: str, arr: np.ndarray) -> None:
+        with open(self._path(name), "ab") as file:
+            file.write(arr.tobytes())
+
+    def _read(
+        self, name: str, offset: int, count: int, dtype: Any = np.float64
+    ) -> np.ndarray:
+        """Read count values from a stream, starting at a value offset"""
+        return np.fromfile(
+            self._path(name),
+            dtype=dtype,
+            count=count,
+            offset=offset * np.dtype(dtype).itemsize,
+        )
+
+    def _memmap(self, name: str, n_per_frame: Optional[int]) -> np.ndarray:
+        if n_per_frame is None:
+            return np.zeros(shape=(0, 0))
+
+        return np.memmap(
+            self._path(name),
+            dtype=np.float64,
+            mode="r",
+            shape=(len(self), n_per_frame),
+        )
+
+    @staticmethod
+    def _cartesian_coordinates(
+        x: np.ndarray, g: np.ndarray, e: float, h: Optional[np.ndarray]
+    ) -> CartesianCoordinates:
+        coords = CartesianCoordinates(np.array(x))
+        coords.e = None if np.isnan(e) else e
+        coords.g = None if np.all(np.isnan(g)) else np.array(g)
+
+        if h is not None:
+            coords.h = h
+
+        return coords
+
+
+def convert_zip_trajectory(
+    filename: str, trj_filename: Optional[str] = None
+) -> str:
+    """
+    Convert an optimiser trajectory in the zip format, with pickled
+    coordinates, to a binary trajectory. Coordinates are read one at a
+    time, and the final two are also kept in the format they were saved,
+    such that an optimisation may be restarted from the binary trajectory
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        filename: Name of the .zip trajectory
+
+        trj_filename: Name of the binary trajectory. Defaults to the
+                      filename with a .trj extension
+
+    Returns:
+        (str): Name of the binary trajectory
+
+    Raises:
+        (FileNotFoundError | ValueError): If the zip trajectory does not exist
+                                          or is invalid
+    """
+    if not os.path.isfile(filename):
+        raise FileNotFoundError(f"The file {filename} does not exist!")
+
+    if not is_zipfile(filename):
+        raise ValueError(f"The file {filename} is not a valid trajectory file")
+
+    if trj_filename is None:
+        trj_filename = os.path.splitext(filename)[0] + BinaryTrajectory.ext
+
+    with ZipFile(filename, "r") as file:
+        names = file.namelist()
+        if BinaryTrajectory._header not in names:
+            raise ValueError(
+                f"The file {filename} is not an autodE trajectory!"
+            )
+
+        trj = BinaryTrajectory.create(trj_filename)
+        n_coords = sum(1 for name in names if name.startswith("coords_"))
+        memory = []
+
+        for idx in range(n_coords):
+            with file.open(f"coords_{idx}") as fh:
+                coords = pickle.load(fh)
+
+            trj.append(coords)
+            memory = (memory + [coords])[-2:]
+
+        if "opt_params" in names:
+            with file.open("opt_params") as fh:
+                trj.save_object("opt_params", pickle.load(fh))
+
+    trj.save_object("memory", memory)
+    logger.info(f"Converted {n_coords} coordinates from {filename}")
+    return trj_filename
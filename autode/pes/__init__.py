@@ -1,5 +1,5 @@
 from autode.pes.relaxed import RelaxedPESnD
+from autode.pes.adaptive import AdaptiveRelaxedPESnD
 from autode.pes.unrelaxed import UnRelaxedPES1D
 
-
-__all__ = ["RelaxedPESnD", "UnRelaxedPES1D"]
+__all__ = ["RelaxedPESnD", "AdaptiveRelaxedPESnD", "UnRelaxedPES1D"]
@@ -0,0 +1,359 @@
+"""
+Relaxed potential energy surfaces that are calculated on a coarse grid, which
+is only refined where the energy is poorly described by interpolation or
+there is a saddle point
+"""
+import os
+import copy
+import numpy as np
+import itertools as it
+
+from typing import Tuple, List, Set, Optional, Dict, Union, TYPE_CHECKING
+from scipy.interpolate import RegularGridInterpolator
+
+from autode.log import logger
+from autode.values import Energy, EnergyArray
+from autode.pes.relaxed import RelaxedPESnD
+from autode.pes.pes_nd import _ListDistances1D, _Distances1D
+
+if TYPE_CHECKING:
+    from autode.species.species import Species
+
+
+class AdaptiveRelaxedPESnD(RelaxedPESnD):
+    """
+    Relaxed potential energy surface over a set of distances, which is
+    calculated on a coarse grid then refined only in the cells where
+    the curvature of the energy is large or that contain a saddle point.
+    Energies of the points that are not calculated are linearly interpolated
+    """
+
+    def __init__(
+        self,
+        species: "Species",
+        rs: Dict[Tuple[int, int], Union[Tuple, np.ndarray]],
+        allow_rounding: bool = True,
+        etol: Energy = Energy(1.0, units="kcal mol-1"),
+    ):
+        """
+        Adaptive relaxed potential energy surface in N-dimensions. The
+        distances define the finest grid that is calculated
+
+        -----------------------------------------------------------------------
+        Arguments:
+            species: Species from which to perform the PES exploration
+
+            rs: Set of atom index pairs defining distances, along with a
+                representation of what values they should take in the scan
+
+            allow_rounding: Allow rounding of the step size, if required
+
+            etol: Tolerance on the estimated error of interpolating the energy
+                  over a cell, above which it is refined
+        """
+        super().__init__(species, rs, allow_rounding)
+
+        self._etol = float(Energy(etol, units="Ha").to("Ha"))
+        self._calculated: Optional[np.ndarray] = None
+
+    def _calculate(self) -> None:
+        """
+        Calculate the surface on successively finer grids, each of which
+        includes only the cells of the previous grid that require refinement.
+        Points around the saddle points of the interpolated surface are then
+        calculated, such that they match those of a calculated full grid
+        """
+        self._load_checkpoint()
+        attempted: Set[Tuple] = set()
+
+        stride = self._initial_stride()
+        points = self._grid_points(stride)
+
+        while True:
+            self._calculate_points(points, step=stride)
+            attempted.update(points)
+
+            if stride == 1:
+                break
+
+            points = [
+                p for p in self._refined_points(stride) if p not in attempted
+            ]
+            stride //= 2
+
+        for _ in range(max(self.shape)):
+            points = [
+                p
+                for p in self._saddle_point_neighbourhoods()
+                if p not in attempted
+            ]
+            if len(points) == 0:
+                break
+
+            self._calculate_points(points)
+            attempted.update(points)
+
+        self._calculated = ~np.isnan(np.array(self._energies))
+        logger.info(
+            f"Calculated {np.sum(self._calculated)} of "
+            f"{self._calculated.size} points on the surface"
+        )
+        self._set_uncalculated_points()
+
+        if os.path.exists(self._checkpoint_filename):
+            os.remove(self._checkpoint_filename)
+
+        return None
+
+    def _initial_stride(self) -> int:
+        """
+        Largest power of two separation between points on the coarse grid,
+        such that there are at least three points in each dimension
+
+        -----------------------------------------------------------------------
+        Returns:
+            (int):
+        """
+        stride = 1
+        while all(n - 1 >= 4 * stride for n in self.shape):
+            stride *= 2
+
+        return stride
+
+    def _grid_idxs(self, stride: int) -> List[np.ndarray]:
+        """
+        Indices of the points in each dimension of the grid with a given
+        stride, which always includes the final point
+
+        -----------------------------------------------------------------------
+        Arguments:
+            stride: Separation of the points
+
+        Returns:
+            (list(np.ndarray)):
+        """
+        return [
+            np.unique(np.append(np.arange(0, n, stride), n - 1))
+            for n in self.shape
+        ]
+
+    def _grid_points(self, stride: int) -> List[Tuple]:
+        """Points on the grid with a given stride, sorted by their sum"""
+        points = it.product(
+            *(idxs.tolist() for idxs in self._grid_idxs(stride))
+        )
+        return sorted(points, key=lambda x: sum(x))
+
+    def _interpolated_energies(self) -> np.ndarray:
+        """
+        Energies on the full grid, where those of points that have not been
+        calculated are linearly interpolated from successively finer grids
+
+        -----------------------------------------------------------------------
+        Returns:
+            (np.ndarray): Energies (Ha). shape = self.shape
+        """
+        energies = np.array(self._energies)
+        calculated = ~np.isnan(energies)
+        stride = self._initial_stride()
+
+        if stride == 1:
+            return energies
+
+        points = np.indices(self.shape).reshape(self.ndim, -1).T
+
+        while stride >= 1:
+            idxs = self._grid_idxs(stride)
+            interpolator = RegularGridInterpolator(
+                idxs, energies[np.ix_(*idxs)]
+            )
+            energies = np.where(
+                calculated, energies, interpolator(points).reshape(self.shape)
+            )
+            stride //= 2
+
+        return energies
+
+    def _refined_points(self, stride: int) -> List[Tuple]:
+        """
+        Points on the grid with half the stride in the cells of this grid
+        that require refinement. Cells with all their corners calculated
+        are refined if the estimated error in the linearly interpolated energy
+        is larger than the tolerance, while all cells around a saddle point
+        are refined
+
+        -----------------------------------------------------------------------
+        Arguments:
+            stride: Separation of the points on the current grid
+
+        Returns:
+            (list(tuple(int))): Points sorted by their sum
+        """
+        idxs = self._grid_idxs(stride)
+        energies = self._interpolated_energies()[np.ix_(*idxs)]
+        calculated = ~np.isnan(np.array(self._energies))[np.ix_(*idxs)]
+
+        refine = np.logical_and(
+            self._corner_max(self._interpolation_errors(idxs, energies))
+            > self._etol,
+            self._corner_min(calculated),
+        )
+
+        for point in self._surface(idxs, energies)._saddle_points():
+            cells = (
+                range(max(p - 1, 0), min(p + 1, n - 1))
+                for p, n in zip(point, energies.shape)
+            )
+            for cell in it.product(*cells):
+                refine[cell] = True
+
+        fine_idxs = self._grid_idxs(stride // 2)
+        points = set()
+
+        for cell in zip(*np.nonzero(refine)):
+            ranges = (
+                f_idxs[(f_idxs >= c_idxs[c]) & (f_idxs <= c_idxs[c + 1])]
+                for f_idxs, c_idxs, c in zip(fine_idxs, idxs, cell)
+            )
+            points.update(it.product(*(r.tolist() for r in ranges)))
+
+        logger.info(
+            f"Refining {np.sum(refine)} of {refine.size} cells with a "
+            f"separation of {stride} points"
+        )
+        return sorted(points, key=lambda x: sum(x))
+
+    def _interpolation_errors(
+        self, idxs: List[np.ndarray], energies: np.ndarray
+    ) -> np.ndarray:
+        """
+        Estimate of the error in linearly interpolating the energy over each
+        cell, from the second derivative at its corners, as h^2 |E''| / 8
+        for a cell of width h
+
+        -----------------------------------------------------------------------
+        Arguments:
+            idxs: Indices of the points in each dimension of the grid
+
+            energies: Energies on the grid
+
+        Returns:
+            (np.ndarray): Errors at each corner of the cells. Same shape as
+                          energies
+        """
+        errors = np.zeros_like(energies)
+
+        for dim, dim_idxs in enumerate(idxs):
+            if len(dim_idxs) < 3:
+                continue
+
+            shape = [1] * self.ndim
+            shape[dim] = -1
+            h = np.diff(dim_idxs).astype(float).reshape(shape)
+
+            slopes = np.diff(energies, axis=dim) / h
+            h_l = np.take(h, range(len(dim_idxs) - 2), axis=dim)
+            h_r = np.take(h, range(1, len(dim_idxs) - 1), axis=dim)
+            d2 = 2.0 * np.abs(np.diff(slopes, axis=dim)) / (h_l + h_r)
+
+            # Cell widths are at most the largest width either side
+            d2 *= np.square(np.maximum(h_l, h_r)) / 8.0
+            d2 = np.nan_to_num(d2, nan=0.0)
+
+            interior = [slice(None)] * self.ndim
+            interior[dim] = slice(1, -1)
+            errors[tuple(interior)] = np.maximum(errors[tuple(interior)], d2)
+
+        return errors
+
+    @staticmethod
+    def _corner_max(arr: np.ndarray) -> np.ndarray:
+        """Maximum value of an array at the corners of each cell"""
+        for dim in range(arr.ndim):
+            arr = np.maximum(
+                np.take(arr, range(arr.shape[dim] - 1), axis=dim),
+                np.take(arr, range(1, arr.shape[dim]), axis=dim),
+            )
+        return arr
+
+    @staticmethod
+    def _corner_min(arr: np.ndarray) -> np.ndarray:
+        """Minimum value of an array at the corners of each cell"""
+        for dim in range(arr.ndim):
+            arr = np.minimum(
+                np.take(arr, range(arr.shape[dim] - 1), axis=dim),
+                np.take(arr, range(1, arr.shape[dim]), axis=dim),
+            )
+        return arr
+
+    def _surface(
+        self, idxs: List[np.ndarray], energies: np.ndarray
+    ) -> "AdaptiveRelaxedPESnD":
+        """
+        Surface on a grid of points, defined by their indices in each
+        dimension, with a set of energies. Used to find saddle points
+
+        -----------------------------------------------------------------------
+        Arguments:
+            idxs: Indices of the points in each dimension of the grid
+
+            energies: Energies on the grid (Ha)
+
+        Returns:
+            (autode.pes.adaptive.AdaptiveRelaxedPESnD):
+        """
+        surface = copy.copy(self)
+        surface._rs = _ListDistances1D(species=None, rs_dict={})
+
+        for r, dim_idxs in zip(self._rs, idxs):
+            surface._rs.append(
+                _Distances1D(np.array(r)[dim_idxs], atom_idxs=r.atom_idxs)
+            )
+
+        surface._energies = EnergyArray(energies, units="Ha")
+        surface._gradients = np.full((*energies.shape, self.ndim), np.nan)
+        surface._hessians = np.full(
+            (*energies.shape, self.ndim, self.ndim), np.nan
+        )
+        return surface
+
+    def _saddle_point_neighbourhoods(self) -> List[Tuple]:
+        """
+        Points that have not been calculated within one point of a saddle
+        point on the full interpolated surface
+
+        -----------------------------------------------------------------------
+        Returns:
+            (list(tuple(int))): Points sorted by their sum
+        """
+        idxs = [np.arange(n) for n in self.shape]
+        surface = self._surface(idxs, self._interpolated_energies())
+        points = set()
+
+        for saddle_point in surface._saddle_points():
+            for d_point in it.product(range(-1, 2), repeat=self.ndim):
+                point = tuple(np.array(saddle_point) + np.array(d_point))
+
+                if self._is_contained(point) and not self._has_energy(point):
+                    points.add(point)
+
+        return sorted(points, key=lambda x: sum(x))
+
+    def _set_uncalculated_points(self) -> None:
+        """
+        Set the energies of the points that have not been calculated from
+        interpolation, and their coordinates from the closest calculated point
+        """
+        assert self._coordinates is not None, "Coordinates must be set"
+
+        if np.all(np.isnan(np.array(self._energies))):
+            return None
+
+        energies = self._interpolated_energies()
+
+        for point in self._points():
+            if not self._has_energy(point) and not np.isnan(energies[point]):
+                self._coordinates[point] = self._closest_coordinates(point)
+
+        self._energies[:] = energies
+        return None
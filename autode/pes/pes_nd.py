@@ -526,8 +526,10 @@ class PESnD(ABC):
         np.savetxt(filename, arr.flatten() if self.ndim > 2 else arr)
         return None
 
-    def _save_npz(self, filename: str) -> None:
-        """Save a compressed numpy array, from which a PES can be re-loaded"""
+    def _save_npz(self, filename: str, **arrays: np.ndarray) -> None:
+        """Save a compressed numpy array, from which a PES can be re-loaded.
+        Any additional arrays are also saved and must not have an r in their
+        name, as they would be loaded as a distance"""
 
         if not filename.endswith(".npz"):
             filename += ".npz"
@@ -546,6 +548,7 @@ class PESnD(ABC):
             R=self._coordinates,
             E=np.array(self._energies.to("Ha")),
             **kwds,
+            **arrays,
         )
 
         return None
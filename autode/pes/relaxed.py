@@ -1,10 +1,13 @@
+import os
+import hashlib
 import numpy as np
 import itertools as it
 
-from typing import Tuple, List, Type, Iterator, TYPE_CHECKING
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from typing import Dict, Tuple, List, Type, TYPE_CHECKING
 
 from autode.log import logger
-from autode.utils import hashable, ProcessPool
+from autode.utils import hashable, WorkerPool
 from autode.pes.reactive import ReactivePESnD
 from autode.constraints import DistanceConstraints
 from autode.calculations import Calculation
@@ -22,32 +25,77 @@ class RelaxedPESnD(ReactivePESnD):
 
     def _calculate(self) -> None:
         """
-        Calculate the n-dimensional surface
+        Calculate the n-dimensional surface. The surface is checkpointed after
+        every point, such that an interrupted calculation can be resumed
         """
-        assert self._coordinates is not None, "Coordinates must be set"
+        self._load_checkpoint()
+        self._calculate_points(list(self._points()))
 
-        for points in self._points_generator():
-            n_cores_pp = max(self._n_cores // len(points), 1)
-            logger.info(
-                f"Calculating tranche {points} on the surface, using "
-                f"{n_cores_pp} cores per process"
-            )
+        if os.path.exists(self._checkpoint_filename):
+            os.remove(self._checkpoint_filename)
+
+        return None
 
-            with ProcessPool(max_workers=self._n_cores) as pool:
-                func = hashable("_single_energy_coordinates", self)
+    def _calculate_points(self, points: List[Tuple], step: int = 1) -> None:
+        """
+        Calculate a set of points on the surface. A point is calculated as
+        soon as one of its neighbours has an energy, with cores handed out on
+        demand, and the surface is checkpointed after every point
+
+        -----------------------------------------------------------------------
+        Arguments:
+            points: Points to calculate, sorted by their sum. Those that
+                    already have an energy are skipped
+
+            step: Separation of neighbouring points, in each dimension
+        """
+        assert self._coordinates is not None, "Coordinates must be set"
+
+        pending = [p for p in points if not self._has_energy(p)]
+        n_free_cores = self._n_cores
+        running: Dict[Future, Tuple[Tuple, int]] = {}
+
+        with WorkerPool(max_workers=self._n_cores) as pool:
+            func = hashable("_single_energy_coordinates", self)
+
+            while len(pending) > 0 or len(running) > 0:
+                ready = self._ready_points(
+                    pending, n_running=len(running), step=step
+                )
+
+                while len(ready) > 0 and n_free_cores > 0:
+                    n_cores_pp = max(n_free_cores // len(ready), 1)
+                    point = ready.pop(0)
+                    pending.remove(point)
+                    logger.info(
+                        f"Calculating point {point} on the surface, using "
+                        f"{n_cores_pp} cores"
+                    )
 
-                jobs = [
-                    pool.submit(
+                    job = pool.submit(
                         func, self._species_at(point), n_cores=n_cores_pp
                     )
-                    for point in points
-                ]
+                    running[job] = (point, n_cores_pp)
+                    n_free_cores -= n_cores_pp
 
-                for i, point in enumerate(points):
+                if len(running) == 0:
+                    logger.error(
+                        f"No points with an energy. Could not calculate "
+                        f"{len(pending)} points on the surface"
+                    )
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for job in finished:
+                    point, n_cores_pp = running.pop(job)
                     (
                         self._energies[point],
                         self._coordinates[point],
-                    ) = jobs[i].result()
+                    ) = job.result()
+                    n_free_cores += n_cores_pp
+
+                self._save_checkpoint()
 
         return None
 
@@ -181,28 +229,134 @@ class RelaxedPESnD(ReactivePESnD):
             {r.atom_idxs: r[idx] for r, idx in zip(self._rs, point)}
         )
 
-    def _points_generator(self) -> Iterator[List[Tuple]]:
+    def _ready_points(
+        self, pending: List[Tuple], n_running: int, step: int = 1
+    ) -> List[Tuple]:
         """
-        Yield points on this surface that sum to the same total, thus are
-        close and should be calculated in a group, in parallel. This *should*
-        provide the most efficient calculation decomposition on the surface
+        Points that can be calculated, as they are the origin or have a point
+        with an energy within step points in any dimension. If none are ready
+        and no calculations are running then the closest point to the origin
+        is ready, provided any point on the surface has an energy
 
         -----------------------------------------------------------------------
-        Yields:
-            (list(tuple(int))):
+        Arguments:
+            pending: Points yet to be calculated, sorted by their sum
+
+            n_running: Number of points currently being calculated
+
+            step: Separation of neighbouring points
+
+        Returns:
+            (list(tuple(int))): Points in the same order as pending
         """
-        all_points = list(self._points())
 
-        for i in range(0, sum(self.shape)):
-            points: List[tuple] = []
-            while all_points:
-                # Next point is the next step in the grid
-                if len(points) > 0 and sum(all_points[0]) > i:
-                    break
+        def is_ready(point: Tuple) -> bool:
+            return point == self.origin or any(
+                self._has_energy(self._neighbour(point, dim, delta))
+                for dim in range(self.ndim)
+                for delta in it.chain(range(-step, 0), range(1, step + 1))
+            )
 
-                points.insert(0, all_points.pop(0))
+        ready = [point for point in pending if is_ready(point)]
 
-            if len(points) > 0:
-                yield points
+        # Neighbours of failed points are started from points further away
+        if (
+            len(ready) == 0
+            and len(pending) > 0
+            and n_running == 0
+            and not np.all(np.isnan(self._energies))
+        ):
+            ready = [pending[0]]
 
-        return StopIteration
+        return ready
+
+    @property
+    def _checkpoint_filename(self) -> str:
+        """Name of the file in which the surface is checkpointed"""
+        assert self._species is not None, "Must have a species to checkpoint"
+        return f"{self._species.name}_scan_checkpoint.npz"
+
+    def _save_checkpoint(self) -> None:
+        """
+        Save the surface to the checkpoint file. Written to a temporary file
+        first so an interruption never leaves a partially written checkpoint
+        """
+        assert self._method is not None, "Must have a method to checkpoint"
+        tmp_filename = self._checkpoint_filename.replace(".npz", ".tmp.npz")
+        self._save_npz(
+            tmp_filename,
+            method=np.array(self._method.name),
+            kwds_hash=np.array(self._keywords_hash),
+        )
+        os.replace(tmp_filename, self._checkpoint_filename)
+
+        return None
+
+    def _load_checkpoint(self) -> None:
+        """
+        Set the energies and coordinates of points with an energy in an
+        existing checkpoint file, if it is for the same surface
+        """
+        assert self._coordinates is not None, "Coordinates must be set"
+        filename = self._checkpoint_filename
+
+        if not os.path.exists(filename):
+            return None
+
+        try:
+            checkpoint = RelaxedPESnD.from_file(filename)
+            with np.load(filename) as data:
+                method_name = str(data["method"])
+                keywords_hash = str(data["kwds_hash"])
+        except (OSError, KeyError, ValueError):
+            logger.warning(f"Could not load {filename}. Not resuming from it")
+            return None
+
+        assert self._method is not None, "Must have a method to resume"
+        if (
+            method_name != self._method.name
+            or keywords_hash != self._keywords_hash
+        ):
+            logger.warning(
+                f"Checkpoint {filename} was calculated with a different "
+                f"method or keywords. Not resuming from it"
+            )
+            return None
+
+        if not self._is_same_surface(checkpoint):
+            logger.warning(
+                f"Checkpoint {filename} is for a different surface. Not "
+                f"resuming from it"
+            )
+            return None
+
+        has_energy = ~np.isnan(checkpoint._energies)
+        self._energies[has_energy] = checkpoint._energies[has_energy]
+        self._coordinates[has_energy] = checkpoint._coordinates[has_energy]
+
+        logger.info(
+            f"Resuming from {filename}, which has {np.sum(has_energy)} "
+            f"points with energies"
+        )
+        return None
+
+    @property
+    def _keywords_hash(self) -> str:
+        """Hash of the keywords used to calculate points on the surface"""
+        return hashlib.sha256(str(self._keywords).encode()).hexdigest()
+
+    def _is_same_surface(self, other: "RelaxedPESnD") -> bool:
+        """Does another surface have the same distances and atoms?"""
+        assert self._coordinates is not None and other._coordinates is not None
+
+        if (
+            other.shape != self.shape
+            or other._coordinates.shape != self._coordinates.shape
+        ):
+            return False
+
+        return all(
+            tuple(r.atom_idxs) == tuple(other_r.atom_idxs)
+            and np.allclose(r, other_r)
+            for r, other_r in zip(self._rs, other._rs)
+        )
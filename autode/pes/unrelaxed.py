@@ -3,7 +3,7 @@ import numpy as np
 from typing import Tuple, Type, TYPE_CHECKING
 
 from autode.pes.reactive import ReactivePESnD
-from autode.utils import hashable, ProcessPool
+from autode.utils import hashable, WorkerPool
 from autode.log import logger
 from autode.mol_graphs import split_mol_across_bond
 from autode.exceptions import CalculationException
@@ -28,7 +28,7 @@ class UnRelaxedPES1D(ReactivePESnD):
         # PES. The number of workers executing will be at most len(points)
         n_cores_pp = max(self._n_cores // len(points), 1)
 
-        with ProcessPool(max_workers=self._n_cores) as pool:
+        with WorkerPool(max_workers=self._n_cores) as pool:
             results = [
                 pool.submit(
                     hashable("_single_energy", self),
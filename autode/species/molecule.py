@@ -20,7 +20,7 @@ from autode.species.metal_builder import (
     init_metal_smiles,
 )
 from autode.species.species import Species
-from autode.utils import requires_atoms, ProcessPool, total_electrons
+from autode.utils import requires_atoms, WorkerPool, total_electrons
 
 
 class Molecule(Species):
@@ -231,7 +231,7 @@ class Molecule(Species):
 
         else:
             logger.info("Using repulsion+relaxed (RR) to generate conformers")
-            with ProcessPool(max_workers=Config.n_cores) as pool:
+            with WorkerPool(max_workers=Config.n_cores) as pool:
                 results = [
                     pool.submit(get_simanl_conformer, self, None, i)
                     for i in range(n_confs)
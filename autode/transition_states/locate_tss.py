@@ -1,5 +1,8 @@
 import os
+import signal
+import queue
 import numpy as np
+import multiprocessing
 from scipy.optimize import minimize
 from autode.exceptions import NoMapping
 from autode.species import Complex
@@ -13,7 +16,7 @@ from autode.log import logger
 from autode.values import Distance, PotentialEnergy
 from autode.methods import get_hmethod
 from autode.methods import get_lmethod
-from autode.utils import work_in
+from autode.utils import work_in, WorkerPool
 from autode.mol_graphs import get_mapping
 from autode.mol_graphs import reac_graph_to_prod_graph
 from autode.bonds import FormingBond, BreakingBond
@@ -52,16 +55,29 @@ def find_tss(reaction):
         return None
 
     tss = TransitionStates()
-    for bond_rearrangement in bond_rearrs:
-        logger.info(
-            f"Locating transition state using active bonds "
-            f"{bond_rearrangement.all}"
+    n_cores_pp = Config.ts_n_cores_per_rearrangement
+
+    if (
+        n_cores_pp is not None
+        and n_cores_pp < Config.n_cores
+        and len(bond_rearrs) > 1
+    ):
+        found_tss = _get_tss_concurrently(
+            str(reaction), reactant, product, bond_rearrs, n_cores_pp
         )
+        tss.extend(ts for ts in found_tss if ts is not None)
 
-        ts = get_ts(str(reaction), reactant, product, bond_rearrangement)
+    else:
+        for bond_rearrangement in bond_rearrs:
+            logger.info(
+                f"Locating transition state using active bonds "
+                f"{bond_rearrangement.all}"
+            )
 
-        if ts is not None:
-            tss.append(ts)
+            ts = get_ts(str(reaction), reactant, product, bond_rearrangement)
+
+            if ts is not None:
+                tss.append(ts)
 
     logger.info(
         f"Found *{len(tss)}* transition state(s) that lead to products"
@@ -69,6 +85,68 @@ def find_tss(reaction):
     return tss
 
 
+def _get_tss_concurrently(name, reactant, product, bond_rearrs, n_cores_pp):
+    """
+    Locate the transition states of several bond rearrangements at once,
+    each with a budget of cores and in its own directory
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        name (str): Unique identifier for this reaction
+
+        reactant (autode.species.ReactantComplex):
+
+        product (autode.species.ProductComplex):
+
+        bond_rearrs (list(autode.bond_rearrangement.BondRearrangement)):
+
+        n_cores_pp (int): Number of cores for each bond rearrangement
+
+    Returns:
+        (list(autode.transition_states.TransitionState | None)): Transition
+                     states in the same order as the bond rearrangements
+    """
+    n_procs = min(max(Config.n_cores // n_cores_pp, 1), len(bond_rearrs))
+    logger.info(
+        f"Locating transition states of {len(bond_rearrs)} bond "
+        f"rearrangements, {n_procs} at once with {n_cores_pp} cores each"
+    )
+
+    with WorkerPool(max_workers=n_procs) as pool:
+        jobs = [
+            pool.submit(
+                _get_ts_in_directory,
+                name,
+                reactant.copy(),
+                product.copy(),
+                bond_rearr,
+                n_cores_pp,
+            )
+            for bond_rearr in bond_rearrs
+        ]
+        return [job.result() for job in jobs]
+
+
+def _get_ts_in_directory(name, reactant, product, bond_rearr, n_cores):
+    """
+    Locate the transition state of a bond rearrangement in a directory
+    named after it, using a number of cores. See get_ts()
+    """
+    n_cores_total = Config.n_cores
+    Config.n_cores = n_cores
+
+    logger.info(
+        f"Locating transition state using active bonds {bond_rearr.all} "
+        f"with {n_cores} cores"
+    )
+    try:
+        return work_in(str(bond_rearr))(get_ts)(
+            name, reactant, product, bond_rearr
+        )
+    finally:
+        Config.n_cores = n_cores_total
+
+
 def ts_guess_funcs_prms(name, reactant, product, bond_rearr):
     """
     Get the functions and parameters required for the function
@@ -297,33 +375,183 @@ def get_ts(name, reactant, product, bond_rearr, is_truncated=False):
     if not is_truncated and is_worth_truncating(reactant, bond_rearr):
         get_truncated_ts(name, reactant, product, bond_rearr)
 
+    funcs_prms = ts_guess_funcs_prms(name, reactant, product, bond_rearr)
+
+    if Config.race_ts_guesses and _can_race():
+        return _race_ts_guesses(list(funcs_prms), bond_rearr)
+
     # There are multiple methods of finding a transition state. Iterate through
     # from the cheapest -> most expensive
-    for func, params in ts_guess_funcs_prms(
-        name, reactant, product, bond_rearr
+    for func, params in funcs_prms:
+        ts = _ts_from_guess_func(func, params, bond_rearr)
+
+        if ts is not None:
+            return ts
+
+    return None
+
+
+def _ts_from_guess_func(func, params, bond_rearr):
+    """
+    Generate a TS guess with a function and optimise it to a transition
+    state
+
+    ---------------------------------------------------------------------------
+    Arguments:
+        func (Callable): Function that returns a TS guess, or None
+
+        params (tuple): Parameters of the function
+
+        bond_rearr (autode.bond_rearrangement.BondRearrangement):
+
+    Returns:
+        (autode.transition_states.TransitionState | None): TS, if it is a
+                                                           true TS
+    """
+    logger.info(f"Trying to find a TS guess with {func.__name__}")
+    ts_guess = func(*params)
+
+    if ts_guess is None:
+        return None
+
+    if not ts_guess.could_have_correct_imag_mode:
+        return None
+
+    # Form a transition state object and run an OptTS calculation
+    ts = TransitionState(ts_guess, bond_rearr=bond_rearr)
+    ts.optimise()
+
+    if not ts.is_true_ts:
+        return None
+
+    # Save a transition state template if specified in the config
+    if Config.make_ts_template:
+        ts.save_ts_template(folder_path=Config.ts_template_folder_path)
+
+    logger.info(f"Found a transition state with {func.__name__}")
+    return ts
+
+
+def _can_race() -> bool:
+    """Can TS guess functions be raced in forked processes?"""
+
+    if multiprocessing.current_process().daemon:
+        logger.warning("Cannot race TS guesses from a daemon process")
+        return False
+
+    if not hasattr(os, "setsid") or not isinstance(
+        multiprocessing.get_context(), multiprocessing.context.ForkContext
     ):
-        logger.info(f"Trying to find a TS guess with {func.__name__}")
-        ts_guess = func(*params)
+        logger.warning("Racing TS guesses requires forked processes")
+        return False
 
-        if ts_guess is None:
-            continue
+    return True
 
-        if not ts_guess.could_have_correct_imag_mode:
-            continue
 
-        # Form a transition state object and run an OptTS calculation
-        ts = TransitionState(ts_guess, bond_rearr=bond_rearr)
-        ts.optimise()
+def _race_ts_guesses(funcs_prms, bond_rearr):
+    """
+    Run the TS guess functions concurrently, in groups that depend on each
+    other, with the cores split between them. The first true TS is returned
+    and the remaining groups, along with any external processes they have
+    started, are terminated
 
-        if not ts.is_true_ts:
-            continue
+    ---------------------------------------------------------------------------
+    Arguments:
+        funcs_prms (list(tuple(func, args))): From ts_guess_funcs_prms()
+
+        bond_rearr (autode.bond_rearrangement.BondRearrangement):
+
+    Returns:
+        (autode.transition_states.TransitionState | None): TS
+    """
+    # A NEB from an adaptive path requires the path, so must follow it
+    groups = []
+    for func, params in funcs_prms:
+        if func is _get_ts_neb_from_adaptive_path and len(groups) > 0:
+            groups[-1].append((func, params))
+        else:
+            groups.append([(func, params)])
+
+    n_cores = max(Config.n_cores // len(groups), 1)
+    logger.info(
+        f"Racing {len(groups)} groups of TS guess functions with {n_cores} "
+        f"cores each"
+    )
+
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=_run_ts_guess_funcs,
+            args=(results, group, bond_rearr, n_cores),
+        )
+        for group in groups
+    ]
+    for process in processes:
+        process.start()
+
+    ts, n_finished = None, 0
+    try:
+        while n_finished < len(processes) and ts is None:
+            try:
+                ts = results.get(timeout=1.0)
+                n_finished += 1
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    logger.error("TS guess processes exited with no result")
+                    break
+    finally:
+        for process in processes:
+            _terminate_process_group(process)
+
+    return ts
+
+
+def _run_ts_guess_funcs(results, funcs_prms, bond_rearr, n_cores):
+    """
+    Try a group of TS guess functions in turn, in a directory named after
+    the first, and put the first true TS, or None, in a queue. Run in a new
+    session so the process and all its children may be terminated together
+    """
+    os.setsid()
+    Config.n_cores = n_cores
+    ts = None
+
+    try:
+        dir_name = funcs_prms[0][1][-1]  # name of the first TS guess
+        os.makedirs(dir_name, exist_ok=True)
+        os.chdir(dir_name)
+
+        for func, params in funcs_prms:
+            ts = _ts_from_guess_func(func, params, bond_rearr)
+            if ts is not None:
+                break
+
+    except Exception as err:
+        logger.error(f"Failed to find a TS guess: {err}")
+
+    results.put(ts)
+    return None
+
+
+def _terminate_process_group(process, grace_period: float = 5.0) -> None:
+    """
+    Terminate a process started in its own session, along with any external
+    processes it started, first with SIGTERM then SIGKILL
+    """
+    if not process.is_alive():
+        process.join()
+        return None
 
-        # Save a transition state template if specified in the config
-        if Config.make_ts_template:
-            ts.save_ts_template(folder_path=Config.ts_template_folder_path)
+    logger.info(f"Terminating TS guess process {process.pid}")
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            break
 
-        logger.info(f"Found a transition state with {func.__name__}")
-        return ts
+        process.join(timeout=grace_period)
+        if not process.is_alive():
+            break
 
     return None
 
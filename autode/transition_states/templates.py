@@ -1,10 +1,12 @@
 import os
+import pickle
 import autode
 from datetime import date
+from collections import defaultdict
 from autode.mol_graphs import MolecularGraph
 from autode.config import Config
 from autode.log import logger
-from autode.mol_graphs import is_isomorphic
+from autode.mol_graphs import is_isomorphic, graph_hash
 from autode.exceptions import TemplateLoadingFailed
 from autode.solvent.solvents import get_solvent
 
@@ -73,23 +75,39 @@ def get_ts_templates(folder_path=None):
         logger.error("Folder does not exist")
         return []
 
-    templates = []
+    templates = TStemplateLibrary.from_folder(folder_path).templates
 
-    # Attempt to form transition state templates for all the .txt files in the
-    # TS template folder
-    for filename in os.listdir(folder_path):
-        if not filename.endswith(".txt"):
-            continue
+    logger.info(f"Have {len(templates)} TS templates")
+    return templates
 
-        try:
-            template = TStemplate(filename=os.path.join(folder_path, filename))
-            templates.append(template)
 
-        except TemplateLoadingFailed:
-            logger.warning(f"Failed to load a template for {filename}")
+def get_matching_ts_templates(reactant, truncated_graph, folder_path=None):
+    """
+    Get the transition state templates in a folder, or the default if folder
+    path is None, that match a truncated graph of a reactant. See
+    template_matches()
 
-    logger.info(f"Have {len(templates)} TS templates")
-    return templates
+    ---------------------------------------------------------------------------
+    Arguments:
+        reactant (autode.complex.ReactantComplex):
+
+        truncated_graph (nx.Graph):
+
+    Keyword Arguments:
+        folder_path (str): e.g. '/path/to/the/ts/template/library'
+
+    Returns:
+        (list(autode.transition_states.templates.TStemplate)): Matching
+        templates, ordered by filename
+    """
+    folder_path = get_ts_template_folder_path(folder_path)
+
+    if not os.path.exists(folder_path):
+        logger.error(f"TS template folder {folder_path} does not exist")
+        return []
+
+    library = TStemplateLibrary.from_folder(folder_path)
+    return library.matching(reactant, truncated_graph)
 
 
 def template_matches(reactant, truncated_graph, ts_template):
@@ -416,20 +434,30 @@ class TStemplate:
             logger.info(f"Making directory {folder_path}")
             os.mkdir(folder_path)
 
-        # Iterate i until the templatei.obj file doesn't exist
-        name, i = basename + "0", 0
+        # Iterate i until the templatei.txt file doesn't exist, creating it
+        # exclusively so concurrent saves cannot use the same name
+        i = 0
         while True:
-            if not os.path.exists(os.path.join(folder_path, f"{name}.txt")):
+            file_path = os.path.join(folder_path, f"{basename}{i}.txt")
+            try:
+                open(file_path, "x").close()
                 break
-            name = basename + str(i)
-            i += 1
 
-        file_path = os.path.join(folder_path, f"{name}.txt")
+            except FileExistsError:
+                i += 1
+
         logger.info(f"Saving the template as {file_path}")
 
-        with open(file_path, "w") as template_file:
+        # Write the whole file before it replaces the empty one, so a
+        # partially written template is never read
+        tmp_file_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_file_path, "w") as template_file:
             self._save_to_file(template_file)
 
+        os.replace(tmp_file_path, file_path)
+        TStemplateLibrary.from_folder(folder_path, refresh=False).add(
+            file_path
+        )
         return None
 
     def load(self, filename):
@@ -482,3 +510,292 @@ class TStemplate:
     @property
     def filename(self) -> str:
         return "unknown" if self._filename is None else self._filename
+
+
+class TStemplateLibrary:
+    """
+    Library of the TS templates in a folder, indexed on their charge,
+    multiplicity, solvent and the hash of their graph. The templates that may
+    match a truncated graph are then found without parsing every template
+    file, or checking if every template graph is isomorphic to it. Parsed
+    templates are kept in a binary store in the folder, which is updated when
+    template files are added, changed or removed. The template files are
+    always the reference, so if concurrent writers update the store, any
+    templates missing from it are parsed again
+    """
+
+    store_filename = ".ts_templates.pkl"
+    _store_version = 1
+    _libraries = {}
+
+    def __init__(self, folder_path):
+        """
+        Library of the templates in a folder. Use from_folder() to get a
+        library that is shared in this process
+
+        -----------------------------------------------------------------------
+        Arguments:
+            folder_path (str): Path to the folder containing TS templates
+        """
+        self.folder_path = os.path.abspath(folder_path)
+
+        # Keyed with filename, with values of the file modification time and
+        # size, and the template data, which is None if it could not be loaded
+        self._entries = {}
+        self._index = defaultdict(list)
+        self._templates = {}
+        self._loaded_store = False
+
+    @classmethod
+    def from_folder(cls, folder_path=None, refresh=True):
+        """
+        Library of the templates in a folder, or the default if folder path
+        is None, that is created once in this process
+
+        -----------------------------------------------------------------------
+        Keyword Arguments:
+            folder_path (str | None):
+
+            refresh (bool): Update the library with any template files that
+                            have been added, changed or removed
+
+        Returns:
+            (autode.transition_states.templates.TStemplateLibrary):
+        """
+        folder_path = os.path.abspath(get_ts_template_folder_path(folder_path))
+
+        if folder_path not in cls._libraries:
+            cls._libraries[folder_path] = cls(folder_path)
+
+        library = cls._libraries[folder_path]
+        if refresh:
+            library.refresh()
+
+        return library
+
+    def __len__(self):
+        """Number of valid templates in this library"""
+        return sum(data is not None for _, data in self._entries.values())
+
+    @property
+    def templates(self):
+        """
+        All the valid templates, ordered by filename
+
+        -----------------------------------------------------------------------
+        Returns:
+            (list(autode.transition_states.templates.TStemplate)):
+        """
+        return [
+            self._template(filename)
+            for filename in sorted(self._entries)
+            if self._entries[filename][1] is not None
+        ]
+
+    def matching(self, reactant, truncated_graph):
+        """
+        Templates that match a truncated graph of a reactant. Only those with
+        the same charge, multiplicity, solvent and graph hash are checked
+
+        -----------------------------------------------------------------------
+        Arguments:
+            reactant (autode.complex.ReactantComplex):
+
+            truncated_graph (nx.Graph):
+
+        Returns:
+            (list(autode.transition_states.templates.TStemplate)): Ordered by
+            filename
+        """
+        key = self._key(
+            charge=reactant.charge,
+            mult=reactant.mult,
+            solvent=_solvent_name(reactant.solvent),
+            hash_=graph_hash(truncated_graph),
+        )
+        templates = [
+            self._template(filename) for filename in self._index.get(key, [])
+        ]
+        return [
+            template
+            for template in templates
+            if template_matches(reactant, truncated_graph, template)
+        ]
+
+    def refresh(self):
+        """
+        Update this library from the template files in the folder, only
+        parsing those that are not in the store or have been modified
+        """
+        if not self._loaded_store:
+            self._load_store()
+
+        stats = {}
+        if os.path.isdir(self.folder_path):
+            for entry in os.scandir(self.folder_path):
+                if entry.name.endswith(".txt") and entry.is_file():
+                    stat = entry.stat()
+                    stats[entry.name] = (stat.st_mtime_ns, stat.st_size)
+
+        removed = set(self._entries) - set(stats)
+        for filename in removed:
+            del self._entries[filename]
+
+        modified = [
+            filename
+            for filename, stat in stats.items()
+            if filename not in self._entries
+            or self._entries[filename][0] != stat
+        ]
+        for filename in modified:
+            self._entries[filename] = (stats[filename], self._parse(filename))
+
+        if len(removed) > 0 or len(modified) > 0:
+            logger.info(
+                f"Parsed {len(modified)} and removed {len(removed)} TS "
+                f"templates in {self.folder_path}"
+            )
+            self._build_index()
+            self._save_store()
+
+        return None
+
+    def add(self, file_path):
+        """
+        Add, or update, a single template file in this library and the store
+
+        -----------------------------------------------------------------------
+        Arguments:
+            file_path (str): Path to a template file in the folder
+        """
+        if not self._loaded_store:
+            # Loading the store adds any new template files
+            return self.refresh()
+
+        filename = os.path.basename(file_path)
+        stat = os.stat(os.path.join(self.folder_path, filename))
+
+        self._entries[filename] = (
+            (stat.st_mtime_ns, stat.st_size),
+            self._parse(filename),
+        )
+        self._build_index()
+        self._save_store()
+        return None
+
+    def _parse(self, filename):
+        """Data of a template file, or None if it could not be loaded"""
+        self._templates.pop(filename, None)
+
+        try:
+            template = TStemplate(
+                filename=os.path.join(self.folder_path, filename)
+            )
+        except TemplateLoadingFailed:
+            logger.warning(f"Failed to load a template for {filename}")
+            return None
+
+        return {
+            "solvent": _solvent_name(template.solvent),
+            "charge": template.charge,
+            "mult": template.mult,
+            "nodes": list(template.graph.nodes(data=True)),
+            "edges": list(template.graph.edges(data=True)),
+            "hash": graph_hash(template.graph),
+        }
+
+    def _template(self, filename):
+        """Template from its data in this library, created only once"""
+
+        if filename not in self._templates:
+            data = self._entries[filename][1]
+
+            graph = MolecularGraph()
+            graph.add_nodes_from(data["nodes"])
+            graph.add_edges_from(data["edges"])
+
+            solvent = None
+            if data["solvent"] is not None:
+                solvent = get_solvent(data["solvent"], kind="implicit")
+
+            template = TStemplate(
+                graph=graph,
+                charge=data["charge"],
+                mult=data["mult"],
+                solvent=solvent,
+            )
+            template._filename = os.path.join(self.folder_path, filename)
+            self._templates[filename] = template
+
+        return self._templates[filename]
+
+    @staticmethod
+    def _key(charge, mult, solvent, hash_):
+        return charge, mult, solvent, hash_
+
+    def _build_index(self):
+        self._index = defaultdict(list)
+
+        for filename in sorted(self._entries):
+            data = self._entries[filename][1]
+            if data is None:
+                continue
+
+            key = self._key(
+                charge=data["charge"],
+                mult=data["mult"],
+                solvent=data["solvent"],
+                hash_=data["hash"],
+            )
+            self._index[key].append(filename)
+
+        return None
+
+    @property
+    def _store_path(self):
+        return os.path.join(self.folder_path, self.store_filename)
+
+    def _load_store(self):
+        """Load the parsed templates from the store, if it exists"""
+        self._loaded_store = True
+
+        try:
+            with open(self._store_path, "rb") as file:
+                store = pickle.load(file)
+
+            assert store["version"] == self._store_version
+            self._entries = dict(store["entries"])
+
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        except (AssertionError, KeyError, TypeError, AttributeError):
+            logger.warning(f"Ignoring an invalid store {self._store_path}")
+            return None
+
+        self._build_index()
+        return None
+
+    def _save_store(self):
+        """Atomically replace the store with the parsed templates"""
+        if not os.path.isdir(self.folder_path):
+            return None
+
+        tmp_path = f"{self._store_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as file:
+                pickle.dump(
+                    {"version": self._store_version, "entries": self._entries},
+                    file,
+                    pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self._store_path)
+
+        except OSError as e:
+            logger.warning(f"Could not save the TS template store: {e}")
+
+        return None
+
+
+def _solvent_name(solvent):
+    return None if solvent is None else solvent.name
@@ -14,7 +14,7 @@ from autode.geom import calc_heavy_atom_rmsd
 from autode.log import logger
 from autode.methods import get_hmethod
 from autode.mol_graphs import get_truncated_active_mol_graph
-from autode.utils import requires_atoms, requires_graph, ProcessPool
+from autode.utils import requires_atoms, requires_graph, WorkerPool
 
 
 if TYPE_CHECKING:
@@ -150,7 +150,7 @@ class TransitionState(TSbase):
         distance_consts = self.active_bond_constraints
         self.conformers.clear()
 
-        with ProcessPool(max_workers=Config.n_cores) as pool:
+        with WorkerPool(max_workers=Config.n_cores) as pool:
             results = [
                 pool.submit(get_simanl_conformer, self, distance_consts, i)
                 for i in range(n_confs)
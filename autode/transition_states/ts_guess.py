@@ -1,8 +1,7 @@
 from typing import Optional, TYPE_CHECKING
 
 from autode.transition_states.base import TSbase
-from autode.transition_states.templates import get_ts_templates
-from autode.transition_states.templates import template_matches
+from autode.transition_states.templates import get_matching_ts_templates
 from autode.input_output import atoms_to_xyz_file
 from autode.calculations import Calculation
 from autode.constraints import DistanceConstraints
@@ -44,17 +43,10 @@ def has_matching_ts_templates(
     mol_graph = get_truncated_active_mol_graph(
         graph=reactant.graph, active_bonds=bond_rearr.all
     )
-    ts_guess_templates = get_ts_templates()
-
-    for ts_template in ts_guess_templates:
-        if template_matches(
-            reactant=reactant,
-            ts_template=ts_template,
-            truncated_graph=mol_graph,
-        ):
-            return True
-
-    return False
+    templates = get_matching_ts_templates(
+        reactant=reactant, truncated_graph=mol_graph
+    )
+    return len(templates) > 0
 
 
 def get_template_ts_guess(
@@ -91,14 +83,9 @@ def get_template_ts_guess(
         graph=reactant.graph, active_bonds=bond_rearr.all
     )
 
-    for ts_template in get_ts_templates():
-        if not template_matches(
-            reactant=reactant,
-            ts_template=ts_template,
-            truncated_graph=mol_graph,
-        ):
-            continue
-
+    for ts_template in get_matching_ts_templates(
+        reactant=reactant, truncated_graph=mol_graph
+    ):
         # Get the mapping from the matching template
         mapping = get_mapping_ts_template(
             larger_graph=mol_graph, smaller_graph=ts_template.graph
@@ -169,9 +156,9 @@ class TSguess(TSbase):
             charge=species.charge,
             mult=species.mult,
             name=f"ts_guess_{species.name}",
-            solvent_name=None
-            if species.solvent is None
-            else species.solvent.name,
+            solvent_name=(
+                None if species.solvent is None else species.solvent.name
+            ),
         )
 
         return ts_guess
@@ -1,14 +1,30 @@
 import os
 import sys
+import atexit
+import pickle
+import hashlib
 import platform
+import threading
 import shutil
 import copy
 import signal
 import warnings
 import contextlib
 from time import time
-from typing import Any, Optional, Sequence, List, Callable, TYPE_CHECKING
-from functools import wraps
+from typing import (
+    Any,
+    Optional,
+    Sequence,
+    List,
+    Dict,
+    Deque,
+    Callable,
+    TYPE_CHECKING,
+)
+from collections import deque
+from concurrent import futures
+from concurrent.futures import Future
+from functools import wraps, partial
 from subprocess import Popen, PIPE, STDOUT
 from tempfile import mkdtemp
 import multiprocessing
@@ -782,6 +798,266 @@ else:
         pass
 
 
+def _run_in_worker(
+    config_state: tuple, cwd: str, func: Callable, args: tuple, kwargs: dict
+) -> tuple:
+    """
+    Run a function in a persistent worker process, after synchronising the
+    Config and working directory with the process that submitted it
+
+    ---------------------------------------------------------------------------
+    Returns:
+        (tuple): Result, start time and end time
+    """
+    global _worker_config_digest
+    digest, config_bytes = config_state
+
+    if digest != _worker_config_digest:
+        _copy_into_current_config(pickle.loads(config_bytes))
+        _worker_config_digest = digest
+
+    try:
+        os.chdir(cwd)
+    except FileNotFoundError:
+        logger.warning(
+            f"Could not change into {cwd}. Running in {os.getcwd()}"
+        )
+
+    start_time = time()
+    result = func(*args, **kwargs)
+    return result, start_time, time()
+
+
+_worker_config_digest: Optional[bytes] = None
+
+
+class _SharedExecutor:
+    """
+    Process-wide pool of worker processes, created lazily and grown when more
+    workers are requested. Reused by every WorkerPool in this process so the
+    cost of forking and tearing down workers is only paid once
+    """
+
+    def __init__(self):
+        self._executor: Optional[Any] = None
+        self._n_workers = 0
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.n_tasks = 0
+        self.wait_time = 0.0
+        self.run_time = 0.0
+
+    def get(self, n_workers: int) -> Any:
+        """Get an executor with at least n_workers worker processes"""
+
+        with self._lock:
+            if (
+                self._executor is None
+                or self._pid != os.getpid()
+                or n_workers > self._n_workers
+                or getattr(self._executor, "_broken", False)
+            ):
+                if self._executor is not None and self._pid == os.getpid():
+                    # Any running tasks will still complete
+                    self._executor.shutdown(wait=False)
+
+                n_workers = max(n_workers, self._n_workers)
+                logger.info(f"Creating a worker pool with {n_workers} workers")
+                self._executor = ProcessPool(max_workers=n_workers)
+                self._n_workers = n_workers
+                self._pid = os.getpid()
+
+            return self._executor
+
+    def record(self, wait_time: float, run_time: float) -> None:
+        with self._lock:
+            self.n_tasks += 1
+            self.wait_time += wait_time
+            self.run_time += run_time
+
+    def shutdown(self) -> None:
+        """Shut down all the worker processes, if they exist"""
+
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=True)
+
+            self._executor = None
+            self._n_workers = 0
+
+
+_shared_executor = _SharedExecutor()
+atexit.register(_shared_executor.shutdown)
+
+
+class WorkerPool:
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Pool of worker processes, which runs at most max_workers tasks
+        concurrently on a persistent process-wide set of workers. Has the same
+        interface as a concurrent.futures.ProcessPoolExecutor, for example:
+
+        .. code-block:: Python
+
+            >>> with WorkerPool(max_workers=4) as pool:
+            ...     jobs = [pool.submit(func, x) for x in range(10)]
+            ...     results = [job.result() for job in jobs]
+
+        The time tasks spent queuing and running is available from
+        WorkerPool.stats(). If called from within a worker process then a
+        private pool of processes is created and shut down on exit.
+
+        -----------------------------------------------------------------------
+        Arguments:
+            max_workers: Maximum number of concurrent tasks. Defaults to
+                         Config.n_cores
+        """
+        n = Config.n_cores if max_workers is None else max_workers
+        self.max_workers = max(int(n), 1)
+
+        self._is_private = multiprocessing.parent_process() is not None
+        self._executor: Optional[Any] = None
+        self._config_state = _config_state()
+
+        self._lock = threading.Lock()
+        self._queue: Deque[tuple] = deque()
+        self._futures: List[Future] = []
+        self._n_running = 0
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Submit a function to be run with some arguments"""
+        future: Future = Future()
+        future.submit_time = time()  # type: ignore
+
+        with self._lock:
+            self._futures.append(future)
+            self._queue.append((future, fn, args, kwargs))
+
+        self._dispatch()
+        return future
+
+    def _dispatch(self) -> None:
+        """Submit queued tasks to the executor, up to max_workers at once"""
+
+        while True:
+            with self._lock:
+                if self._n_running >= self.max_workers or not self._queue:
+                    return None
+
+                future, fn, args, kwargs = self._queue.popleft()
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                self._n_running += 1
+
+            try:
+                job = self._get_executor().submit(
+                    _run_in_worker,
+                    self._config_state,
+                    os.getcwd(),
+                    fn,
+                    args,
+                    kwargs,
+                )
+            except Exception as e:
+                self._on_done(future, exception=e)
+                continue
+
+            job.add_done_callback(partial(self._on_job_done, future))
+
+    def _get_executor(self) -> Any:
+        if not self._is_private:
+            return _shared_executor.get(self.max_workers)
+
+        if self._executor is None:
+            self._executor = ProcessPool(max_workers=self.max_workers)
+
+        return self._executor
+
+    def _on_job_done(self, future: Future, job: Future) -> None:
+        try:
+            result, start_time, end_time = job.result()
+        except Exception as e:
+            return self._on_done(future, exception=e)
+
+        _shared_executor.record(
+            wait_time=start_time - future.submit_time,  # type: ignore
+            run_time=end_time - start_time,
+        )
+        return self._on_done(future, result=result)
+
+    def _on_done(
+        self,
+        future: Future,
+        result: Any = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            self._n_running -= 1
+
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+        self._dispatch()
+        return None
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """
+        Wait for all the submitted tasks of this pool to finish. Worker
+        processes are only shut down if this pool is private
+        """
+        if cancel_futures:
+            with self._lock:
+                for future, *_ in self._queue:
+                    future.cancel()
+                self._queue.clear()
+
+        if wait:
+            futures.wait(self._futures)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+        return None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    @staticmethod
+    def stats() -> Dict[str, float]:
+        """
+        Cumulative statistics of the tasks run on the persistent worker
+        processes, with times in seconds
+
+        -----------------------------------------------------------------------
+        Returns:
+            (dict): n_tasks, wait_time and run_time
+        """
+        return {
+            "n_tasks": _shared_executor.n_tasks,
+            "wait_time": _shared_executor.wait_time,
+            "run_time": _shared_executor.run_time,
+        }
+
+    @staticmethod
+    def shutdown_all() -> None:
+        """Shut down the persistent worker processes in this process"""
+        return _shared_executor.shutdown()
+
+
+def _config_state() -> tuple:
+    """Digest and pickled bytes of the current Config"""
+    config_bytes = pickle.dumps(Config)
+    return hashlib.md5(config_bytes).digest(), config_bytes
+
+
 def total_electrons(atoms):
     total_atomic_numbers = sum(atom.atomic_number for atom in atoms)
     transition_groups = list(range(3, 13, 1))
@@ -14,6 +14,18 @@ parallel NEB/conformer/Hessian sites stay safe. The provider loads the local UMA
 weights (fairchem is offline-gated on HF) and drives an ASE calculator +
 optimiser, writing ``results.json`` which the ``*_from`` parsers read back.
 
+Persistent provider daemon
+--------------------------
+Starting the provider re-imports torch/fairchem and reloads the checkpoint,
+which takes far longer than the inference itself. With
+``Config.UMA.persistent = True`` (the default) each autodE process -- the main
+process and every pool worker -- instead starts a single provider in
+``--serve`` mode on first use and sends it jobs over its stdin/stdout pipes, so
+the model is loaded once per worker. The daemon is still a separate process, so
+no CUDA context is ever created in autodE itself and fork safety is kept. The
+``results.json`` contract is unchanged, and the wrapper falls back to a one-shot
+subprocess if the daemon cannot be (re)started.
+
 Environment overrides
 ---------------------
 * ``UMA_PROVIDER_PYTHON`` -- interpreter that has fairchem/torch/ase. Defaults
@@ -43,12 +55,14 @@ References
 
 import os
 import json
+import atexit
+import subprocess
 import numpy as np
 
 import autode.wrappers.keywords as kws
 import autode.wrappers.methods
 
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 from autode.config import Config
 from autode.values import PotentialEnergy, Gradient, Coordinates
@@ -69,6 +83,98 @@ _DEFAULT_PROVIDER = os.path.normpath(
 )
 
 
+class UMADaemon:
+    """Long-lived UMA provider process that takes jobs over its pipes."""
+
+    def __init__(self, python: str, provider: str, n_cores: int = 1):
+        env = dict(os.environ)
+        env.setdefault("OMP_NUM_THREADS", str(n_cores))
+
+        self.process = subprocess.Popen(
+            [python, provider, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            text=True,
+            bufsize=1,
+        )
+        self.python, self.provider = python, provider
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def request(self, spec: dict) -> dict:
+        """
+        Run a single job in the daemon
+
+        -----------------------------------------------------------------------
+        Arguments:
+            spec: Job specification, as written to the provider input file
+
+        Returns:
+            (dict): Result, as written to results.json by the provider
+
+        Raises:
+            (RuntimeError): If the daemon has exited
+        """
+        try:
+            self.process.stdin.write(json.dumps(spec) + "\n")
+            self.process.stdin.flush()
+            line = self.process.stdout.readline()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise RuntimeError(f"UMA daemon failed: {e}")
+
+        if not line:
+            raise RuntimeError("UMA daemon exited")
+
+        return json.loads(line)
+
+    def close(self) -> None:
+        """Stop the daemon, which exits at the end of its input"""
+        if not self.is_alive:
+            return None
+
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+
+        return None
+
+
+# One daemon per process, keyed on pid so a forked worker never writes to a
+# daemon started by its parent
+_daemons: Dict[int, UMADaemon] = {}
+
+
+def _daemon_for(python: str, provider: str, n_cores: int = 1) -> UMADaemon:
+    """Running daemon for this process, starting one if required"""
+    daemon = _daemons.get(os.getpid(), None)
+
+    if (
+        daemon is None
+        or not daemon.is_alive
+        or (daemon.python, daemon.provider) != (python, provider)
+    ):
+        if daemon is not None:
+            daemon.close()
+
+        daemon = _daemons[os.getpid()] = UMADaemon(python, provider, n_cores)
+
+    return daemon
+
+
+@atexit.register
+def shutdown_daemons() -> None:
+    """Stop the UMA daemon started by this process, if there is one"""
+    daemon = _daemons.pop(os.getpid(), None)
+    if daemon is not None:
+        daemon.close()
+
+
 class UMA(autode.wrappers.methods.ExternalMethodOEGH):
     """UMA MLIP relaxation wrapper (external-IO subprocess)."""
 
@@ -166,16 +272,45 @@ class UMA(autode.wrappers.methods.ExternalMethodOEGH):
         return f"{calc.name}_uma.out"
 
     def execute(self, calc: "CalculationExecutor") -> None:
+        n_cores = getattr(calc, "n_cores", 1) or 1
+
+        if Config.UMA.persistent and self._execute_in_daemon(calc, n_cores):
+            return None
+
         # Run the provider with the env's Python in a fresh subprocess. It
         # writes results.json into the calc directory, which the *_from parsers
         # read back. A fresh process = its own CUDA context (fork-safe).
-        n_cores = getattr(calc, "n_cores", 1) or 1
         os.environ.setdefault("OMP_NUM_THREADS", str(n_cores))
         run_external(
             params=[self.path, self.provider, self.input_filename_for(calc)],
             output_filename=self.output_filename_for(calc),
         )
 
+    def _execute_in_daemon(self, calc: "CalculationExecutor", n_cores: int):
+        """Run a calculation in this process's daemon. True if it ran"""
+        with open(self.input_filename_for(calc), "r") as fh:
+            spec = json.load(fh)
+
+        result: Optional[dict] = None
+        for _ in range(2):  # Restart a daemon that has died, once
+            try:
+                daemon = _daemon_for(self.path, self.provider, n_cores)
+                result = daemon.request(spec)
+                break
+            except (RuntimeError, OSError, ValueError) as e:
+                logger.warning(f"UMA daemon failed: {e}")
+                shutdown_daemons()
+
+        if result is None:
+            logger.warning("Falling back to a UMA subprocess per calculation")
+            return False
+
+        for filename in ("results.json", self.output_filename_for(calc)):
+            with open(filename, "w") as fh:
+                json.dump(result, fh)
+
+        return True
+
     # -- output parsing -----------------------------------------------------
     @staticmethod
     def _results(calc) -> dict:
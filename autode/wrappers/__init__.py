@@ -38,6 +38,9 @@ from autode.wrappers.mlip_external import (
     get_available_mlip_models,
     find_best_mlip_server,
     run_mlip_single_point,
+    MLIPBatchCalculation,
+    run_mlip_batch,
+    MLIP,
     create_extopt_script,
     generate_qm_mlip_oniom_input,
     generate_mlip_xtb_hybrid_input,
@@ -71,6 +74,9 @@ __all__ = [
     "get_available_mlip_models",
     "find_best_mlip_server",
     "run_mlip_single_point",
+    "MLIPBatchCalculation",
+    "run_mlip_batch",
+    "MLIP",
     "create_extopt_script",
     "generate_qm_mlip_oniom_input",
     "generate_mlip_xtb_hybrid_input",
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from shutil import which
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Sequence, TYPE_CHECKING
 from pathlib import Path
 
 from autode.log import logger
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from autode.calculations.types import CalculationType
     from autode.opt.optimisers.base import BaseOptimiser
     from autode.atoms import Atoms
+    from autode.species.species import Species
 
 
 class Method(ABC):
@@ -72,6 +73,32 @@ class Method(ABC):
         """Did the calculation terminate normally?"""
         return True
 
+    @property
+    def implements_batch(self) -> bool:
+        """
+        Can this method evaluate the energies and gradients of a set of
+        species in a single call? See :meth:`batch_energy_gradient`
+        """
+        return False
+
+    def batch_energy_gradient(
+        self, species: Sequence["Species"], n_cores: int = 1
+    ) -> None:
+        """
+        Set the energy and gradient of every species in a set with a single
+        call, which may be much faster than one calculation per species
+
+        -----------------------------------------------------------------------
+        Arguments:
+            species: Species to evaluate. Modified in place
+
+            n_cores: Number of cores available
+
+        Raises:
+            (autode.exceptions.NotImplementedInMethod):
+        """
+        raise NotImplementedInMethod
+
     @property
     def doi_str(self):
         return " ".join(self.doi_list)
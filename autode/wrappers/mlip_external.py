@@ -15,11 +15,16 @@ Reference:
     https://www.faccts.de/docs/orca/6.1/manual/
 """
 
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Sequence, TYPE_CHECKING
 from dataclasses import dataclass, field
+from urllib.parse import urlsplit
 import os
 import subprocess
 import json
+import threading
+import http.client
+
+import numpy as np
 
 from autode.wrappers.keywords.orca6 import (
     MLIPConfig,
@@ -35,6 +40,16 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+from autode.wrappers.methods import Method
+from autode.wrappers.keywords import KeywordsSet
+from autode.calculations.types import CalculationType
+from autode.values import PotentialEnergy, Gradient
+from autode.units import ha_per_a0
+
+if TYPE_CHECKING:
+    from autode.species.species import Species
+    from autode.calculations.executors import CalculationExecutor
+
 
 # Normal operation has exactly one default: the JSON router.  Direct JSON
 # backends are an administrator-only escape hatch, and the :5003 entries use a
@@ -141,6 +156,127 @@ class MLIPCalculation:
     coordinates: Optional[List[Tuple[str, float, float, float]]] = None
 
 
+class _KeepAliveConnections:
+    """
+    Per-thread pool of persistent HTTP/1.1 connections, keyed by host, so
+    repeated requests to the router reuse a single TCP connection rather than
+    opening a new one for every geometry.
+    """
+
+    def __init__(self, timeout: float = 30):
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connections(
+        self,
+    ) -> Dict[Tuple[str, str, int], http.client.HTTPConnection]:
+        # Sockets inherited by a forked worker process must not be shared
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.connections = {}
+            self._local.pid = os.getpid()
+        return self._local.connections
+
+    def post_json(self, url: str, payload: Dict[str, Any]) -> Tuple[int, Any]:
+        """
+        POST a JSON payload and return the status code and decoded response.
+        A stale keep-alive connection (closed by the server) is reopened once.
+
+        Args:
+            url: Full URL to POST to
+            payload: JSON serialisable payload
+
+        Returns:
+            (status, decoded JSON or None)
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "localhost", port)
+        path = parts.path or "/"
+
+        body = json.dumps(payload).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+
+        for attempt in range(2):
+            conn = self._connections().get(key)
+            if conn is None:
+                conn_type = (
+                    http.client.HTTPSConnection
+                    if scheme == "https"
+                    else http.client.HTTPConnection
+                )
+                conn = conn_type(key[1], port, timeout=self.timeout)
+                self._connections()[key] = conn
+
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()  # Must be read fully to reuse
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                del self._connections()[key]
+                if attempt == 1:
+                    raise
+                continue
+
+            if response.will_close:
+                conn.close()
+                del self._connections()[key]
+
+            try:
+                return response.status, json.loads(data.decode())
+            except ValueError:
+                return response.status, None
+
+        raise RuntimeError("Unreachable")  # pragma: no cover
+
+    def close(self) -> None:
+        """Close all the connections opened by this thread"""
+        for conn in self._connections().values():
+            conn.close()
+        self._connections().clear()
+
+
+_connections = _KeepAliveConnections()
+
+# Servers found not to implement the batch endpoint, which fall back to
+# sequential requests over a keep-alive connection
+_servers_without_batch: set = set()
+
+
+def _forces_from(
+    result: Dict[str, Any], n_atoms: int
+) -> Optional[List[Tuple[float, float, float]]]:
+    """
+    Extract forces from a router response, handling both the 'forces' and
+    flat 'gradient' (forces = -gradient) formats.
+    """
+    forces = result.get("forces", None)
+    if forces is None and "gradient" in result:
+        gradient = result["gradient"]
+        forces = [
+            (-gradient[i * 3], -gradient[i * 3 + 1], -gradient[i * 3 + 2])
+            for i in range(n_atoms)
+        ]
+    return forces
+
+
+def _mlip_payload(
+    coordinates: List[Tuple[str, float, float, float]],
+    charge: int,
+    multiplicity: int,
+) -> Dict[str, Any]:
+    return {
+        "atoms": [elem for elem, x, y, z in coordinates],
+        "coordinates": [[x, y, z] for elem, x, y, z in coordinates],
+        "charge": charge,
+        "mult": multiplicity,
+    }
+
+
 def run_mlip_single_point(
     coordinates: List[Tuple[str, float, float, float]],
     charge: int = 0,
@@ -165,54 +301,209 @@ def run_mlip_single_point(
         server_url = find_best_mlip_server() or ROUTER_URL
 
     try:
-        import urllib.request
-        import json
+        payload = _mlip_payload(coordinates, charge, multiplicity)
+        payload.update({"model": model, "dograd": True})
+
+        url = f"{server_url.rstrip('/')}/calculate"
+        status, result = _connections.post_json(url, payload)
+
+        if status != 200 or not isinstance(result, dict):
+            raise RuntimeError(f"HTTP {status} from {url}")
+
+        return MLIPCalculation(
+            energy=result.get("energy", 0.0),
+            forces=_forces_from(result, n_atoms=len(coordinates)),
+            coordinates=coordinates,
+        )
+    except Exception as e:
+        raise RuntimeError(f"MLIP calculation failed: {e}")
+
+
+@dataclass
+class MLIPBatchCalculation:
+    """Result of a batched MLIP calculation over several geometries."""
 
-        # Prepare request
-        atoms = [elem for elem, x, y, z in coordinates]
-        coords = [[x, y, z] for elem, x, y, z in coordinates]
+    energies: np.ndarray  # Hartrees, shape = (n_geometries,)
+    forces: List[np.ndarray]  # Hartrees/Bohr, each shape = (n_atoms, 3)
 
+
+def run_mlip_batch(
+    geometries: Sequence[List[Tuple[str, float, float, float]]],
+    charges: Optional[Sequence[int]] = None,
+    multiplicities: Optional[Sequence[int]] = None,
+    model: str = "aimnet2",
+    server_url: Optional[str] = None,
+) -> MLIPBatchCalculation:
+    """
+    Run single-point MLIP calculations on several geometries in a single
+    request to the router's /calculate_batch endpoint. If the server does not
+    implement batching then each geometry is sent in turn, reusing the same
+    keep-alive connection.
+
+    Args:
+        geometries: Atomic coordinates of each geometry, as
+                    [(element, x, y, z), ...]
+        charges: Molecular charge of each geometry (0 if None)
+        multiplicities: Spin multiplicity of each geometry (1 if None)
+        model: MLIP model name (aimnet2, uma, etc.)
+        server_url: MLIP server URL (the GPG router if None)
+
+    Returns:
+        MLIPBatchCalculation with energies and forces
+    """
+    n = len(geometries)
+    charges = [0] * n if charges is None else list(charges)
+    multiplicities = (
+        [1] * n if multiplicities is None else list(multiplicities)
+    )
+
+    if server_url is None:
+        server_url = find_best_mlip_server() or ROUTER_URL
+    server_url = server_url.rstrip("/")
+
+    if n == 0:
+        return MLIPBatchCalculation(energies=np.zeros(0), forces=[])
+
+    results = None
+    if server_url not in _servers_without_batch:
         payload = {
-            "atoms": atoms,
-            "coordinates": coords,
-            "charge": charge,
-            "mult": multiplicity,
             "model": model,
             "dograd": True,
+            "structures": [
+                _mlip_payload(geom, charge, mult)
+                for geom, charge, mult in zip(
+                    geometries, charges, multiplicities
+                )
+            ],
         }
+        try:
+            status, response = _connections.post_json(
+                f"{server_url}/calculate_batch", payload
+            )
+        except Exception as e:
+            raise RuntimeError(f"MLIP batch calculation failed: {e}")
+
+        if status in (404, 405, 501):
+            logger.warning(
+                f"{server_url} does not implement batched calculations. "
+                f"Falling back to sequential requests"
+            )
+            _servers_without_batch.add(server_url)
+
+        elif status != 200 or not isinstance(response, dict):
+            raise RuntimeError(f"MLIP batch calculation failed: HTTP {status}")
+
+        else:
+            results = response.get("results", [])
+            if len(results) != n:
+                raise RuntimeError(
+                    f"MLIP batch calculation failed: expected {n} results, "
+                    f"had {len(results)}"
+                )
+
+    if results is None:
+        calcs = [
+            run_mlip_single_point(geom, charge, mult, model, server_url)
+            for geom, charge, mult in zip(geometries, charges, multiplicities)
+        ]
+        energies = [calc.energy for calc in calcs]
+        forces = [calc.forces for calc in calcs]
+    else:
+        energies = [result.get("energy", 0.0) for result in results]
+        forces = [
+            _forces_from(result, n_atoms=len(geom))
+            for result, geom in zip(results, geometries)
+        ]
+
+    if any(f is None for f in forces):
+        raise RuntimeError("MLIP batch calculation failed: missing forces")
+
+    return MLIPBatchCalculation(
+        energies=np.array(energies, dtype=float),
+        forces=[np.array(f, dtype=float).reshape(-1, 3) for f in forces],
+    )
+
+
+class MLIP(Method):
+    """
+    Machine learning interatomic potential evaluated by the MLIP router. Runs
+    in memory (no input/output files) and implements energies and gradients,
+    so optimisations use the autodE optimisers and Hessians are numerical.
+    Sets of geometries, e.g. NEB images, conformers or numerical Hessian
+    displacements, are evaluated in a single batched request.
+    """
 
-        url = f"{server_url.rstrip('/')}/calculate"
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
+    def __init__(
+        self, model: str = "aimnet2", server_url: Optional[str] = None
+    ):
+        super().__init__(
+            name="mlip",
+            keywords_set=KeywordsSet(),
+            doi_list=[],
         )
+        self.model = model
+        self._server_url = server_url
+
+    @property
+    def server_url(self) -> str:
+        """URL of the router, found on first use if not set"""
+        if self._server_url is None:
+            self._server_url = find_best_mlip_server() or ROUTER_URL
+        return self._server_url
+
+    @property
+    def uses_external_io(self) -> bool:
+        return False
 
-        with urllib.request.urlopen(req, timeout=30) as response:
-            result = json.loads(response.read().decode())
-
-        # Handle both 'forces' and 'gradient' response formats
-        # Gateway returns 'gradient' as flat array; forces = -gradient
-        forces = result.get("forces", None)
-        if forces is None and "gradient" in result:
-            gradient = result["gradient"]
-            # Convert flat gradient array to list of (fx, fy, fz) tuples
-            # and negate (force = -gradient)
-            n_atoms = len(atoms)
-            forces = [
-                (-gradient[i * 3], -gradient[i * 3 + 1], -gradient[i * 3 + 2])
-                for i in range(n_atoms)
-            ]
+    @property
+    def is_available(self) -> bool:
+        return check_mlip_server(self.server_url)
 
-        return MLIPCalculation(
-            energy=result.get("energy", 0.0),
-            forces=forces,
-            coordinates=coordinates,
+    def __repr__(self):
+        return f"MLIP(model = {self.model})"
+
+    def implements(self, calculation_type: "CalculationType") -> bool:
+        return calculation_type in (
+            CalculationType.energy,
+            CalculationType.gradient,
         )
-    except Exception as e:
-        raise RuntimeError(f"MLIP calculation failed: {e}")
+
+    @property
+    def implements_batch(self) -> bool:
+        return True
+
+    def execute(self, calc: "CalculationExecutor") -> None:
+        """Evaluate the energy and gradient of the molecule in a calculation"""
+        return self.batch_energy_gradient([calc.molecule])
+
+    def batch_energy_gradient(
+        self, species: Sequence["Species"], n_cores: int = 1
+    ) -> None:
+        """
+        Set the energy and gradient of a set of species with a single request
+
+        Args:
+            species: Species to evaluate
+            n_cores: *UNUSED*
+        """
+        result = run_mlip_batch(
+            geometries=[
+                [(atom.label, *map(float, atom.coord)) for atom in mol.atoms]
+                for mol in species
+            ],
+            charges=[mol.charge for mol in species],
+            multiplicities=[mol.mult for mol in species],
+            model=self.model,
+            server_url=self.server_url,
+        )
+
+        for mol, energy, forces in zip(
+            species, result.energies, result.forces
+        ):
+            mol.energy = PotentialEnergy(energy, units="Ha", method=self)
+            mol.gradient = Gradient(-forces, units=ha_per_a0).to("Ha Å^-1")
+
+        return None
 
 
 def create_extopt_script(
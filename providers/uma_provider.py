@@ -15,6 +15,11 @@ Invocation::
 
     <env-python> uma_provider.py <input.json>
 
+or, as a long-lived daemon that loads the model once and takes jobs over its
+stdin/stdout pipes (one JSON object per line in, one result per line out)::
+
+    <env-python> uma_provider.py --serve
+
 ``input.json`` (written by the autodE wrapper)::
 
     {
@@ -46,6 +51,11 @@ stdout) with, as available for the task::
 
 On any failure it writes ``{"ok": false, "error": "..."}`` and exits non-zero so
 the autodE side fails soft (its ``terminated_normally_in`` returns False).
+
+In ``--serve`` mode the same result objects are written as single lines to
+stdout (nothing is written to disk) and the daemon exits at EOF on stdin. The
+calculator for each (model, task_name, device) is built once and reused, so
+only the first job pays for importing torch/fairchem and loading the weights.
 """
 
 from __future__ import annotations
@@ -100,6 +110,17 @@ def _load_calculator(model_path, task_name, device):
     return FAIRChemCalculator(predict_unit, task_name=task_name)
 
 
+_CALCULATORS = {}
+
+
+def _calculator(model_path, task_name, device):
+    """Calculator for a model, built on first use and reused thereafter."""
+    key = (model_path, task_name, device)
+    if key not in _CALCULATORS:
+        _CALCULATORS[key] = _load_calculator(model_path, task_name, device)
+    return _CALCULATORS[key]
+
+
 def _atoms_from(spec):
     from ase import Atoms
 
@@ -129,7 +150,7 @@ def run(spec):
 
     device = "cuda" if torch.cuda.is_available() else "cpu"
 
-    calc = _load_calculator(model, task_name, device)
+    calc = _calculator(model, task_name, device)
     atoms = _atoms_from(spec)
     atoms.calc = calc
 
@@ -186,7 +207,39 @@ def run(spec):
     return out
 
 
+def serve(stdin, stdout):
+    """Run jobs read line-by-line from stdin until EOF, one result per line."""
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            result = run(json.loads(line))
+        except Exception as exc:  # fail soft, keep serving
+            result = {
+                "ok": False,
+                "error": f"{exc}",
+                "traceback": traceback.format_exc(),
+            }
+        stdout.write(json.dumps(result) + "\n")
+        stdout.flush()
+    return 0
+
+
+def _serve_main():
+    # Keep the protocol pipe for results only: anything torch/fairchem print
+    # (including from C extensions) goes to stderr instead
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    try:
+        return serve(sys.stdin, protocol)
+    finally:
+        protocol.close()
+
+
 def main(argv):
+    if len(argv) > 1 and argv[1] == "--serve":
+        return _serve_main()
+
     if len(argv) < 2:
         json.dump({"ok": False, "error": "usage: uma_provider.py <input.json>"},
                   sys.stdout)
@@ -0,0 +1,89 @@
+"""
+Micro-benchmarks of getting and setting the coordinates of a set of atoms, as
+performed in every step of an optimisation, NEB or conformer generation, and
+of distances, angles and dihedrals evaluated one at a time as Values or all at
+once as arrays. Usage::
+
+    python tests/benchmark_atoms.py --n_atoms 300
+"""
+
+import argparse
+import numpy as np
+from timeit import timeit
+from autode.atoms import Atom, Atoms
+from autode.species.molecule import Molecule
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_atoms",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Number of atoms",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeats",
+        type=int,
+        default=200,
+        help="Number of repeats of each operation",
+    )
+    return parser.parse_args()
+
+
+def benchmarks(n_atoms):
+    """Dictionary of name: callable for a set of atoms"""
+    rng = np.random.default_rng(seed=0)
+    atoms = Atoms(
+        [Atom("C", *rng.uniform(0, 10, size=3)) for _ in range(n_atoms)]
+    )
+    mol = Molecule(atoms=atoms)
+    new_coords = rng.uniform(0, 10, size=(n_atoms, 3))
+
+    def round_trip():
+        mol.coordinates = mol.coordinates + 0.01
+
+    def atom_update():
+        atoms[0].translate(0.01, 0.0, 0.0)
+        _ = atoms.coordinates
+
+    return {
+        "get": lambda: atoms.coordinates,
+        "set": lambda: setattr(atoms, "coordinates", new_coords),
+        "set flat": lambda: setattr(mol, "coordinates", new_coords.flatten()),
+        "get + set": round_trip,
+        "atom + get": atom_update,
+    }
+
+
+def geometry_benchmarks(n_atoms):
+    """Dictionary of name: callable for distances, angles and dihedrals of
+    n_atoms sets of atoms"""
+    rng = np.random.default_rng(seed=0)
+    mol = Molecule(
+        atoms=[Atom("C", *rng.uniform(0, 10, size=3)) for _ in range(n_atoms)]
+    )
+    idxs = np.array([rng.permutation(n_atoms)[:4] for _ in range(n_atoms)])
+
+    return {
+        "distance": lambda: [mol.distance(*i) for i in idxs[:, :2]],
+        "distances": lambda: mol.distances(idxs[:, :2]),
+        "angle": lambda: [mol.angle(*i) for i in idxs[:, :3]],
+        "angles": lambda: mol.angles(idxs[:, :3]),
+        "dihedral": lambda: [mol.dihedral(*i) for i in idxs],
+        "dihedrals": lambda: mol.dihedrals(idxs),
+    }
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print(f'{"n_atoms":>8}{"operation":>14}{"time / μs":>14}')
+
+    for n in args.n_atoms:
+        funcs = {**benchmarks(n), **geometry_benchmarks(n)}
+        for name, func in funcs.items():
+            t = timeit(func, number=args.repeats) / args.repeats
+            print(f"{n:>8}{name:>14}{t * 1e6:>14.1f}")
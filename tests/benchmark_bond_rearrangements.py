@@ -0,0 +1,77 @@
+"""
+Benchmark of finding the bond rearrangements of a retro-ene reaction of a
+terminal alkene to propene and a shorter alkene, comparing an isomorphism
+check of every rearranged reactant graph with the filter on the graph
+invariants of the product. Rearrangements must be identical. Usage::
+
+    python tests/benchmark_bond_rearrangements.py --n_carbons 7 9 11
+"""
+
+import argparse
+from time import time
+from autode import bond_rearrangement as br
+from autode.mol_graphs import is_isomorphic
+from autode.species.molecule import Molecule
+from autode.species.complex import ReactantComplex, ProductComplex
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_carbons",
+        type=int,
+        nargs="+",
+        default=[7, 9, 11],
+        help="Number of carbon atoms in the reactant alkene",
+    )
+    return parser.parse_args()
+
+
+class UnfilteredGraphFilter(br.ProductGraphFilter):
+    """Isomorphism check of every rearranged reactant graph"""
+
+    def _makes_product(self, fbonds, bbonds):
+        self.n_isomorphism_checks += 1
+        return is_isomorphic(
+            br.generate_rearranged_graph(self.reactant_graph, fbonds, bbonds),
+            self.product_graph,
+        )
+
+
+def retro_ene(n_carbons):
+    """Reactant and product complexes of a retro-ene reaction"""
+    reactant = ReactantComplex(Molecule(smiles="C=C" + "C" * (n_carbons - 2)))
+    product = ProductComplex(
+        Molecule(smiles="C=CC"), Molecule(smiles="C=C" + "C" * (n_carbons - 5))
+    )
+    return reactant, product
+
+
+def timing(reactant, product):
+    start_time = time()
+    rearrangements = br.get_bond_rearrangs(
+        reactant, product, name="retro_ene", save=False
+    )
+    return time() - start_time, rearrangements
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print(f'{"n_atoms":>8}{"VF2 / s":>10}{"filter / s":>12}{"speedup":>9}')
+
+    for n_carbons in args.n_carbons:
+        reactant, product = retro_ene(n_carbons)
+
+        graph_filter = br.ProductGraphFilter
+        br.ProductGraphFilter = UnfilteredGraphFilter
+        t_unfiltered, unfiltered_rearrangements = timing(reactant, product)
+
+        br.ProductGraphFilter = graph_filter
+        t_filtered, rearrangements = timing(reactant, product)
+
+        assert rearrangements == unfiltered_rearrangements
+        print(
+            f"{reactant.n_atoms:>8}{t_unfiltered:>10.3f}{t_filtered:>12.3f}"
+            f"{t_unfiltered / t_filtered:>9.1f}"
+        )
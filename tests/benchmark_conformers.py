@@ -0,0 +1,88 @@
+"""
+Benchmark of pruning a set of conformers on heavy atom RMSD, comparing the
+batched, lower-bound screened search in Conformers.prune_on_rmsd with an RMSD
+calculation for every pair of conformers. The conformers kept must be
+identical. Usage::
+
+    python tests/benchmark_conformers.py --n_confs 100 1000
+"""
+
+import argparse
+import numpy as np
+from time import time
+from autode.atoms import Atom
+from autode.geom import calc_heavy_atom_rmsd
+from autode.conformers import Conformer, Conformers
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_confs",
+        type=int,
+        nargs="+",
+        default=[100, 300],
+        help="Number of conformers",
+    )
+    parser.add_argument(
+        "-a",
+        "--n_atoms",
+        type=int,
+        default=30,
+        help="Number of atoms in each conformer",
+    )
+    return parser.parse_args()
+
+
+def conformers(n_confs, n_atoms):
+    """Conformers as random perturbations of a random structure"""
+    rng = np.random.default_rng(seed=0)
+    labels = rng.choice(["C", "N", "O", "H", "H"], size=n_atoms)
+    coords = rng.uniform(0, 5, size=(n_atoms, 3))
+
+    confs = Conformers()
+    for i, scale in enumerate(rng.uniform(0.0, 1.0, size=n_confs)):
+        conf = Conformer(
+            name=f"conf{i}", atoms=[Atom(label) for label in labels]
+        )
+        conf.coordinates = coords + rng.normal(scale=scale, size=coords.shape)
+        confs.append(conf)
+
+    return confs
+
+
+def pairwise_prune(confs, rmsd_tol):
+    """Conformers kept by an RMSD calculation per pair of conformers"""
+    idxs = list(range(len(confs)))
+    for idx in reversed(range(len(confs) - 1)):
+        if any(
+            calc_heavy_atom_rmsd(confs[idx].atoms, confs[o_idx].atoms)
+            < rmsd_tol
+            for o_idx in idxs
+            if o_idx != idx
+        ):
+            idxs.remove(idx)
+
+    return [confs[i].name for i in idxs]
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print(
+        f'{"n_confs":>8}{"n_kept":>8}{"pairwise / s":>14}{"batched / s":>14}'
+    )
+
+    for n in args.n_confs:
+        confs = conformers(n, args.n_atoms)
+
+        start_time = time()
+        expected = pairwise_prune(confs, rmsd_tol=0.3)
+        t_pairwise = time() - start_time
+
+        start_time = time()
+        confs.prune_on_rmsd(rmsd_tol=0.3)
+        t_batched = time() - start_time
+
+        assert [conf.name for conf in confs] == expected
+        print(f"{n:>8}{len(confs):>8}{t_pairwise:>14.3f}{t_batched:>14.3f}")
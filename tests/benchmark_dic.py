@@ -0,0 +1,63 @@
+"""
+Benchmark of constructing delocalised internal coordinates (DIC) for linear
+alkanes, comparing the eigendecomposition of the n_primitives x n_primitives
+G = B B^T matrix with that of the 3N x 3N B^T B matrix used in
+DIC._calc_U. The non-redundant spaces must be identical. Usage::
+
+    python tests/benchmark_dic.py --n_carbons 50 100 200
+"""
+
+import argparse
+import numpy as np
+from time import time
+from autode.species.molecule import Molecule
+from autode.opt.coordinates import CartesianCoordinates
+from autode.opt.coordinates.dic import DIC
+from autode.opt.coordinates.internals import AnyPIC
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_carbons",
+        type=int,
+        nargs="+",
+        default=[20, 50, 100],
+        help="Number of carbon atoms in the alkane",
+    )
+    return parser.parse_args()
+
+
+def dense_g_u(pic, x):
+    """Non-redundant eigenvectors of the full G matrix"""
+    B = pic.get_B(x)
+    lambd, u = np.linalg.eigh(B @ B.T)
+    return u[:, np.abs(lambd) > 1e-10]
+
+
+def timings(n_carbons):
+    """Times to form U from G and from B^T B"""
+    mol = Molecule(smiles="C" * n_carbons)
+    x = CartesianCoordinates(mol.coordinates)
+    pic = AnyPIC.from_species(mol)
+
+    start_time = time()
+    u_ref = dense_g_u(pic, x)
+    t_dense = time() - start_time
+
+    start_time = time()
+    U = DIC._calc_U(pic, x)
+    t_sparse = time() - start_time
+
+    assert np.allclose(U @ U.T, u_ref @ u_ref.T, atol=1e-6)
+    return mol.n_atoms, len(pic), t_dense, t_sparse
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print(f'{"n_atoms":>8}{"n_prims":>9}{"G / s":>10}{"B^T B / s":>12}')
+
+    for n in args.n_carbons:
+        n_atoms, n_prims, t_dense, t_sparse = timings(n)
+        print(f"{n_atoms:>8}{n_prims:>9}{t_dense:>10.3f}{t_sparse:>12.3f}")
@@ -0,0 +1,132 @@
+"""
+Benchmark of bond perception in molecular graph generation on every .xyz
+structure in the zipped test data and a large water cluster, comparing the
+neighbour search in mol_graphs.make_graph with a search over all pairs of
+atoms. Graphs must be identical. Usage::
+
+    python tests/benchmark_graphs.py
+"""
+
+import os
+import itertools
+import zipfile
+import tempfile
+import numpy as np
+from time import time
+from scipy.spatial import distance_matrix
+from autode import mol_graphs
+from autode.atoms import Atom
+from autode.species.species import Species
+from autode.input_output import xyz_file_to_atoms
+from autode.exceptions import XYZfileWrongFormat
+
+here = os.path.dirname(os.path.abspath(__file__))
+data_path = os.path.join(here, "data")
+
+
+def pairwise_make_graph(species, rel_tolerance=0.3):
+    """Graph generation by checking every pair of atoms"""
+    graph = mol_graphs.MolecularGraph()
+    for i, atom in enumerate(species.atoms):
+        graph.add_node(i, atom_label=atom.label, stereo=False)
+
+    coords = species.coordinates
+    dist_mat = distance_matrix(coords, coords)
+
+    for i in range(species.n_atoms):
+        for j in np.argsort(dist_mat[i]):
+            if i == j:
+                continue
+
+            avg_bond_length = species.atoms.eqm_bond_distance(i, j)
+            if (
+                dist_mat[i, j] <= avg_bond_length * (1.0 + rel_tolerance)
+                and (i, j) not in graph.edges
+            ):
+                graph.add_edge(i, j, pi=False, active=False)
+
+    return graph
+
+
+def structures():
+    """Species from all the .xyz files in the zipped test data"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for filename in sorted(os.listdir(data_path)):
+            if not filename.endswith(".zip"):
+                continue
+
+            with zipfile.ZipFile(os.path.join(data_path, filename)) as file:
+                file.extractall(os.path.join(tmp_dir, filename))
+
+        for dirpath, _, filenames in sorted(os.walk(tmp_dir)):
+            for filename in sorted(filenames):
+                if not filename.endswith(".xyz") or filename.startswith("."):
+                    continue
+
+                try:
+                    atoms = xyz_file_to_atoms(os.path.join(dirpath, filename))
+                except (XYZfileWrongFormat, ValueError, UnicodeDecodeError):
+                    continue
+
+                yield Species(filename, atoms=atoms, charge=0, mult=1)
+
+
+def water_cluster(n_side=5):
+    """Cubic cluster of n_side^3 water molecules 3 Å apart"""
+    water = [
+        Atom("O", 0.0, 0.0, 0.0),
+        Atom("H", 0.757, 0.586, 0.0),
+        Atom("H", -0.757, 0.586, 0.0),
+    ]
+    atoms = []
+    for shift in itertools.product(range(n_side), repeat=3):
+        for atom in water:
+            atoms.append(
+                Atom(atom.label, *(atom.coord + 3.0 * np.array(shift)))
+            )
+
+    return Species("water_cluster", atoms=atoms, charge=0, mult=1)
+
+
+def _edges(graph):
+    return sorted(tuple(sorted(edge)) for edge in graph.edges)
+
+
+def timings(species):
+    """Time for bond perception with and without a neighbour search"""
+    start_time = time()
+    graph = pairwise_make_graph(species)
+    t_pairwise = time() - start_time
+
+    start_time = time()
+    mol_graphs._bonded_pairs(species, rel_tolerance=0.3)
+    t_neighbours = time() - start_time
+
+    mol_graphs.make_graph(species, allow_invalid_valancies=True)
+    assert _edges(graph) == _edges(species.graph), species.name
+
+    return t_pairwise, t_neighbours
+
+
+if __name__ == "__main__":
+    n_structures, t_pairwise, t_neighbours = 0, 0.0, 0.0
+
+    for species in structures():
+        times = timings(species)
+        t_pairwise += times[0]
+        t_neighbours += times[1]
+        n_structures += 1
+
+    print(f"{n_structures} structures with identical graphs")
+    print(
+        f"all pairs: {t_pairwise:.3f} s, neighbour search: "
+        f"{t_neighbours:.3f} s ({t_pairwise / t_neighbours:.0f}x)"
+    )
+
+    cluster = water_cluster()
+    t_pairwise, t_neighbours = timings(cluster)
+    print(
+        f"{cluster.n_atoms} atom water cluster. all pairs: {t_pairwise:.3f} "
+        f"s, neighbour search: {t_neighbours:.4f} s "
+        f"({t_pairwise / t_neighbours:.0f}x)"
+    )
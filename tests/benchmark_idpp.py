@@ -0,0 +1,135 @@
+"""
+Benchmark of the image dependent pair potential (IDPP) on a band of images of
+a cluster of H2 molecules, comparing an evaluation of each image with dense
+distance matrices and a (3N x 3N) array of coordinate differences with the
+evaluation of all the images at once, and timing the relaxation of the band
+with all pairs of atoms or only those within a cutoff. Usage::
+
+    python tests/benchmark_idpp.py --n_atoms 100 500 --n_images 10
+"""
+
+import argparse
+import numpy as np
+from time import time
+from scipy.spatial import distance_matrix
+from autode.atoms import Atom
+from autode.neb import NEB
+from autode.neb.idpp import IDPP
+from autode.species.molecule import Molecule
+from autode.values import Distance
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_atoms",
+        type=int,
+        nargs="+",
+        default=[100, 500],
+        help="Number of atoms",
+    )
+    parser.add_argument(
+        "-i",
+        "--n_images",
+        type=int,
+        default=10,
+        help="Number of images in the band",
+    )
+    parser.add_argument(
+        "-c",
+        "--cutoff",
+        type=float,
+        default=6.0,
+        help="Cutoff distance (Å) for the neighbour list",
+    )
+    return parser.parse_args()
+
+
+def h2_cluster_band(n_atoms, n_images):
+    """Band between a cubic cluster of H2 molecules and a rotated copy"""
+    n_side = int(np.ceil((n_atoms / 2) ** (1 / 3)))
+    atoms = []
+    for shift in np.ndindex(n_side, n_side, n_side):
+        origin = 2.5 * np.array(shift, dtype=float)
+        atoms += [Atom("H", *origin), Atom("H", *(origin + [0.74, 0, 0]))]
+
+    mol = Molecule(atoms=atoms[:n_atoms])
+    rot_mol = mol.copy()
+    rot_mol.rotate(axis=[0.3, 1.0, 0.2], theta=0.4)
+
+    return NEB.from_list(NEB._interpolated_species(mol, rot_mol, n=n_images))
+
+
+def dense_energy_gradient(x, r_k):
+    """IDPP energy and gradient of a single image, with coordinates x and
+    required distance matrix r_k, using dense (3N x 3N) arrays"""
+    diag = np.diag_indices(len(x))
+    r = distance_matrix(x, x)
+    r[diag] = 1.0
+    w = r ** (-4.0)
+    w[diag] = 0.0
+
+    energy = 0.5 * np.sum(w * (r_k - r) ** 2)
+    a = -2 * (2 * (r_k - r) ** 2 * r ** (-6) + w * (r_k - r) * r ** (-1))
+    a[diag] = 0.0
+
+    flat_x = x.flatten()
+    delta = np.subtract.outer(flat_x, flat_x)
+    grad = np.zeros_like(flat_x)
+    for i in range(3):
+        grad[i::3] = np.sum(a * delta[i::3, i::3], axis=1)
+
+    return energy, grad.reshape(-1, 3)
+
+
+def dense_band(x):
+    """Energies and gradients of all the images evaluated one at a time"""
+    r_1, r_n = distance_matrix(x[0], x[0]), distance_matrix(x[-1], x[-1])
+    n = len(x)
+    results = [
+        dense_energy_gradient(x[k], r_1 + k * (r_n - r_1) / n)
+        for k in range(n)
+    ]
+    return (
+        np.array([energy for energy, _ in results]),
+        np.array([grad for _, grad in results]),
+    )
+
+
+if __name__ == "__main__":
+    args = get_args()
+    cutoff = Distance(args.cutoff, "Å")
+    print(
+        f'{"n_atoms":>8}{"dense / s":>11}{"batched / s":>13}'
+        f'{"relax / s":>11}{"relax cutoff / s":>18}'
+    )
+
+    for n_atoms in args.n_atoms:
+        neb = h2_cluster_band(n_atoms, args.n_images)
+        x = np.array([image.coordinates for image in neb.images])
+
+        start_time = time()
+        dense_energies, dense_grads = dense_band(x)
+        t_dense = time() - start_time
+
+        idpp = IDPP(neb.images)
+        start_time = time()
+        energies, grads = idpp.energies_gradients(x)
+        t_batched = time() - start_time
+
+        assert np.allclose(energies, dense_energies)
+        assert np.allclose(grads, dense_grads)
+
+        start_time = time()
+        idpp.relax(x)
+        t_relax = time() - start_time
+
+        start_time = time()
+        IDPP(neb.images, cutoff=cutoff).relax(x)
+        t_relax_cutoff = time() - start_time
+
+        print(
+            f"{n_atoms:>8}{t_dense:>11.3f}{t_batched:>13.3f}"
+            f"{t_relax:>11.3f}{t_relax_cutoff:>18.3f}"
+        )
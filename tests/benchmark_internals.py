@@ -0,0 +1,57 @@
+"""
+Benchmark of building the Wilson B matrix for the primitive internal
+coordinates of a linear alkane, comparing the batched evaluation in
+PIC.get_sparse_B with an evaluation of each primitive on its own with
+hyper-dual numbers. Usage::
+
+    python tests/benchmark_internals.py --n_carbons 10 50
+"""
+
+import argparse
+import numpy as np
+from time import time
+from autode.species.molecule import Molecule
+from autode.opt.coordinates.internals import AnyPIC
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_carbons",
+        type=int,
+        nargs="+",
+        default=[10, 50],
+        help="Number of carbon atoms in the alkane",
+    )
+    return parser.parse_args()
+
+
+def b_matrix_timings(n_carbons):
+    """Times to build the B matrix primitive-by-primitive and batched"""
+    mol = Molecule(smiles="C" * n_carbons)
+    pic = AnyPIC.from_species(mol)
+    x = np.array(mol.coordinates).flatten()
+
+    start_time = time()
+    B_ref = np.array([primitive.derivative(x) for primitive in pic])
+    t_hyper_dual = time() - start_time
+
+    start_time = time()
+    B = pic.get_sparse_B(x)
+    t_batched = time() - start_time
+
+    assert np.allclose(B.toarray(), B_ref)
+    return mol.n_atoms, len(pic), t_hyper_dual, t_batched
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print(
+        f'{"n_atoms":>8}{"n_prims":>9}{"hyper-dual / s":>16}'
+        f'{"batched / s":>14}'
+    )
+
+    for n in args.n_carbons:
+        n_atoms, n_prims, t_ref, t = b_matrix_timings(n)
+        print(f"{n_atoms:>8}{n_prims:>9}{t_ref:>16.3f}{t:>14.4f}")
@@ -0,0 +1,173 @@
+"""
+Benchmark of NEB band optimisers on an IDPP path for the rotation of a methyl
+group in methane, comparing SciPy's L-BFGS-B, with a line search, against the
+native L-BFGS and FIRE band optimisers. Prints the number of band and image
+evaluations to the same tolerance on the change in path energy. Also times
+the NEB forces on a large band computed image by image and for the whole band
+at once. Usage::
+
+    python tests/benchmark_neb.py --n_images 6 10 --etol 1e-3 1e-4
+"""
+
+import argparse
+import numpy as np
+from timeit import timeit
+from scipy.optimize import minimize
+from autode.atoms import Atom
+from autode.neb import NEB
+from autode.neb.idpp import IDPP
+from autode.neb.original import energy_gradient, total_energy, derivative
+from autode.neb.optimisers import FIREBandOptimiser, LBFGSBandOptimiser
+from autode.species.molecule import Molecule
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_images",
+        type=int,
+        nargs="+",
+        default=[6, 10],
+        help="Number of images in the band",
+    )
+    parser.add_argument(
+        "-e",
+        "--etol",
+        type=float,
+        nargs="+",
+        default=[1e-3, 1e-4],
+        help="Tolerance on the change in path energy (Ha)",
+    )
+    parser.add_argument(
+        "-m",
+        "--maxiter",
+        type=int,
+        default=500,
+        help="Maximum number of band evaluations",
+    )
+    parser.add_argument(
+        "--force_shape",
+        type=int,
+        nargs=2,
+        default=[50, 300],
+        help="Number of images and atoms in the band used to time forces",
+    )
+    return parser.parse_args()
+
+
+def methane_rotation_images(n_images):
+    """Images, with energies, of a NEB between two rotamers of methane"""
+    mol = Molecule(
+        atoms=[
+            Atom("C", -0.91668, 0.42765, 0.00000),
+            Atom("H", 0.15332, 0.42765, 0.00000),
+            Atom("H", -1.27334, 0.01569, -0.92086),
+            Atom("H", -1.27334, 1.43112, 0.10366),
+            Atom("H", -1.27334, -0.16385, 0.81720),
+        ],
+    )
+    rot_mol = mol.copy()
+    rot_mol.rotate(axis=[1.0, 0.0, 0.0], theta=1.5)
+
+    neb = NEB.from_list(NEB._interpolated_species(mol, rot_mol, n=n_images))
+    idpp = IDPP(neb.images)
+    for image in neb.images:
+        energy_gradient(image, method=idpp, n_cores=1)
+
+    neb.images.n_evaluations = 0
+    return neb.images, idpp
+
+
+def scipy_lbfgsb(images, idpp, etol, maxiter):
+    result = minimize(
+        total_energy,
+        x0=images.coords(),
+        method="L-BFGS-B",
+        jac=derivative,
+        args=(images, idpp, 1, False),
+        tol=etol,
+        options={"maxfun": maxiter},
+    )
+    images.set_coords(result.x)
+    return result
+
+
+def random_images(n_images, n_atoms):
+    """Images with random coordinates, energies and gradients"""
+    rng = np.random.default_rng(seed=0)
+    mol = Molecule(
+        atoms=[Atom("H", *rng.uniform(0, 10, size=3)) for _ in range(n_atoms)]
+    )
+    species = [mol.copy() for _ in range(n_images)]
+    for s in species:
+        s.coordinates += rng.normal(scale=0.1, size=(n_atoms, 3))
+
+    images = NEB.from_list(species).images
+    for image in images:
+        image.energy = rng.normal()
+        image.gradient = rng.normal(size=(n_atoms, 3))
+
+    return images
+
+
+def image_by_image_forces(images):
+    """Forces on a band computed with a loop over the images, appending each
+    to a flat array"""
+    forces = np.zeros(shape=images[0].gradient.shape)
+
+    for i in range(1, len(images) - 1):
+        force = images[i].get_force(images[i - 1], images[i + 1])
+        forces = np.append(forces, force)
+
+    return -np.append(forces, np.zeros(shape=images[-1].gradient.shape))
+
+
+def native(optimiser_type):
+    def run(images, idpp, etol, maxiter):
+        optimiser = optimiser_type(maxiter=maxiter, etol=etol)
+        return optimiser.run(images, idpp, n_cores=1, plot_energies=False)
+
+    return run
+
+
+if __name__ == "__main__":
+    args = get_args()
+    optimisers = {
+        "L-BFGS-B": scipy_lbfgsb,
+        "L-BFGS": native(LBFGSBandOptimiser),
+        "FIRE": native(FIREBandOptimiser),
+    }
+    print(
+        f'{"n_images":>8}{"etol":>8}{"optimiser":>10}{"E_path / Ha":>13}'
+        f'{"RMS grad":>10}{"n_band":>8}{"n_image":>9}'
+    )
+
+    for n in args.n_images:
+        for etol in args.etol:
+            for name, func in optimisers.items():
+                images, idpp = methane_rotation_images(n)
+                result = func(images, idpp, etol, args.maxiter)
+
+                n_evals = images.n_evaluations
+                grad = derivative(images.coords(), images, idpp, 1, False)
+                rms_grad = np.sqrt(np.mean(np.square(grad)))
+                print(
+                    f"{n:>8}{etol:>8.0e}{name:>10}{result.fun:>13.6f}"
+                    f"{rms_grad:>10.4f}{result.nfev:>8}{n_evals:>9}"
+                )
+
+    n_images, n_atoms = args.force_shape
+    images = random_images(n_images, n_atoms)
+    x = images.coords()
+    assert np.allclose(
+        image_by_image_forces(images), derivative(x, images, None, 1, False)
+    )
+
+    t_loop = timeit(lambda: image_by_image_forces(images), number=10) / 10
+    t_band = timeit(lambda: derivative(x, images, None, 1, False), number=10)
+    t_band /= 10
+    print(
+        f"\nForces on {n_images} images of {n_atoms} atoms. image by image: "
+        f"{t_loop * 1e3:.1f} ms, whole band: {t_band * 1e3:.1f} ms"
+    )
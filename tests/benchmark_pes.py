@@ -0,0 +1,92 @@
+"""
+Benchmark of an adaptive relaxed PES against a relaxed PES on the full grid,
+for a model 2D surface with a double well in r1 - r2 and a saddle point close
+to r1 = r2 = 2.0 Å. Prints the number of calculated points, the saddle points
+found and the largest error in the interpolated energies. Usage::
+
+    python tests/benchmark_pes.py --n_points 11 21 31 --etol 1.0
+"""
+
+import argparse
+import numpy as np
+from autode.atoms import Atom
+from autode.species.molecule import Molecule
+from autode.wrappers.ORCA import ORCA
+from autode.wrappers.keywords import OptKeywords
+from autode.pes import RelaxedPESnD, AdaptiveRelaxedPESnD
+from autode.values import Energy
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_points",
+        type=int,
+        nargs="+",
+        default=[11, 21, 31],
+        help="Number of points in each dimension",
+    )
+    parser.add_argument(
+        "-e",
+        "--etol",
+        type=float,
+        default=1.0,
+        help="Tolerance on the interpolation error (kcal mol-1)",
+    )
+    return parser.parse_args()
+
+
+def energy(r1, r2):
+    """Model energy (Ha) as a function of two distances (Å)"""
+    x, y = (r1 - r2) / np.sqrt(2), (r1 + r2 - 4.06) / np.sqrt(2)
+    return 0.03 * (x**2 - 1.2**2) ** 2 / 1.2**4 + 0.05 * y**2
+
+
+class ModelEnergy:
+    def _single_energy_coordinates(self, species, **kwargs):
+        r1, r2 = (float(r) for r in species.constraints.distance.values())
+        return energy(r1, r2), np.array(species.coordinates)
+
+
+class ModelRelaxedPESnD(ModelEnergy, RelaxedPESnD):
+    pass
+
+
+class ModelAdaptiveRelaxedPESnD(ModelEnergy, AdaptiveRelaxedPESnD):
+    pass
+
+
+def calculated_surface(n, **kwargs):
+    pes = (ModelAdaptiveRelaxedPESnD if kwargs else ModelRelaxedPESnD)(
+        species=Molecule(
+            name="h3",
+            atoms=[Atom("H"), Atom("H", x=1.0), Atom("H", x=4.0)],
+            mult=2,
+        ),
+        rs={(0, 1): (1.0, 3.0, n), (1, 2): (3.0, 1.0, n)},
+        **kwargs,
+    )
+    pes.calculate(method=ORCA(), keywords=OptKeywords(["opt"]), n_cores=4)
+    return pes
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print(
+        f'{"n_points":>8}{"full":>7}{"adaptive":>10}{"max error / kcal":>18}'
+        f'{"same saddle points":>20}'
+    )
+
+    for n in args.n_points:
+        full = calculated_surface(n)
+        adaptive = calculated_surface(n, etol=Energy(args.etol, "kcal mol-1"))
+
+        error = np.max(np.abs(np.array(adaptive._energies - full._energies)))
+        is_same = (
+            adaptive._sorted_saddle_points() == full._sorted_saddle_points()
+        )
+        print(
+            f"{n:>8}{n**2:>7}{np.sum(adaptive._calculated):>10}"
+            f"{error * 627.509:>18.2f}{str(is_same):>20}"
+        )
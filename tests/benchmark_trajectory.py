@@ -0,0 +1,106 @@
+"""
+Benchmark of the optimiser trajectory formats, comparing the zip archive of
+pickled coordinates with the append-only binary trajectory. Times adding
+frames, reading every frame and reading random frames, and prints the size
+of each trajectory on disk. Usage::
+
+    python tests/benchmark_trajectory.py --n_atoms 50 200 --n_frames 200
+"""
+
+import os
+import argparse
+import numpy as np
+from time import time
+from autode.utils import work_in_tmp_dir
+from autode.opt.coordinates import CartesianCoordinates
+from autode.opt.optimisers.base import OptimiserHistory
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_atoms",
+        type=int,
+        nargs="+",
+        default=[50, 200],
+        help="Number of atoms",
+    )
+    parser.add_argument(
+        "-f",
+        "--n_frames",
+        type=int,
+        default=200,
+        help="Number of frames in the trajectory",
+    )
+    parser.add_argument(
+        "--hessian_every",
+        type=int,
+        default=10,
+        help="Interval between frames that have a Hessian",
+    )
+    return parser.parse_args()
+
+
+def random_frames(n_atoms, n_frames, hessian_every):
+    rng = np.random.default_rng(seed=0)
+    for i in range(n_frames):
+        coords = CartesianCoordinates(rng.normal(size=3 * n_atoms))
+        coords.e = rng.normal()
+        coords.g = rng.normal(size=3 * n_atoms)
+        if i % hessian_every == 0:
+            coords.h = np.eye(3 * n_atoms)
+        yield coords
+
+
+def disk_size(filename):
+    if os.path.isfile(filename):
+        return os.path.getsize(filename)
+
+    return sum(
+        os.path.getsize(os.path.join(filename, name))
+        for name in os.listdir(filename)
+    )
+
+
+@work_in_tmp_dir()
+def benchmark(filename, n_atoms, n_frames, hessian_every):
+    hist = OptimiserHistory()
+    hist.open(filename)
+
+    start_time = time()
+    for coords in random_frames(n_atoms, n_frames, hessian_every):
+        hist.add(coords)
+    hist.close()
+    t_write = time() - start_time
+
+    start_time = time()
+    energies = [coords.e for coords in hist]
+    t_iterate = time() - start_time
+    assert len(energies) == n_frames
+
+    idxs = np.random.default_rng(seed=1).integers(0, n_frames, size=50)
+    start_time = time()
+    for idx in idxs:
+        _ = hist[int(idx)]
+    t_random = (time() - start_time) / len(idxs)
+
+    return t_write, t_iterate, t_random, disk_size(filename) / 1024**2
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print(
+        f'{"n_atoms":>8}{"format":>8}{"write / s":>11}{"iterate / s":>13}'
+        f'{"random / ms":>13}{"size / MB":>11}'
+    )
+
+    for n_atoms in args.n_atoms:
+        for filename in ("trajectory.zip", "trajectory.trj"):
+            t_write, t_iterate, t_random, size = benchmark(
+                filename, n_atoms, args.n_frames, args.hessian_every
+            )
+            print(
+                f"{n_atoms:>8}{filename[-3:]:>8}{t_write:>11.3f}"
+                f"{t_iterate:>13.3f}{t_random * 1e3:>13.3f}{size:>11.2f}"
+            )
@@ -0,0 +1,122 @@
+"""
+Benchmark of finding the TS templates that match a truncated reactant graph
+in a folder of templates for SN2 reactions with different substituents and
+charges, comparing parsing every template file and checking if each graph is
+isomorphic with the indexed template library. Usage::
+
+    python tests/benchmark_ts_templates.py --n_templates 100 1000
+"""
+
+import argparse
+import itertools
+from time import time
+from autode.atoms import Atom
+from autode.utils import work_in_tmp_dir
+from autode.mol_graphs import get_truncated_active_mol_graph
+from autode.species.molecule import Reactant
+from autode.species.complex import ReactantComplex
+from autode.transition_states import templates as tpl
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_templates",
+        type=int,
+        nargs="+",
+        default=[100, 1000],
+        help="Number of templates in the folder",
+    )
+    return parser.parse_args()
+
+
+def sn2_reactant(substituents=("H", "H", "H"), charge=-1):
+    """Reactant complex of F- and CH3Cl with different substituents"""
+    ch3cl = Reactant(
+        atoms=[
+            Atom("Cl", 1.63664, 0.02010, -0.05829),
+            Atom("C", -0.14524, -0.00136, 0.00498),
+            Atom(substituents[0], -0.52169, -0.54637, -0.86809),
+            Atom(substituents[1], -0.45804, -0.50420, 0.92747),
+            Atom(substituents[2], -0.51166, 1.03181, -0.00597),
+        ],
+    )
+    f = Reactant(charge=-1, mult=1, atoms=[Atom("F", 4.0, 0.0, 0.0)])
+    reactant = ReactantComplex(f, ch3cl)
+    reactant.charge = charge
+    return reactant
+
+
+def truncated_graph(reactant):
+    return get_truncated_active_mol_graph(
+        graph=reactant.graph, active_bonds=[(0, 2), (1, 2)]
+    )
+
+
+def save_templates(n):
+    """Save n templates with different substituents and charges"""
+    labels = ["H", "F", "Cl", "Br", "I", "C", "N", "O", "S", "P"]
+    combinations = itertools.product(
+        range(-1, 10), itertools.product(labels, repeat=3)
+    )
+
+    for charge, substituents in itertools.islice(combinations, n):
+        graph = truncated_graph(sn2_reactant(substituents))
+        graph.edges[(0, 2)]["distance"] = 1.9
+        graph.edges[(1, 2)]["distance"] = 2.0
+
+        template = tpl.TStemplate(graph, charge=charge, mult=1)
+        template.save(basename=f"template_{charge}_", folder_path=".")
+
+
+def linear_scan(reactant, graph):
+    """Parse every template and check each one"""
+    return [
+        template
+        for template in tpl.get_ts_templates(folder_path=".")
+        if tpl.template_matches(reactant, graph, template)
+    ]
+
+
+@work_in_tmp_dir()
+def timings(n_templates):
+    save_templates(n_templates)
+    reactant = sn2_reactant()
+    graph = truncated_graph(reactant)
+
+    start_time = time()
+    library = tpl.TStemplateLibrary(".")
+    library.refresh()
+    t_store = time() - start_time
+
+    start_time = time()
+    for _ in range(10):
+        matching = tpl.get_matching_ts_templates(reactant, graph, ".")
+    t_library = (time() - start_time) / 10
+
+    tpl.TStemplateLibrary._libraries.clear()
+    start_time = time()
+    expected = linear_scan(reactant, graph)
+    t_linear = time() - start_time
+
+    assert [t.filename for t in matching] == sorted(
+        t.filename for t in expected
+    )
+    assert len(matching) == 1
+    return t_linear, t_store, t_library
+
+
+if __name__ == "__main__":
+    args = get_args()
+    print(
+        f'{"n_templates":>12}{"scan / s":>10}{"from store / s":>16}'
+        f'{"lookup / ms":>13}'
+    )
+
+    for n_templates in args.n_templates:
+        t_linear, t_store, t_library = timings(n_templates)
+        print(
+            f"{n_templates:>12}{t_linear:>10.3f}{t_store:>16.3f}"
+            f"{t_library * 1e3:>13.3f}"
+        )
@@ -0,0 +1,86 @@
+"""
+Benchmark of UMA gradient evaluations run in a persistent provider daemon
+against a fresh provider subprocess per calculation. Requires the UMA provider
+environment (fairchem/torch/ase), so cannot be run in a CI environment.
+Usage::
+
+    python tests/benchmark_uma.py --n_calcs 20
+"""
+
+import argparse
+import numpy as np
+import autode as ade
+from time import time
+from autode.config import Config
+from autode.utils import work_in_tmp_dir
+from autode.wrappers.UMA import UMA, shutdown_daemons
+
+
+def get_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-n",
+        "--n_calcs",
+        type=int,
+        default=10,
+        help="Number of gradient calculations in each mode",
+    )
+    parser.add_argument(
+        "-s",
+        "--smiles",
+        type=str,
+        default="CC(=O)Oc1ccccc1C(=O)O",
+        help="SMILES string of the molecule to evaluate",
+    )
+    return parser.parse_args()
+
+
+@work_in_tmp_dir()
+def wall_times(method, mol, n_calcs, persistent):
+    """Wall times (s) of a set of gradient calculations on perturbed
+    geometries of a molecule"""
+    Config.UMA.persistent = persistent
+    rng = np.random.default_rng(seed=0)
+    times = []
+
+    for i in range(n_calcs):
+        species = mol.copy()
+        species.coordinates += rng.normal(scale=0.01, size=(mol.n_atoms, 3))
+
+        calc = ade.Calculation(
+            name=f"bench_{i}",
+            molecule=species,
+            method=method,
+            keywords=method.keywords.grad,
+        )
+        start_time = time()
+        calc.run()
+        times.append(time() - start_time)
+
+        assert calc.terminated_normally
+
+    shutdown_daemons()
+    return np.array(times)
+
+
+if __name__ == "__main__":
+    args = get_args()
+    uma = UMA()
+
+    if not uma.is_available:
+        exit("UMA provider environment is not available")
+
+    molecule = ade.Molecule(smiles=args.smiles)
+    print(
+        f"{molecule.formula}, {molecule.n_atoms} atoms, {args.n_calcs} calcs"
+    )
+    print(
+        f'{"mode":<12}{"first / s":>12}{"mean rest / s":>16}{"total / s":>12}'
+    )
+
+    for mode, persistent in (("subprocess", False), ("daemon", True)):
+        t = wall_times(uma, molecule, args.n_calcs, persistent)
+        rest = t[1:].mean() if len(t) > 1 else float("nan")
+        print(f"{mode:<12}{t[0]:>12.3f}{rest:>16.3f}{t.sum():>12.3f}")
+
+    Config.UMA.persistent = True
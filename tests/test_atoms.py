@@ -453,3 +453,90 @@ def test_atom_equality():
 )
 def test_atomic_numbers(element: str, atomic_number: int):
     assert Atom(element).atomic_number == atomic_number
+
+
+def test_atoms_coordinate_store():
+    atoms = Atoms([Atom("H"), Atom("H", x=0.7)])
+    coords = atoms.coordinates
+    assert np.allclose(coords, [[0.0, 0.0, 0.0], [0.7, 0.0, 0.0]])
+
+    # Coordinates are a copy, and atoms views of the same store
+    coords[0, 0] = 1.0
+    assert np.isclose(atoms[0].coord.x, 0.0)
+
+    atoms.coordinates = np.array([[0.0, 0.0, 0.1], [0.0, 0.0, 0.8]])
+    assert np.allclose(atoms[1].coord, [0.0, 0.0, 0.8])
+    assert isinstance(atoms[1].coord, Coordinate)
+
+    # Modifying or replacing an atom's coordinate is reflected in all atoms
+    atoms[0].translate(1.0, 0.0, 0.0)
+    assert np.allclose(atoms.coordinates[0], [1.0, 0.0, 0.1])
+
+    atoms[1].coord = [2.0, 2.0, 2.0]
+    assert np.allclose(atoms.coordinates[1], [2.0, 2.0, 2.0])
+
+    # as are changes to the list
+    atoms.append(Atom("C", z=-1.0))
+    assert atoms.coordinates.shape == (3, 3)
+    del atoms[0]
+    assert np.allclose(atoms.coordinates[0], [2.0, 2.0, 2.0])
+    atoms[0] = Atom("O")
+    assert np.allclose(atoms.coordinates[0], 0.0)
+
+
+def test_atoms_coordinate_store_shared_atoms():
+    atoms = Atoms([Atom("H"), Atom("H", x=0.7)])
+    _ = atoms.coordinates
+
+    other = Atoms(atoms)
+    other.coordinates = np.ones(shape=(2, 3))
+    assert np.allclose(atoms.coordinates, 1.0)
+
+    atoms.coordinates = np.zeros(shape=(2, 3))
+    assert np.allclose(other.coordinates, 0.0)
+
+    # A copy does not share coordinates
+    atoms_copy = atoms.copy()
+    atoms_copy.coordinates = np.ones(shape=(2, 3))
+    assert np.allclose(atoms.coordinates, 0.0)
+    assert np.allclose(atoms_copy[1].coord, 1.0)
+
+    # nor does a pickled version
+    import pickle
+
+    atoms_pkl = pickle.loads(pickle.dumps(atoms))
+    atoms_pkl.coordinates = np.ones(shape=(2, 3))
+    assert np.allclose(atoms.coordinates, 0.0)
+
+    # The same atom twice cannot be a view of two rows
+    h = Atom("H")
+    repeated = Atoms([h, h])
+    repeated.coordinates = np.array([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+    assert np.allclose(repeated.coordinates, [[2.0, 0.0, 0.0]] * 2)
+
+
+def test_vectorised_distances_angles_dihedrals():
+    rng = np.random.default_rng(seed=0)
+    mol = atoms.AtomCollection(
+        [Atom("C", *rng.uniform(-2, 2, size=3)) for _ in range(8)]
+    )
+    pairs = [(0, 1), (3, 2), (7, 0)]
+    triples = [(0, 1, 2), (5, 3, 4), (7, 6, 0)]
+    quads = [(0, 1, 2, 3), (4, 5, 6, 7), (7, 2, 1, 0)]
+
+    distances = mol.distances(pairs)
+    assert isinstance(distances, np.ndarray) and distances.shape == (3,)
+    assert np.allclose(distances, [mol.distance(*p) for p in pairs])
+    assert np.allclose(mol.angles(triples), [mol.angle(*t) for t in triples])
+    assert np.allclose(mol.dihedrals(quads), [mol.dihedral(*q) for q in quads])
+
+    assert mol.distances([]).shape == (0,)
+
+    with pytest.raises(ValueError):
+        _ = mol.distances([(0, 8)])
+
+    with pytest.raises(ValueError):
+        _ = mol.angles([(0, 0, 1)])
+
+    with pytest.raises(ValueError):
+        _ = mol.dihedrals([(0, 1, 1, 2)])
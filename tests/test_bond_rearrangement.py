@@ -1,4 +1,5 @@
 import os
+import itertools
 import pytest
 import autode as ade
 from autode import bond_rearrangement as br
@@ -11,7 +12,6 @@ from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import make_graph
 from autode.utils import work_in_tmp_dir
 
-
 # Some of the 'reactions' here are not physical, hence for some the graph will
 # be regenerated allowing for invalid hydrogen valencies
 
@@ -632,3 +632,73 @@ def test_2b2f_single_bond_type():
 
     brs = get_bond_rearrangs(reac, prod, "test")
     assert brs is not None and len(brs) == 1
+
+
+def test_product_graph_filter_is_exact():
+    reac = ReactantComplex(
+        Molecule(name="radical", mult=2, smiles="FC[C]([H])[H]")
+    )
+    prod = ProductComplex(
+        Molecule(name="radical", mult=2, smiles="C[C]([H])F")
+    )
+
+    graph_filter = br.ProductGraphFilter(reac.graph, prod.graph)
+    bonds = list(reac.graph.edges)
+    non_bonds = [
+        (i, j)
+        for i in range(reac.n_atoms)
+        for j in range(i + 1, reac.n_atoms)
+        if not reac.graph.has_edge(i, j)
+    ]
+
+    n_products = 0
+    for fbond, bbond in itertools.product(non_bonds, bonds):
+        makes_product = is_isomorphic(
+            br.generate_rearranged_graph(reac.graph, [fbond], [bbond]),
+            prod.graph,
+        )
+        assert graph_filter.makes_product([fbond], [bbond]) == makes_product
+        n_products += int(makes_product)
+
+    assert n_products > 0
+    # Only rearrangements with the same invariants as the product are checked
+    assert graph_filter.n_isomorphism_checks < len(non_bonds) * len(bonds)
+
+    # and identical rearrangements are not checked again
+    n_checks = graph_filter.n_isomorphism_checks
+    fbond, bbond = non_bonds[0], bonds[0]
+    makes_product = graph_filter.makes_product([fbond], [bbond])
+    assert graph_filter.makes_product([fbond[::-1]], [bbond]) == makes_product
+    assert graph_filter.n_isomorphism_checks == n_checks
+
+
+def test_strip_equiv_bond_rearrs_computes_neighbour_lists_once(monkeypatch):
+    reac = ReactantComplex(
+        Molecule(name="h_dot", smiles="[H]"), Molecule(smiles="CC")
+    )
+    possible_brs = [
+        br.BondRearrangement(forming_bonds=[(0, i)], breaking_bonds=[(1, i)])
+        for i in range(3, reac.n_atoms)
+    ]
+
+    # Pairwise comparison of the neighbour lists of all the rearrangements
+    expected_brs = []
+    for rearr in possible_brs:
+        if not any(
+            rearr.get_active_atom_neighbour_lists(reac, depth=6)
+            == unique.get_active_atom_neighbour_lists(reac, depth=6)
+            for unique in expected_brs
+        ):
+            expected_brs.append(rearr)
+
+    n_calls = [0]
+
+    def get_neighbour_list(*args, **kwargs):
+        n_calls[0] += 1
+        return get_neighbour_list_func(*args, **kwargs)
+
+    get_neighbour_list_func = br.get_neighbour_list
+    monkeypatch.setattr(br, "get_neighbour_list", get_neighbour_list)
+
+    assert br.strip_equiv_bond_rearrs(possible_brs, reac) == expected_brs
+    assert n_calls[0] == len({i for b in possible_brs for i in b.active_atoms})
@@ -3,17 +3,20 @@ import numpy as np
 import pytest
 
 from autode import Molecule, Atom
-from autode.geom import calc_rmsd
+from autode.geom import calc_rmsd, get_rot_mat_kabsch
 from autode.opt.coordinates import CartesianCoordinates
 from autode.methods import XTB
 from autode.values import Energy
 from autode.utils import work_in_tmp_dir
+from autode.bracket.base import BaseBracketMethod
 from autode.bracket.imagepair import (
     EuclideanImagePair,
     _calculate_engrad_for_species,
     _calculate_hessian_for_species,
+    _rotated_onto,
 )
 from ..testutils import work_in_zipped_dir, requires_working_xtb_install
+from ..test_opt.setup import Method
 
 here = os.path.dirname(os.path.abspath(__file__))
 datazip = os.path.join(here, "data", "geometries.zip")
@@ -300,3 +303,124 @@ def test_hessian_update():
     imgpair.update_both_img_hessian_by_formula()
     assert imgpair.left_coords.h is not None
     assert imgpair.right_coords.h is not None
+
+
+def test_rotated_onto_rotates_gradient_and_hessian():
+    mol = Molecule(smiles="O")
+    coords = CartesianCoordinates(mol.coordinates)
+    rng = np.random.default_rng(seed=0)
+    coords.e = -5.0
+    coords.g = rng.normal(size=9)
+    h = rng.normal(size=(9, 9))
+    coords.h = h + h.T
+
+    other_mol = mol.copy()
+    other_mol.rotate(axis=[0.2, 1.0, 0.5], theta=1.1)
+    other_mol.translate([1.0, -2.0, 0.5])
+    other = CartesianCoordinates(other_mol.coordinates)
+
+    rotated = _rotated_onto(coords, other)
+    assert np.allclose(rotated, other, atol=1e-6)
+    assert np.isclose(rotated.e, -5.0)
+
+    # a displacement rotated with the coordinates has the same quadratic energy
+    disp = rng.normal(size=(3, 3))
+    x, x_other = mol.coordinates, other_mol.coordinates
+    rot_mat = get_rot_mat_kabsch(
+        x - np.average(x, axis=0), x_other - np.average(x_other, axis=0)
+    )
+    rot_disp = disp.dot(rot_mat.T).flatten()
+    assert np.isclose(
+        np.dot(coords.g, disp.flatten()), np.dot(rotated.g, rot_disp)
+    )
+    assert np.isclose(
+        disp.flatten().dot(coords.h).dot(disp.flatten()),
+        rot_disp.dot(rotated.h).dot(rot_disp),
+    )
+
+
+def test_shared_hessian_is_calculated_for_one_image(monkeypatch):
+    mol = Molecule(smiles="O")
+    other_mol = mol.copy()
+    other_mol.rotate(axis=[0.0, 0.0, 1.0], theta=0.5)
+    other_mol.atoms[1].translate([0.05, 0.0, 0.0])
+    n_calcs = []
+
+    def hessian(species, method, n_cores):
+        n_calcs.append(n_cores)
+        return np.eye(3 * species.n_atoms)
+
+    monkeypatch.setattr(
+        "autode.bracket.imagepair._calculate_hessian_for_species", hessian
+    )
+    imgpair = NullImagePair(mol, other_mol)
+    imgpair.set_method_and_n_cores(Method(), n_cores=4, hess_method=Method())
+    imgpair.left_coords.g = np.zeros(9)
+    imgpair.right_coords.g = np.full(9, 0.01)
+
+    imgpair.update_both_img_hessian_by_calc()
+    assert n_calcs == [4, 4]
+    # methods without external IO are run in this process
+    assert imgpair._pool is None
+
+    n_calcs.clear()
+    imgpair.share_hessian = True
+    imgpair.right_coords.h = None
+    imgpair.update_both_img_hessian_by_calc()
+    assert n_calcs == [4]
+
+    h = imgpair.right_coords.h
+    assert h is not None and h.shape == (9, 9)
+    assert np.allclose(h, h.T)
+    # updated from the rotated Hessian of the left image
+    assert not np.allclose(h, np.eye(9))
+
+
+class _HalvingBracket(BaseBracketMethod):
+    """Bracket that halves the distance between the images every step"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.imgpair = NullImagePair(*args)
+        self._n_steps = 0
+
+    @property
+    def _macro_iter(self):
+        return self._n_steps
+
+    @property
+    def _micro_iter(self):
+        return self._n_steps
+
+    def _set_engrad(self):
+        for coords in (self.imgpair.left_coords, self.imgpair.right_coords):
+            coords.e = -1.0
+            coords.g = np.zeros(len(coords))
+
+    def _initialise_run(self):
+        self._set_engrad()
+
+    def _step(self):
+        left, right = self.imgpair.left_coords, self.imgpair.right_coords
+        self.imgpair.right_coords = left + 0.5 * (right - left)
+        self._set_engrad()
+        self._n_steps += 1
+
+
+@work_in_tmp_dir()
+def test_bracket_step_times_are_recorded(monkeypatch):
+    monkeypatch.setattr(
+        "autode.bracket.imagepair.get_lmethod", lambda: Method()
+    )
+    mol = Molecule(smiles="O")
+    other_mol = mol.copy()
+    other_mol.atoms[1].translate([0.8, 0.0, 0.0])
+
+    bracket = _HalvingBracket(
+        mol, other_mol, dist_tol=0.1, barrier_check=False
+    )
+    bracket.calculate(method=Method(), n_cores=1)
+
+    assert bracket.converged
+    assert len(bracket.step_times) == bracket._macro_iter == 3
+    assert all(t >= 0.0 for t in bracket.step_times)
@@ -20,6 +20,7 @@ from autode.atoms import Atom
 from autode.methods import XTB, ORCA
 from autode.species import Molecule
 from autode.config import Config
+from autode.values import Allocation
 import autode.exceptions as ex
 from autode.utils import work_in_tmp_dir
 from .testutils import requires_working_xtb_install
@@ -592,3 +593,151 @@ def test_cannot_set_output_of_indirect_executor():
     )
     with pytest.raises(ValueError):
         executor.output = BlankCalculationOutput()
+
+
+class TestCalculatorCountingGradient(TestCalculatorConstantGradient):
+    def __init__(self):
+        super().__init__()
+        self.n_calls = 0
+
+    def execute(self, calc) -> None:
+        self.n_calls += 1
+        super().execute(calc)
+        calc.molecule.partial_charges = [0.1] * calc.molecule.n_atoms
+
+
+@work_in_tmp_dir()
+def test_calculation_cache_is_used_across_directories():
+    Config.calc_cache_dir = "cache"
+    method = TestCalculatorCountingGradient()
+
+    def run_grad_calc():
+        mol = h2o()
+        calc = Calculation(
+            name="tmp",
+            molecule=mol,
+            method=method,
+            keywords=GradientKeywords(),
+        )
+        calc.run()
+        return calc
+
+    calc = run_grad_calc()
+    assert method.n_calls == 1 and not calc._from_cache
+
+    os.mkdir("other")
+    os.chdir("other")
+    calc = run_grad_calc()
+    os.chdir("..")
+
+    # Second, identical calculation should not be executed
+    assert method.n_calls == 1
+    assert calc._from_cache and calc.terminated_normally
+    assert np.isclose(calc.molecule.energy, 1.0)
+    assert np.allclose(calc.molecule.gradient, 0.0)
+    assert np.allclose(calc.molecule.partial_charges, 0.1)
+
+    # but different keywords or a different geometry should be
+    mol = h2o()
+    Calculation(
+        name="tmp", molecule=mol, method=method, keywords=SinglePointKeywords()
+    ).run()
+    mol.translate([0.1, 0.0, 0.0])
+    Calculation(
+        name="tmp", molecule=mol, method=method, keywords=GradientKeywords()
+    ).run()
+    assert method.n_calls == 3
+
+
+@work_in_tmp_dir()
+def test_calculation_cache_missing_properties_are_recalculated():
+    from autode.calculations.cache import CalculationCache
+
+    Config.calc_cache_dir = "cache"
+    method = TestCalculatorCountingGradient()
+    mol = h2o()
+    calc = Calculation(
+        name="tmp", molecule=mol, method=method, keywords=GradientKeywords()
+    )
+    calc.run()
+    assert calc._executor in CalculationCache.from_config()
+
+    # A cached energy and gradient is not sufficient for a Hessian calculation
+    calc = Calculation(
+        name="tmp", molecule=mol, method=method, keywords=HessianKeywords()
+    )
+    assert not CalculationCache.from_config().load_into(calc._executor)
+
+
+class TestCalculatorCountingOptTS(TestCalculator):
+    def __init__(self):
+        super().__init__()
+        self.n_calls = 0
+
+    def execute(self, calc) -> None:
+        from autode.calculations.cache import CachedOptimiser
+
+        self.n_calls += 1
+        calc.molecule.translate([0.1, 0.0, 0.0])
+        calc.molecule.energy = 1.0
+        calc.optimiser = CachedOptimiser(
+            converged=True, last_energy_change=1e-6
+        )
+
+
+@work_in_tmp_dir()
+def test_calculation_cache_ts_optimisation():
+    from autode.transition_states.transition_state import TransitionState
+    from autode.transition_states.ts_guess import TSguess
+
+    Config.calc_cache_dir = "cache"
+    method = TestCalculatorCountingOptTS()
+
+    def optimised_ts():
+        ts = TransitionState(TSguess(atoms=h2o().atoms))
+        ts._run_opt_ts_calc(method=method, name_ext="optts")
+        return ts
+
+    ts = optimised_ts()
+    assert method.n_calls == 1
+
+    # Cached entry is of the initial geometry, and the optimiser converged so
+    # the TS should not be reoptimised
+    cached_ts = optimised_ts()
+    assert method.n_calls == 1
+    assert np.allclose(cached_ts.coordinates, ts.coordinates)
+    assert np.isclose(cached_ts.energy, 1.0)
+
+
+@work_in_tmp_dir()
+def test_calculation_cache_lru_eviction():
+    from autode.calculations.cache import CalculationCache
+
+    cache = CalculationCache("cache", max_size=None)
+    method = TestCalculatorCountingGradient()
+
+    for i in range(3):
+        mol = h2o()
+        mol.translate([0.1 * i, 0.0, 0.0])
+        calc = Calculation(
+            name="tmp",
+            molecule=mol,
+            method=method,
+            keywords=GradientKeywords(),
+        )
+        method.execute(calc._executor)
+        cache.store(calc._executor)
+        path = cache.path_for(cache.key_for(calc._executor))
+        os.utime(path, (i, i))
+
+    assert len(cache.entries) == 3
+    entry_size = cache.entries[0][1].st_size
+
+    cache.max_size = Allocation(2.5 * entry_size, units="bytes")
+    cache.evict()
+    assert len(cache.entries) == 2
+    # The oldest entry should be the one removed
+    assert all(stat.st_mtime > 0 for _, stat in cache.entries)
+
+    cache.clear()
+    assert len(cache.entries) == 0
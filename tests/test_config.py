@@ -75,6 +75,25 @@ def test_step_size_setter():
     assert np.isclose(_config.max_step_size.to("ang"), 0.1, atol=0.02)
 
 
+def test_neb_optimiser_setter():
+    _config = deepcopy(Config)
+
+    _config.neb_optimiser = "FIRE"
+    assert _config.neb_optimiser == "fire"
+
+    with pytest.raises(ValueError):
+        _config.neb_optimiser = "bfgs"
+
+    with pytest.raises(ValueError):
+        _config.neb_max_step = -0.1
+
+    _config.idpp_cutoff = 6.0
+    assert np.isclose(_config.idpp_cutoff.to("Å"), 6.0)
+
+    with pytest.raises(ValueError):
+        _config.idpp_cutoff = 0.0
+
+
 def test_config_simple_copy():
     _config = deepcopy(Config)
     _config_restore = deepcopy(Config)
@@ -6,8 +6,8 @@ from autode.exceptions import NoConformers
 from autode.wrappers.ORCA import ORCA
 from autode.wrappers.XTB import XTB
 from autode.config import Config
-from autode.values import Energy
-from autode.utils import work_in_tmp_dir
+from autode.values import Energy, Distance
+from autode.utils import work_in_tmp_dir, WorkerPool
 from autode.wrappers.keywords import SinglePointKeywords
 from scipy.spatial import distance_matrix
 from rdkit import Chem
@@ -417,3 +417,87 @@ def test_pruning_conformers_without_energy_raises():
 def test_pruning_no_energy_with_no_conformers_is_possible():
     conformers = Conformers()
     conformers.remove_no_energy()
+
+
+def _mock_calc_conformer(conformer, calc_type, method, keywords, n_cores=1):
+    conformer.energy = -1.0 * n_cores
+    return conformer
+
+
+def test_parallel_calc_uses_all_cores(monkeypatch):
+    import autode.conformers.conformers as conformers_module
+
+    monkeypatch.setattr(
+        conformers_module, "_calc_conformer", _mock_calc_conformer
+    )
+    # Persistent workers must be recreated to see the patched function
+    WorkerPool.shutdown_all()
+    Config.n_cores = 8
+
+    confs = Conformers(
+        [
+            Conformer(name=f"h2_{i}", atoms=[Atom("H"), Atom("H", x=0.7)])
+            for i in range(3)
+        ]
+    )
+    confs.single_point(method=orca)
+
+    # Every core should be used, with the first (largest) calculations
+    # getting more
+    n_cores = [-int(conf.energy) for conf in confs]
+    assert n_cores == [3, 3, 2]
+
+    assert len(confs.wall_times) == 3
+    assert all(t >= 0.0 for t in confs.wall_times.values())
+    assert confs.copy().wall_times == confs.wall_times
+
+    # With more conformers than cores each gets a single core
+    Config.n_cores = 2
+    confs = Conformers(
+        [
+            Conformer(name=f"h2_{i}", atoms=[Atom("H"), Atom("H", x=0.7)])
+            for i in range(5)
+        ]
+    )
+    confs.single_point(method=orca)
+    assert all(int(conf.energy) == -1 for conf in confs)
+
+    WorkerPool.shutdown_all()
+
+
+def _pairwise_pruned_idxs(confs, rmsd_tol):
+    """Indexes of the conformers kept by pruning one pair at a time"""
+    from autode.geom import calc_heavy_atom_rmsd
+
+    idxs = list(range(len(confs)))
+    for idx in reversed(range(len(confs) - 1)):
+        if any(
+            calc_heavy_atom_rmsd(confs[idx].atoms, confs[o_idx].atoms)
+            < rmsd_tol
+            for o_idx in idxs
+            if o_idx != idx
+        ):
+            idxs.remove(idx)
+
+    return idxs
+
+
+def test_prune_on_rmsd_matches_pairwise():
+    rng = np.random.default_rng(seed=0)
+    atoms = [Atom(label) for label in ("C", "C", "O", "N", "H", "H", "Cl")]
+
+    confs = Conformers()
+    for i, scale in enumerate(rng.uniform(0.0, 1.5, size=60)):
+        conf = Conformer(name=f"conf{i}", atoms=[a.copy() for a in atoms])
+        noise = rng.normal(scale=scale, size=(7, 3))
+        conf.coordinates = np.arange(21).reshape(7, 3) % 5 + noise
+        confs.append(conf)
+
+    for rmsd_tol in (0.2, 0.5, 1.0):
+        idxs = _pairwise_pruned_idxs(confs, rmsd_tol)
+        expected = [confs[i].name for i in idxs]
+
+        pruned = confs.copy()
+        pruned.prune_on_rmsd(rmsd_tol=Distance(rmsd_tol, "Å"))
+        assert [conf.name for conf in pruned] == expected
+        assert 1 < len(pruned) < len(confs)
@@ -287,7 +287,7 @@ def test_timeout():
         graph.add_node(i)
 
     for _ in range(5000):
-        (i, j) = np.random.randint(0, 1000, size=2)
+        i, j = np.random.randint(0, 1000, size=2)
 
         if (i, j) not in graph.edges:
             graph.add_edge(i, j)
@@ -391,3 +391,74 @@ def test_graph_active_bonds_property():
     tmp_h2.graph.add_active_edge(0, 1)
 
     assert tmp_h2.graph.active_bonds == [(0, 1)]
+
+
+def _pairwise_graph_edges(species, rel_tolerance=0.3):
+    """Edges of a graph built by checking every pair of atoms"""
+    graph = nx.Graph()
+    graph.add_nodes_from(range(species.n_atoms))
+
+    for i in range(species.n_atoms):
+        for j in np.argsort(species.distance_matrix[i]):
+            if i == j:
+                continue
+
+            max_dist = species.eqm_bond_distance(i, j) * (1.0 + rel_tolerance)
+            if species.distance(i, j) <= max_dist:
+                graph.add_edge(i, int(j))
+
+    return [tuple(edge) for edge in graph.edges]
+
+
+@pytest.mark.parametrize("rel_tolerance", [0.0, 0.3, 0.8])
+def test_make_graph_matches_pairwise_bond_search(rel_tolerance):
+    rng = np.random.default_rng(seed=0)
+    labels = ["C", "H", "H", "O", "N", "Cl", "I", "Pd", "F"]
+
+    for n_atoms in (2, 10, 150):
+        species = Species(
+            name="tmp",
+            atoms=[
+                Atom(labels[i % len(labels)], *rng.uniform(0, 4, size=3))
+                for i in range(n_atoms)
+            ],
+            charge=0,
+            mult=1,
+        )
+        mol_graphs.make_graph(
+            species, rel_tolerance=rel_tolerance, allow_invalid_valancies=True
+        )
+
+        assert list(species.graph.edges) == _pairwise_graph_edges(
+            species, rel_tolerance
+        )
+
+    # Atoms beyond any bonding distance are not bonded
+    species = Species(
+        name="tmp", atoms=[Atom("H"), Atom("H", x=10.0)], charge=0, mult=1
+    )
+    mol_graphs.make_graph(species)
+    assert species.graph.number_of_edges() == 0
+
+
+def test_graph_hash():
+    mol = Molecule(smiles="CCO")
+    permuted_graph = nx.relabel_nodes(
+        mol.graph, mapping={i: (i + 3) % mol.n_atoms for i in mol.graph.nodes}
+    )
+    assert mol_graphs.graph_hash(mol.graph) == mol_graphs.graph_hash(
+        permuted_graph
+    )
+
+    # Changing an atom label, or making a bond active, changes the hash
+    other_graph = mol.graph.copy()
+    other_graph.nodes[2]["atom_label"] = "N"
+    assert mol_graphs.graph_hash(other_graph) != mol_graphs.graph_hash(
+        mol.graph
+    )
+
+    other_graph = mol.graph.copy()
+    other_graph.add_active_edge(0, 1)
+    assert mol_graphs.graph_hash(other_graph) != mol_graphs.graph_hash(
+        mol.graph
+    )
@@ -987,3 +987,99 @@ def test_g09_hessian_no_input_orientation():
     assert np.isclose(
         c2h6.hessian.frequencies[-1], Frequency(3156.1252), atol=1.0
     )
+
+
+class _HarmonicMethod:
+    """Method with no external I/O, so rows are calculated in serial"""
+
+    name = "harmonic"
+    uses_external_io = False
+
+
+class _HarmonicHessianCalculator(NumericalHessianCalculator):
+    """Numerical Hessian of E = Σ k_i x_i^2 / 2 that fails after a number
+    of gradient evaluations"""
+
+    def __init__(self, species, max_n_grads=None, rows=None):
+        super().__init__(
+            species,
+            method=_HarmonicMethod(),
+            keywords=GradientKeywords(["grad"]),
+            do_c_diff=True,
+            shift=Distance(0.01, units="Å"),
+            rows=rows,
+        )
+        self.n_grads = 0
+        self.max_n_grads = max_n_grads
+
+    def _gradient(self, species):
+        if self.n_grads == self.max_n_grads:
+            raise RuntimeError("Gradient evaluation failed")
+
+        self.n_grads += 1
+        x = np.array(species.coordinates).flatten()
+        return np.arange(1, len(x) + 1) * x
+
+
+def _water():
+    return Molecule(
+        atoms=[Atom("O"), Atom("H", x=0.96), Atom("H", x=-0.24, y=0.93)]
+    )
+
+
+@work_in_tmp_dir()
+def test_numerical_hessian_resumes_from_checkpoints():
+    water = _water()
+    expected = np.diag(np.arange(1.0, 10.0))
+
+    calculator = _HarmonicHessianCalculator(water, max_n_grads=11)
+    with pytest.raises(RuntimeError):
+        calculator.calculate()
+
+    # Five complete rows were written before the failure
+    assert len(os.listdir("numerical_hessian")) == 5
+
+    calculator = _HarmonicHessianCalculator(water)
+    calculator.calculate()
+    assert calculator.n_grads == 2 * 4
+    assert np.allclose(calculator.hessian, expected)
+
+    calculator = _HarmonicHessianCalculator(water)
+    calculator.calculate()
+    assert calculator.n_grads == 0
+    assert np.allclose(calculator.hessian, expected)
+
+    # Rows for a different geometry are not reused
+    water.atoms[0].translate(0.1, 0.0, 0.0)
+    calculator = _HarmonicHessianCalculator(water)
+    calculator.calculate()
+    assert calculator.n_grads == 2 * 9
+
+
+@work_in_tmp_dir()
+def test_numerical_hessian_rows_are_mergeable():
+    water = _water()
+
+    for node, rows in (("node0", range(0, 4)), ("node1", range(4, 9))):
+        os.mkdir(node)
+        os.chdir(node)
+        calculator = _HarmonicHessianCalculator(water, rows=rows)
+        calculator.calculate()
+        assert calculator.n_grads == 2 * len(rows)
+        os.chdir("..")
+
+    os.mkdir("numerical_hessian")
+    for node in ("node0", "node1"):
+        for filename in os.listdir(os.path.join(node, "numerical_hessian")):
+            os.rename(
+                os.path.join(node, "numerical_hessian", filename),
+                os.path.join("numerical_hessian", filename),
+            )
+
+    calculator = _HarmonicHessianCalculator(water)
+    calculator.calculate()
+    assert calculator.n_grads == 0
+    assert np.allclose(calculator.hessian, np.diag(np.arange(1.0, 10.0)))
+
+    with pytest.raises(ValueError):
+        _ = _HarmonicHessianCalculator(water, rows=[9])
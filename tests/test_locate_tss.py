@@ -1,11 +1,18 @@
 import os
+import time
+import platform
+import subprocess
 import pytest
+from concurrent.futures import Future
 import autode.exceptions as ex
 from autode.atoms import Atom
 from autode import Reactant, Product, Reaction
 from autode.species.complex import ReactantComplex, ProductComplex
 from autode.reactions.reaction_types import Dissociation
 from autode.bond_rearrangement import get_bond_rearrangs, BondRearrangement
+from autode.config import Config
+from autode.utils import work_in_tmp_dir
+from autode.transition_states import locate_tss
 from autode.transition_states.locate_tss import (
     get_ts,
     ts_guess_funcs_prms,
@@ -73,3 +80,137 @@ def test_find_tss_no_products():
     # Check for no reactant and product before anything else
     with pytest.raises(ValueError):
         _ = find_tss(reaction)
+
+
+class _InProcessPool:
+    """Pool that runs submitted functions immediately, in this process"""
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return None
+
+
+class _Reaction:
+    def __init__(self):
+        self.reactant = Reactant(smiles="O")
+        self.product = Reactant(smiles="O")
+
+    def __str__(self):
+        return "rxn"
+
+
+@work_in_tmp_dir()
+def test_find_tss_concurrently(monkeypatch):
+    bond_rearrs = [
+        BondRearrangement(breaking_bonds=[(0, i)]) for i in range(1, 4)
+    ]
+    pools, calls = [], []
+
+    def pool(max_workers):
+        pools.append(max_workers)
+        return _InProcessPool(max_workers)
+
+    def get_ts(name, reactant, product, bond_rearr):
+        calls.append((os.path.basename(os.getcwd()), Config.n_cores))
+        return None if str(bond_rearr) == "0-2" else str(bond_rearr)
+
+    monkeypatch.setattr(locate_tss, "species_are_isomorphic", lambda r, p: 0)
+    monkeypatch.setattr(
+        locate_tss, "get_bond_rearrangs", lambda *args, **kwargs: bond_rearrs
+    )
+    monkeypatch.setattr(locate_tss, "WorkerPool", pool)
+    monkeypatch.setattr(locate_tss, "get_ts", get_ts)
+    monkeypatch.setattr(Config, "n_cores", 4)
+    monkeypatch.setattr(Config, "ts_n_cores_per_rearrangement", 2)
+
+    tss = find_tss(_Reaction())
+    assert list(tss) == ["0-1", "0-3"]
+    assert pools == [2]
+    # each rearrangement is located in its own directory with two cores
+    assert calls == [("0-1", 2), ("0-2", 2), ("0-3", 2)]
+    assert Config.n_cores == 4
+
+    # without a per-rearrangement budget they are located one at a time
+    calls.clear()
+    Config.ts_n_cores_per_rearrangement = None
+    assert list(find_tss(_Reaction())) == ["0-1", "0-3"]
+    assert pools == [2]
+    assert all(n_cores == 4 for _, n_cores in calls)
+
+
+def test_ts_cores_per_rearrangement_must_be_positive():
+    with pytest.raises(ValueError):
+        Config.ts_n_cores_per_rearrangement = 0
+
+
+def _fast_ts_guess(name):
+    # finish once the slow guess has started its external process
+    for _ in range(100):
+        if os.path.exists("../sleep.pid"):
+            break
+        time.sleep(0.1)
+
+    return "ts"
+
+
+def _slow_ts_guess(name):
+    # an external process that is terminated along with this function
+    proc = subprocess.Popen(["sleep", "60"])
+    with open("../sleep.pid", "w") as file:
+        print(proc.pid, file=file)
+    time.sleep(60)
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="Requires forked processes"
+)
+@work_in_tmp_dir()
+def test_ts_guess_race_terminates_slower_guesses(monkeypatch):
+    def ts_from_guess_func(func, params, bond_rearr):
+        return func(*params)
+
+    monkeypatch.setattr(locate_tss, "_ts_from_guess_func", ts_from_guess_func)
+    funcs_prms = [
+        (_slow_ts_guess, ("slow",)),
+        (_fast_ts_guess, ("fast",)),
+    ]
+
+    start_time = time.time()
+    ts = locate_tss._race_ts_guesses(funcs_prms, bond_rearr=None)
+    assert ts == "ts"
+    assert time.time() - start_time < 30
+
+    # each group of guesses is run in its own directory
+    assert os.path.isdir("slow") and os.path.isdir("fast")
+
+    pid = int(open("sleep.pid").read())
+    for _ in range(50):
+        if not _is_running(pid):
+            break
+        time.sleep(0.1)
+    else:
+        raise AssertionError("External process was not terminated")
+
+
+def _is_running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+
+    # terminated processes that have not been reaped are zombies
+    try:
+        with open(f"/proc/{pid}/stat") as file:
+            return file.read().split()[2] != "Z"
+    except FileNotFoundError:
+        return True
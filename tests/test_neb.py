@@ -11,6 +11,7 @@ from autode.species.molecule import Species, Molecule
 from autode.species.molecule import Reactant
 from autode.neb.neb import get_ts_guess_neb
 from autode.neb.original import energy_gradient
+from autode.neb.optimisers import FIREBandOptimiser, LBFGSBandOptimiser
 from autode.atoms import Atom
 from autode.geom import are_coords_reasonable
 from autode.input_output import xyz_file_to_atoms
@@ -421,3 +422,261 @@ def test_neb_ts_guess_is_none_if_no_peak():
 
     result = get_ts_guess_neb(init, final, method=XTB(), n=3)
     assert result is None
+
+
+def _methane_rotation_neb(n_images=6):
+    mol = Molecule(
+        atoms=[
+            Atom("C", -0.91668, 0.42765, 0.00000),
+            Atom("H", 0.15332, 0.42765, 0.00000),
+            Atom("H", -1.27334, 0.01569, -0.92086),
+            Atom("H", -1.27334, 1.43112, 0.10366),
+            Atom("H", -1.27334, -0.16385, 0.81720),
+        ],
+    )
+    rot_mol = mol.copy()
+    rot_mol.rotate(axis=[1.0, 0.0, 0.0], theta=1.5)
+
+    neb = NEB.from_list(NEB._interpolated_species(mol, rot_mol, n=n_images))
+    idpp = IDPP(neb.images)
+    for image in neb.images:
+        energy_gradient(image, method=idpp, n_cores=1)
+
+    return neb, idpp
+
+
+@work_in_tmp_dir()
+def test_frozen_images_are_not_moved_or_evaluated():
+    from autode.neb.original import total_energy, derivative
+
+    neb, idpp = _methane_rotation_neb()
+    images = neb.images
+    images.freeze_tol = 1e3  # All images are converged
+
+    x = images.coords()
+    forces = -derivative(x, images, idpp, 1, False)
+    assert all(image.frozen for image in images[1:-1])
+    assert np.allclose(forces, 0.0)
+
+    # Neither moved nor evaluated. End points are never frozen
+    total_energy(x + 0.1, images, idpp, 1, False)
+    assert np.allclose(images.coords()[15:-15], x[15:-15])
+    assert images.n_evaluations == 0
+
+    # Released once the force is above the tolerance, then evaluated
+    images.freeze_tol = 1e-8
+    forces = -derivative(x, images, idpp, 1, False)
+    assert not any(image.frozen for image in images)
+    assert not np.allclose(forces, 0.0)
+
+    total_energy(x + 0.1, images, idpp, 1, False)
+    assert np.allclose(images.coords(), x + 0.1)
+    assert images.n_evaluations == len(images) - 2
+
+
+@work_in_tmp_dir()
+def test_parallel_image_evaluation_matches_serial():
+    from autode.neb.original import _parallel_energy_gradient
+
+    neb, idpp = _methane_rotation_neb(n_images=8)
+    expected = [float(image.energy) for image in neb.images]
+
+    for image in neb.images:
+        image.energy = image.gradient = None
+
+    _parallel_energy_gradient(
+        neb.images, idxs=list(range(1, 7)), method=idpp, n_cores=3
+    )
+    for i, image in enumerate(neb.images[1:-1], start=1):
+        assert np.isclose(float(image.energy), expected[i])
+        assert image.gradient is not None
+
+
+@pytest.mark.parametrize(
+    "optimiser_type", [LBFGSBandOptimiser, FIREBandOptimiser]
+)
+@work_in_tmp_dir()
+def test_band_optimisers_minimise_the_path_energy(optimiser_type):
+    from autode.neb.original import total_energy
+
+    neb, idpp = _methane_rotation_neb()
+    images = neb.images
+    init_energy = total_energy(images.coords(), images, idpp, 1, False)
+    images.n_evaluations = 0
+
+    optimiser = optimiser_type(maxiter=40, etol=1e-4)
+    result = optimiser.run(images, idpp, n_cores=1, plot_energies=False)
+
+    assert result.fun < 0.1 * init_energy
+    assert np.allclose(result.x, images.coords())
+
+    # Only one evaluation of every interior image per iteration
+    assert 0 < result.nfev <= 40
+    assert images.n_evaluations == result.nfev * (len(images) - 2)
+
+
+def test_band_optimiser_step_is_capped_per_image():
+    optimiser = FIREBandOptimiser(max_step=Distance(0.1, "Å"))
+    step = np.zeros(shape=(3, 2, 3))
+    step[0, 0, 0] = 0.05
+    step[1, 1, :] = 1.0
+    step[2, :, 2] = 0.3
+
+    capped = optimiser._capped(step.flatten(), n_images=3).reshape(3, 2, 3)
+    assert np.allclose(capped[0], step[0])
+    assert np.isclose(np.linalg.norm(capped[1, 1]), 0.1)
+    assert np.allclose(capped[2, :, 2], 0.1)
+
+
+def _loop_force(image, im_l, im_r):
+    """Force on a single image, computed from its tangent"""
+    e_l, e, e_r = float(im_l.energy), float(image.energy), float(im_r.energy)
+    x_l, x, x_r = [im.coordinates.flatten() for im in (im_l, image, im_r)]
+    dv_max = max(abs(e_r - e), abs(e_l - e))
+    dv_min = min(abs(e_r - e), abs(e_l - e))
+
+    if e_l < e < e_r:
+        tau = x_r - x
+    elif e_r < e < e_l:
+        tau = x - x_l
+    elif e_l < e_r:
+        tau = (x_r - x) * dv_max + (x - x_l) * dv_min
+    elif e_r < e_l:
+        tau = (x_r - x) * dv_min + (x - x_l) * dv_max
+    else:
+        tau = x_r - x_l
+
+    hat_tau = tau / np.linalg.norm(tau)
+    grad_parallel = np.dot(image.gradient, hat_tau) * hat_tau
+
+    if image.climbing:
+        return -image.gradient + 2.0 * grad_parallel
+
+    f_parallel = (
+        np.linalg.norm(x_r - x) * im_r.k - np.linalg.norm(x - x_l) * im_l.k
+    ) * hat_tau
+    return f_parallel - (image.gradient - grad_parallel)
+
+
+@work_in_tmp_dir()
+def test_band_forces_match_forces_on_single_images():
+    from autode.neb.ci import CImage
+    from autode.neb.original import derivative
+
+    rng = np.random.default_rng(seed=0)
+    neb, _ = _methane_rotation_neb(n_images=8)
+    images = neb.images
+
+    for image in images:
+        image.energy = rng.normal()
+        image.k = 0.1 + rng.uniform()
+        image.gradient = rng.normal(size=(5, 3))
+
+    images[3] = CImage(images[3])
+    forces = -derivative(images.coords(), images, None, 1, False)
+    forces = forces.reshape(len(images), -1)
+
+    assert np.allclose(forces[[0, -1]], 0.0)
+    for i in range(1, len(images) - 1):
+        expected = _loop_force(images[i], images[i - 1], images[i + 1])
+        assert np.allclose(forces[i], expected)
+        assert np.allclose(
+            images[i].get_force(images[i - 1], images[i + 1]), expected
+        )
+
+
+def test_band_forces_tangents_with_equal_energies():
+    from autode.neb.original import band_forces
+
+    x = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 2.0, 0.0]])
+    gradients = np.ones_like(x)
+
+    # The tangent is not defined if an energy is not
+    with pytest.raises(RuntimeError):
+        band_forces(
+            x=x,
+            energies=np.array([0.0, 0.0, np.nan]),
+            gradients=gradients,
+            ks=np.ones(3),
+            climbing=np.zeros(3, dtype=bool),
+        )
+
+    # is the forward tangent for an image between a lower and higher one
+    forces = band_forces(
+        x=x,
+        energies=np.array([-1.0, 0.0, 1.0]),
+        gradients=gradients,
+        ks=np.ones(3),
+        climbing=np.array([False, True, False]),
+    )
+    # τ = (0, 1, 0), so F = -∇V + 2(∇V•τ)τ
+    assert np.allclose(forces[1], [-1.0, 1.0, -1.0])
+
+    # and is the bisecting tangent between equal energies, both at a maximum
+    # and on a plateau
+    tau = np.array([1.0, 2.0, 0.0]) / np.sqrt(5.0)
+    for energies in ([0.0, 1.0, 0.0], [0.0, 0.0, 0.0]):
+        forces = band_forces(
+            x=x,
+            energies=np.array(energies),
+            gradients=gradients,
+            ks=np.ones(3),
+            climbing=np.array([False, True, False]),
+        )
+        assert np.allclose(
+            forces[1], -gradients[1] + 2.0 * np.dot(gradients[1], tau) * tau
+        )
+
+
+@work_in_tmp_dir()
+def test_idpp_band_evaluation_matches_single_images():
+    neb, idpp = _methane_rotation_neb(n_images=6)
+    images = neb.images
+    x = np.array([image.coordinates for image in images])
+    x[1:-1] += np.random.default_rng(0).normal(scale=0.05, size=(4, 5, 3))
+    images.set_coords(x.flatten())
+
+    energies, gradients = idpp.energies_gradients(x)
+    for k, image in enumerate(images):
+        assert np.isclose(energies[k], idpp(image))
+        assert np.allclose(gradients[k], idpp.grad(image))
+
+    idpp.set_energies_gradients(images[2:4])
+    assert np.isclose(images[3].energy, energies[3])
+    assert np.allclose(images[3].gradient, gradients[3].flatten())
+
+    # A cutoff longer than any distance includes all the pairs
+    idpp_cut = IDPP(images, cutoff=Distance(10.0, "Å"))
+    assert np.allclose(idpp_cut.energies_gradients(x)[1], gradients)
+
+    # while only C-H pairs are within 1.2 Å
+    assert len(IDPP(images, cutoff=Distance(1.2, "Å"))._i) == 4
+
+
+@work_in_tmp_dir()
+def test_idpp_relax_reduces_the_band_forces():
+    from autode.neb.original import band_forces
+
+    neb, idpp = _methane_rotation_neb(n_images=8)
+    x = np.array([image.coordinates for image in neb.images])
+
+    def max_force(coords):
+        energies, gradients = idpp.energies_gradients(coords)
+        return np.max(
+            np.abs(
+                band_forces(
+                    x=coords.reshape(8, -1),
+                    energies=energies,
+                    gradients=gradients.reshape(8, -1),
+                    ks=np.full(8, 0.1),
+                    climbing=np.zeros(8, dtype=bool),
+                )
+            )
+        )
+
+    relaxed_x = idpp.relax(x, gtol=0.01)
+    assert max_force(relaxed_x) < 0.01 < max_force(x)
+    assert np.allclose(relaxed_x[[0, -1]], x[[0, -1]])
+
+    # No iterations leaves the band unchanged
+    assert np.allclose(idpp.relax(x, maxiter=0), x)
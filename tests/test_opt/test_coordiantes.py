@@ -1019,3 +1019,70 @@ def test_pic_generation_square_planar():
     pic = AnyPIC.from_species(ptcl4)
     x = ptcl4.coordinates.flatten()
     assert np.linalg.matrix_rank(pic.get_B(x)) == 3 * ptcl4.n_atoms - 6
+
+
+def test_batched_primitives_match_hyper_dual_evaluation():
+    from autode.opt.coordinates._autodiff import DerivativeOrder
+    from autode.opt.coordinates._batched import evaluate_primitives
+
+    x = np.random.default_rng(seed=0).normal(scale=1.5, size=(6, 3))
+    primitives = [
+        PrimitiveDistance(0, 1),
+        ConstrainedPrimitiveDistance(2, 3, value=1.0),
+        PrimitiveInverseDistance(1, 4),
+        PrimitiveBondAngle(0, 1, 2),
+        ConstrainedPrimitiveBondAngle(3, 2, 5, value=1.0),
+        PrimitiveDihedralAngle(0, 1, 2, 3),
+        PrimitiveImproperDihedral(5, 4, 3, 1),
+        PrimitiveLinearAngle(0, 1, 2, 3, LinearBendType.BEND),
+        PrimitiveLinearAngle(0, 1, 2, 3, LinearBendType.COMPLEMENT),
+        PrimitiveDummyLinearAngle(1, 2, 3, LinearBendType.BEND),
+        PrimitiveDummyLinearAngle(1, 2, 4, LinearBendType.COMPLEMENT),
+        CompositeBonds(bonds=[(0, 1), (2, 3)], coeffs=[1.0, -1.0]),
+    ]
+    res = evaluate_primitives(primitives, x, DerivativeOrder.second)
+    B = res.B.toarray()
+
+    for i, primitive in enumerate(primitives):
+        assert np.isclose(res.values[i], primitive(x))
+        assert np.allclose(B[i], primitive.derivative(x))
+        assert np.allclose(
+            res.second_derivative(i), primitive.second_derivative(x)
+        )
+
+    # Only the components of atoms in a primitive are non-zero in B
+    assert res.B[0].nnz == 6 and res.B[5].nnz == 12
+
+
+def test_sparse_wilson_b_matrix():
+    x = CartesianCoordinates(h2o2_mol().coordinates)
+    pic = AnyPIC.from_species(h2o2_mol())
+
+    B = pic.get_sparse_B(x)
+    assert B.shape == (len(pic), 12)
+
+    reference = np.array([primitive.derivative(x) for primitive in pic])
+    assert np.allclose(B.toarray(), reference)
+    assert np.allclose(pic.get_B(x), reference)
+    assert np.allclose(pic(x), [primitive(x) for primitive in pic])
+
+
+@pytest.mark.parametrize("pic_type", [AnyPIC, PrimitiveInverseDistances])
+def test_dic_u_spans_the_nonredundant_space_of_g(pic_type):
+    mol = h2o2_mol()
+    x = CartesianCoordinates(mol.coordinates)
+    pic = (
+        AnyPIC.from_species(mol)
+        if pic_type is AnyPIC
+        else PrimitiveInverseDistances.from_cartesian(x)
+    )
+
+    # Reference from the eigenvectors of the full n_primitives^2 G matrix
+    B = pic.get_B(x)
+    lambd, u = np.linalg.eigh(B @ B.T)
+    u_ref = u[:, np.abs(lambd) > 1e-10]
+
+    U = DIC._calc_U(pic, x)
+    assert U.shape == u_ref.shape == (len(pic), 6)
+    assert np.allclose(U.T @ U, np.eye(6))
+    assert np.allclose(U @ U.T, u_ref @ u_ref.T)
@@ -1,3 +1,4 @@
+import os
 import pytest
 import numpy as np
 from autode.atoms import Atom
@@ -214,6 +215,22 @@ def test_dimer_2d():
     )
 
 
+@work_in_tmp_dir()
+def test_dimer_2d_run():
+    arr = np.array([[np.nan, np.nan], [-0.5, -0.5], [0.0, 0.5]])
+    dimer = Dimer2D(
+        maxiter=100, coords=DimerCoordinates(arr), init_alpha=MWDistance(0.5)
+    )
+    h2 = Molecule(name="h2", atoms=[Atom("H"), Atom("H", x=0.7)])
+    dimer.run(species=h2, method=XTB())
+
+    # History of dimer coordinates is saved in its own type, such that the
+    # previous translations are available
+    assert os.path.isfile("h2_opt_trj.zip")
+    assert dimer.iteration > 2
+    assert np.allclose(dimer._coords.x0, np.zeros(2), atol=1e-2)
+
+
 @requires_working_xtb_install
 @work_in_tmp_dir()
 def test_dimer_sn2():
@@ -25,6 +25,10 @@ from autode.opt.optimisers.steepest_descent import (
     CartesianSDOptimiser,
     DIC_SD_Optimiser,
 )
+from autode.opt.optimisers.trajectory import (
+    BinaryTrajectory,
+    convert_zip_trajectory,
+)
 
 
 def sample_cartesian_optimiser():
@@ -182,10 +186,10 @@ def test_xtb_h2_cart_opt_2():
     optimiser.run(method=XTB(), species=h2())
     assert not optimiser.converged
     # a trajectory file should be written
-    assert os.path.isfile("h2_opt_trj.zip")
+    assert os.path.exists("h2_opt.trj")
     # cleaning up optimiser will remove trajectory
     optimiser.clean_up()
-    assert not os.path.isfile("h2_opt_trj.zip")
+    assert not os.path.exists("h2_opt.trj")
 
 
 @work_in_tmp_dir()
@@ -547,6 +551,93 @@ def test_optimiser_history_save_load_params():
         hist.save_opt_params({"maxiter": 10})
 
 
+@work_in_tmp_dir()
+def test_binary_optimiser_history_storage():
+    coords_list = _get_4_random_coordinates()
+    for i, coords in enumerate(coords_list):
+        coords.e = PotentialEnergy(-1.0 * i, "Ha")
+    coords_list[0].g = np.arange(6, dtype=float)
+    coords_list[1].h = 2.0 * np.eye(6)
+
+    hist = OptimiserHistory(maxlen=2)
+    hist.open("test.trj")
+    assert os.path.isdir("test.trj")
+    for coords in coords_list:
+        hist.add(coords)
+
+    assert len(hist) == 4 and hist._n_stored == 2
+    # read from disk, as Cartesian coordinates
+    assert np.allclose(hist[0], coords_list[0])
+    assert np.allclose(hist[0].g, np.arange(6))
+    assert np.isclose(hist[0].e, 0.0)
+    assert hist[0].h is None
+    assert np.allclose(hist[1].h, 2.0 * np.eye(6))
+    assert hist[1].g is None
+
+    hist.save_opt_params({"maxiter": 10})
+    with pytest.raises(FileExistsError, match="already stored"):
+        hist.save_opt_params({"maxiter": 10})
+    hist.close()
+    assert hist._n_stored == 4
+
+    energies = [float(coords.e) for coords in hist]
+    assert np.allclose(energies, [0.0, -1.0, -2.0, -3.0])
+
+    hist = OptimiserHistory.load("test.trj")
+    assert len(hist) == 4
+    assert hist.get_opt_params() == {"maxiter": 10}
+    # final coordinates are kept in memory as they were added
+    assert np.allclose(hist.final, coords_list[-1])
+    assert np.allclose(hist[1], coords_list[1])
+
+    trj = BinaryTrajectory("test.trj")
+    assert trj.coordinates.shape == (4, 6)
+    assert np.allclose(trj.energies, energies)
+    assert trj.hessians.shape == (1, 6, 6)
+
+    hist.clean_up()
+    assert not os.path.exists("test.trj")
+
+
+@work_in_tmp_dir()
+def test_binary_trajectory_requires_an_autode_trajectory():
+    with pytest.raises(FileNotFoundError):
+        _ = OptimiserHistory.load("test.trj")
+
+    os.mkdir("test.trj")
+    with pytest.raises(ValueError, match="not an autodE trajectory"):
+        _ = OptimiserHistory.load("test.trj")
+
+    trj = BinaryTrajectory.create("new.trj")
+    trj.append(CartesianCoordinates(np.zeros(6)))
+    # all frames must have the same number of coordinates
+    with pytest.raises(ValueError):
+        trj.append(CartesianCoordinates(np.zeros(9)))
+
+
+@work_in_tmp_dir()
+def test_zip_trajectory_conversion():
+    coords_list = _get_4_random_coordinates()
+    hist = OptimiserHistory(maxlen=2)
+    hist.open("savefile.zip")
+    hist.save_opt_params({"maxiter": 5})
+    for coords in coords_list:
+        hist.add(coords)
+    hist.close()
+
+    filename = convert_zip_trajectory("savefile.zip")
+    assert filename == "savefile.trj"
+
+    hist = OptimiserHistory.load(filename)
+    assert len(hist) == 4
+    assert hist.get_opt_params() == {"maxiter": 5}
+    for coords, converted in zip(coords_list, hist):
+        assert np.allclose(coords, converted)
+
+    with pytest.raises(FileNotFoundError):
+        _ = convert_zip_trajectory("other.zip")
+
+
 def test_mocked_method():
     method = Method()
     assert method.implements(CalculationType.energy)
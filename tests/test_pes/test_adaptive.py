@@ -0,0 +1,104 @@
+import os
+import numpy as np
+from autode.atoms import Atom
+from autode.species import Molecule
+from autode.wrappers.ORCA import ORCA
+from autode.wrappers.keywords import OptKeywords
+from autode.pes.relaxed import RelaxedPESnD
+from autode.pes.adaptive import AdaptiveRelaxedPESnD
+from autode.utils import work_in_tmp_dir
+
+
+def _energy(r1, r2):
+    """Double well along r1 - r2 with a saddle point at r1 = r2 = 2.0 Å"""
+    x, y = (r1 - r2) / np.sqrt(2), (r1 + r2 - 4.0) / np.sqrt(2)
+    return 0.03 * (x**2 - 1.2**2) ** 2 / 1.2**4 + 0.05 * y**2
+
+
+class _Model:
+    def _single_energy_coordinates(self, species, **kwargs):
+        r1, r2 = (float(r) for r in species.constraints.distance.values())
+        return _energy(r1, r2), np.array(species.coordinates)
+
+
+class ModelRelaxedPESnD(_Model, RelaxedPESnD):
+    pass
+
+
+class ModelAdaptiveRelaxedPESnD(_Model, AdaptiveRelaxedPESnD):
+    pass
+
+
+def _calculated_surface(cls, n=21):
+    pes = cls(
+        species=Molecule(
+            name="h3",
+            atoms=[Atom("H"), Atom("H", x=1.0), Atom("H", x=4.0)],
+            mult=2,
+        ),
+        rs={(0, 1): (1.0, 3.0, n), (1, 2): (3.0, 1.0, n)},
+    )
+    pes.calculate(method=ORCA(), keywords=OptKeywords(["opt"]), n_cores=2)
+    return pes
+
+
+def test_adaptive_grids():
+    pes = AdaptiveRelaxedPESnD(
+        species=Molecule(atoms=[Atom("H"), Atom("H", x=0.7)]),
+        rs={(0, 1): (1.0, 2.0, 11)},
+    )
+    assert pes._initial_stride() == 4
+    assert pes._grid_idxs(4)[0].tolist() == [0, 4, 8, 10]
+    assert pes._grid_idxs(2)[0].tolist() == [0, 2, 4, 6, 8, 10]
+
+    pes = AdaptiveRelaxedPESnD(
+        species=Molecule(atoms=[Atom("H"), Atom("H", x=0.7)]),
+        rs={(0, 1): (1.0, 2.0, 22)},
+    )
+    assert pes._initial_stride() == 8
+    assert pes._grid_idxs(8)[0].tolist() == [0, 8, 16, 21]
+
+    # Surfaces too small to coarsen are calculated on the full grid
+    pes = AdaptiveRelaxedPESnD(
+        species=Molecule(atoms=[Atom("H"), Atom("H", x=0.7)]),
+        rs={(0, 1): (1.0, 2.0, 4)},
+    )
+    assert pes._initial_stride() == 1
+
+
+def test_interpolated_energies_of_a_linear_surface_are_exact():
+    pes = AdaptiveRelaxedPESnD(
+        species=Molecule(atoms=[Atom("H"), Atom("H", x=0.7), Atom("H", x=2)]),
+        rs={(0, 1): (1.0, 2.0, 11), (1, 2): (1.0, 2.0, 9)},
+    )
+    r1, r2 = np.array(pes.r1), np.array(pes.r2)
+    idxs = pes._grid_idxs(pes._initial_stride())
+    pes._energies[np.ix_(*idxs)] = (2.0 * r1 - r2)[np.ix_(*idxs)]
+
+    assert np.allclose(pes._interpolated_energies(), 2.0 * r1 - r2)
+
+
+@work_in_tmp_dir(filenames_to_copy=[], kept_file_exts=[])
+def test_adaptive_surface_has_the_same_saddle_point_as_the_full_grid():
+    pes = _calculated_surface(ModelAdaptiveRelaxedPESnD)
+    full_pes = _calculated_surface(ModelRelaxedPESnD)
+
+    assert np.sum(pes._calculated) < full_pes._energies.size / 3
+    assert pes._sorted_saddle_points() == full_pes._sorted_saddle_points()
+    assert pes._sorted_saddle_points() == [(10, 10)]
+    assert pes._calculated[10, 10]
+    assert len(list(pes.ts_guesses())) == 1
+
+    # Interpolated energies are within a few times the tolerance
+    error = np.abs(np.array(pes._energies) - np.array(full_pes._energies))
+    assert np.max(error) < 3 * pes._etol
+
+    assert not np.any(np.isnan(pes._energies))
+    assert np.all(np.abs(pes._coordinates).sum(axis=(-2, -1)) > 0)
+
+    pes.save("adaptive.npz")
+    loaded_pes = RelaxedPESnD.from_file("adaptive.npz")
+    assert np.allclose(loaded_pes._energies, pes._energies)
+
+    pes.plot("adaptive.pdf")
+    assert os.path.exists("adaptive.pdf")
@@ -5,6 +5,7 @@ from .. import testutils
 from autode.atoms import Atom
 from autode.species import Molecule
 from autode.wrappers.ORCA import ORCA
+from autode.wrappers.XTB import XTB
 from autode.wrappers.keywords import OptKeywords
 from autode.pes.relaxed import RelaxedPESnD as PESnD
 from autode.units import Unit, energy_unit_from_name
@@ -18,28 +19,12 @@ class RelaxedPESnD(PESnD):
         super(RelaxedPESnD, self).__init__(species=species, rs=rs)
 
 
-def test_points_gen_idxs_1d():
-    pes1d = RelaxedPESnD(rs={(0, 1): (1.0, 2.0, 3)})
-
-    expected_points = [[(0,)], [(1,)], [(2,)]]
-    for expected, true in zip(expected_points, pes1d._points_generator()):
-        assert expected == true
-
-
-def test_points_gen_idxs_2d():
+def test_points_2d():
     pes2d = RelaxedPESnD(rs={(0, 1): (1.0, 2.0, 2), (1, 2): (1.0, 2.0, 2)})
-
     assert len(list(pes2d._points())) == 4
 
-    # For a 2D grid there is points with indices that sum to 0, 1 and 2
-    expected_points = [[(0, 0)], [(0, 1), (1, 0)], [(1, 1)]]
-
-    for expected, true in zip(expected_points, pes2d._points_generator()):
-        # order doesn't matter, so convert to sets
-        assert set(expected) == set(true)
 
-
-def test_points_gen_idxs_3d():
+def test_shape_3d():
     pes3d = RelaxedPESnD(
         rs={
             (0, 1): (1.0, 2.0, 2),
@@ -47,20 +32,8 @@ def test_points_gen_idxs_3d():
             (2, 3): (1.0, 2.0, 2),
         }
     )
-
     assert pes3d.shape == (2, 2, 2)
 
-    expected_points = [
-        [(0, 0, 0)],
-        [(0, 0, 1), (0, 1, 0), (1, 0, 0)],
-        [(0, 1, 1), (1, 0, 1), (1, 1, 0)],
-        [(1, 1, 1)],
-    ]
-
-    for expected, true in zip(expected_points, pes3d._points_generator()):
-        # order doesn't matter, so convert to sets
-        assert set(expected) == set(true)
-
 
 @testutils.work_in_zipped_dir(os.path.join(here, "data.zip"))
 def test_relaxed_with_keywords():
@@ -212,3 +185,109 @@ def test_calculating_a_point_with_broken_method_fails():
     pes = RelaxedPESnD(species=species, rs={(1, 10): (1.5, 2)})
     with pytest.raises(RuntimeError):
         pes.calculate(method=orca)
+
+
+class HarmonicRelaxedPESnD(PESnD):
+    """Relaxed surface with a harmonic energy in the constrained distances,
+    which does not require an electronic structure method"""
+
+    def _single_energy_coordinates(self, species, **kwargs):
+        r = np.array(list(species.constraints.distance.values()))
+        return float(np.sum((r - 1.0) ** 2)), np.array(species.coordinates)
+
+
+def _h3_harmonic_pes():
+    return HarmonicRelaxedPESnD(
+        species=Molecule(
+            name="h3",
+            atoms=[Atom("H"), Atom("H", x=0.7), Atom("H", x=1.7)],
+            mult=2,
+        ),
+        rs={(0, 1): (1.0, 2.0, 3), (1, 2): (1.0, 2.0, 4)},
+    )
+
+
+@work_in_tmp_dir(filenames_to_copy=[], kept_file_exts=[])
+def test_wavefront_calculation_sets_every_point():
+    pes = _h3_harmonic_pes()
+    pes.calculate(method=ORCA(), keywords=OptKeywords(["opt"]), n_cores=2)
+
+    r1, r2 = np.array(pes.r1), np.array(pes.r2)
+    assert np.allclose(pes._energies, (r1 - 1.0) ** 2 + (r2 - 1.0) ** 2)
+
+    # Checkpoint is removed once the surface is complete
+    assert not os.path.exists("h3_scan_checkpoint.npz")
+
+
+def test_points_are_ready_once_a_neighbour_has_an_energy():
+    pes = _h3_harmonic_pes()
+    pes._init_tensors()
+    pending = list(pes._points())
+
+    assert pes._ready_points(pending, n_running=0) == [(0, 0)]
+
+    pes._energies[0, 0] = 0.0
+    pending.remove((0, 0))
+    assert set(pes._ready_points(pending, n_running=1)) == {(1, 0), (0, 1)}
+
+    # Points with no neighbour with an energy are only started from further
+    # away, once no other points are running
+    pes._energies.fill(np.nan)
+    pes._energies[2, 3] = 0.0
+    pending = [(0, 1), (1, 1)]
+    assert pes._ready_points(pending, n_running=1) == []
+    assert pes._ready_points(pending, n_running=0) == [(0, 1)]
+
+
+@work_in_tmp_dir(filenames_to_copy=[], kept_file_exts=[])
+def test_calculation_resumes_from_a_checkpoint():
+    pes = _h3_harmonic_pes()
+    pes._init_tensors()
+    pes._energies[0, 0] = pes._energies[1, 0] = -1.0
+    pes._method, pes._keywords = ORCA(), OptKeywords(["opt"])
+    pes._save_checkpoint()
+
+    pes = _h3_harmonic_pes()
+    pes.calculate(method=ORCA(), keywords=OptKeywords(["opt"]), n_cores=1)
+
+    # Points in the checkpoint are not recalculated
+    assert np.isclose(pes._energies[0, 0], -1.0)
+    assert np.isclose(pes._energies[1, 0], -1.0)
+    assert np.isclose(pes._energies[1, 1], 0.5**2 + (1 / 3) ** 2)
+
+
+@work_in_tmp_dir(filenames_to_copy=[], kept_file_exts=[])
+def test_checkpoint_of_a_different_surface_is_not_resumed():
+    pes = HarmonicRelaxedPESnD(
+        species=_h3_harmonic_pes()._species, rs={(0, 1): (1.0, 2.0, 3)}
+    )
+    pes._init_tensors()
+    pes._energies.fill(-1.0)
+    pes._method, pes._keywords = ORCA(), OptKeywords(["opt"])
+    pes._save_checkpoint()
+
+    pes = _h3_harmonic_pes()
+    pes.calculate(method=ORCA(), keywords=OptKeywords(["opt"]), n_cores=1)
+    assert np.isclose(pes._energies[0, 0], 0.0)
+
+
+@work_in_tmp_dir(filenames_to_copy=[], kept_file_exts=[])
+def test_checkpoint_with_different_keywords_is_not_resumed():
+    pes = _h3_harmonic_pes()
+    pes._init_tensors()
+    pes._energies.fill(-1.0)
+    pes._method, pes._keywords = ORCA(), OptKeywords(["opt", "PBE"])
+    pes._save_checkpoint()
+
+    pes = _h3_harmonic_pes()
+    pes.calculate(method=ORCA(), keywords=OptKeywords(["opt"]), n_cores=1)
+    assert np.isclose(pes._energies[0, 0], 0.0)
+
+    # nor is a checkpoint calculated with a different method
+    pes._energies.fill(-1.0)
+    pes._method = XTB()
+    pes._save_checkpoint()
+
+    pes = _h3_harmonic_pes()
+    pes.calculate(method=ORCA(), keywords=OptKeywords(["opt"]), n_cores=1)
+    assert np.isclose(pes._energies[0, 0], 0.0)
@@ -1,5 +1,6 @@
 import os
 import shutil
+import multiprocessing
 import numpy as np
 from .. import testutils
 import pytest
@@ -15,6 +16,8 @@ from autode.transition_states.templates import get_ts_templates
 from autode.transition_states.templates import get_value_from_file
 from autode.transition_states.templates import get_values_dict_from_file
 from autode.transition_states.templates import TStemplate
+from autode.transition_states.templates import TStemplateLibrary
+from autode.transition_states.templates import get_matching_ts_templates
 from autode.transition_states.transition_state import TransitionState
 from autode.transition_states.ts_guess import TSguess
 from autode.mol_graphs import get_truncated_active_mol_graph
@@ -243,3 +246,78 @@ def test_ts_from_species_is_same_as_from_ts_guess():
     )
 
     assert TransitionState.from_species(Molecule("vaskas_TS.xyz")) == ts
+
+
+def _sn2_template(charge=-1):
+    ts_graph = reac_complex.graph.copy()
+    ts_graph.add_edge(0, 2, active=True)
+    ts_graph.remove_edge(1, 2)
+    ts_graph.add_edge(1, 2, active=True)
+
+    truncated_graph = get_truncated_active_mol_graph(ts_graph)
+    truncated_graph.edges[(0, 2)]["distance"] = 1.9
+    truncated_graph.edges[(1, 2)]["distance"] = 2.0
+
+    template = TStemplate(truncated_graph, species=reac_complex)
+    template.charge = charge
+    return template
+
+
+def _save_sn2_templates(n):
+    for _ in range(n):
+        _sn2_template().save(folder_path=os.getcwd())
+
+
+@work_in_tmp_dir()
+def test_ts_template_library(monkeypatch):
+    _sn2_template().save(folder_path=os.getcwd())
+    _sn2_template(charge=0).save(folder_path=os.getcwd())
+
+    library = TStemplateLibrary.from_folder(os.getcwd())
+    assert len(library) == 2
+    assert os.path.exists(TStemplateLibrary.store_filename)
+
+    truncated_graph = get_truncated_active_mol_graph(
+        graph=reac_complex.graph, active_bonds=[(0, 2), (1, 2)]
+    )
+    matching = get_matching_ts_templates(
+        reac_complex, truncated_graph, folder_path=os.getcwd()
+    )
+    assert len(matching) == 1 and matching[0].charge == -1
+    assert matching[0].filename.endswith("template0.txt")
+
+    # A new library is loaded from the store without parsing any templates
+    def load(*args, **kwargs):
+        raise AssertionError("Template was parsed")
+
+    monkeypatch.setattr(TStemplate, "load", load)
+    library = TStemplateLibrary(os.getcwd())
+    library.refresh()
+    assert len(library.templates) == 2
+    monkeypatch.undo()
+
+    # Removing a template file removes it from the library
+    os.remove("template1.txt")
+    assert len(TStemplateLibrary.from_folder(os.getcwd())) == 1
+
+
+@work_in_tmp_dir()
+def test_ts_template_library_concurrent_saves():
+    processes = [
+        multiprocessing.Process(target=_save_sn2_templates, args=(5,))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    filenames = [name for name in os.listdir() if name.endswith(".txt")]
+    assert len(filenames) == 20
+
+    library = TStemplateLibrary.from_folder(os.getcwd())
+    assert len(library) == 20
+    assert all(
+        template.graph.number_of_nodes() == 6 for template in library.templates
+    )
@@ -18,7 +18,9 @@ from autode.utils import (
     log_time,
     requires_graph,
     ProcessPool,
+    WorkerPool,
     temporary_config,
+    _shared_executor,
 )
 from autode.wrappers.keywords.keywords import Functional
 from autode.config import Config
@@ -354,6 +356,67 @@ def worker_fn():
     assert Config.ORCA.keywords.sp.functional == Functional("B3LYP")
 
 
+def _worker_pid_and_cwd(_):
+    time.sleep(0.05)
+    return os.getpid(), os.getcwd()
+
+
+def _raise_value_error():
+    raise ValueError
+
+
+@work_in_tmp_dir(filenames_to_copy=[], kept_file_exts=[])
+def test_worker_pool_reuses_workers():
+    # Other tests may have grown the shared pool to more than two workers
+    _shared_executor.shutdown()
+
+    with WorkerPool(max_workers=2) as pool:
+        jobs = [pool.submit(_worker_pid_and_cwd, i) for i in range(4)]
+        pids = {job.result()[0] for job in jobs}
+
+    assert len(pids) <= 2
+    assert all(job.result()[1] == os.getcwd() for job in jobs)
+
+    # A second pool should run in the same processes, but in the current
+    # working directory
+    os.mkdir("tmp")
+    os.chdir("tmp")
+    with WorkerPool(max_workers=1) as pool:
+        pid, cwd = pool.submit(_worker_pid_and_cwd, 0).result()
+    os.chdir("..")
+
+    assert pid in pids
+    assert cwd.endswith("tmp")
+
+    stats = WorkerPool.stats()
+    assert stats["n_tasks"] >= 5
+    assert stats["run_time"] > 0.0 and stats["wait_time"] >= 0.0
+
+
+def test_worker_pool_limits_concurrency():
+    start_time = time.time()
+    with WorkerPool(max_workers=1) as pool:
+        for i in range(3):
+            pool.submit(_worker_pid_and_cwd, i)
+
+    # Tasks should run one after the other
+    assert time.time() - start_time > 0.15
+
+
+def test_worker_pool_config_and_exceptions():
+    with temporary_config():
+        Config.n_cores = 9
+        Config.ORCA.keywords.sp.functional = "B3LYP"
+        with WorkerPool(max_workers=2) as pool:
+            pool.submit(worker_fn).result()
+
+    with WorkerPool(max_workers=2) as pool:
+        job = pool.submit(_raise_value_error)
+
+        with pytest.raises(ValueError):
+            job.result()
+
+
 def test_temporary_config_context_manager():
     old_n_cores = Config.n_cores
     old_orca_funct = Config.ORCA.keywords.sp.functional
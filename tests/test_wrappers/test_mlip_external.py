@@ -0,0 +1,163 @@
+import json
+import threading
+import numpy as np
+import pytest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from autode import Molecule
+from autode.atoms import Atom
+from autode.values import Distance
+from autode.hessians import NumericalHessianCalculator
+from autode.conformers import Conformer, Conformers
+from autode.wrappers import mlip_external
+from autode.wrappers.mlip_external import (
+    MLIP,
+    run_mlip_batch,
+    run_mlip_single_point,
+)
+from autode.utils import work_in_tmp_dir
+
+_k = 0.3  # Ha Å^-2
+_bohr_per_ang = 1.8897261
+
+
+def _energy_forces(structure):
+    """Harmonic potential about the origin. Forces in Ha bohr^-1"""
+    x = np.array(structure["coordinates"], dtype=float)
+    energy = 0.5 * _k * np.sum(x**2)
+    forces = -_k * x / _bohr_per_ang
+    return {"energy": energy, "forces": forces.tolist()}
+
+
+class _StubServer:
+    def __init__(self, batch: bool = True):
+        self.requests = []
+        self.ports = set()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                payload = json.loads(self.rfile.read(length))
+                stub.requests.append(self.path)
+                stub.ports.add(self.client_address[1])
+
+                if self.path == "/calculate":
+                    self._reply(200, _energy_forces(payload))
+
+                elif self.path == "/calculate_batch" and batch:
+                    results = [
+                        _energy_forces(s) for s in payload["structures"]
+                    ]
+                    self._reply(200, {"results": results})
+
+                else:
+                    self._reply(404, {"detail": "Not Found"})
+
+            def _reply(self, status, data):
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        ).start()
+        return self
+
+    def __exit__(self, *args):
+        mlip_external._connections.close()
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _geometry(shift=0.0):
+    return [("H", 0.1 + shift, 0.0, 0.0), ("H", 0.8, 0.2 - shift, 0.0)]
+
+
+def test_batch_matches_single_points():
+    with _StubServer() as server:
+        geometries = [_geometry(shift) for shift in (0.0, 0.1, 0.2)]
+        batch = run_mlip_batch(geometries, server_url=server.url)
+
+        assert server.requests == ["/calculate_batch"]
+
+        for i, geometry in enumerate(geometries):
+            single = run_mlip_single_point(geometry, server_url=server.url)
+            assert np.isclose(batch.energies[i], single.energy)
+            assert np.allclose(batch.forces[i], np.array(single.forces))
+
+
+def test_requests_reuse_a_connection():
+    with _StubServer() as server:
+        for _ in range(5):
+            run_mlip_single_point(_geometry(), server_url=server.url)
+
+        assert len(server.requests) == 5
+        assert len(server.ports) == 1
+
+
+def test_batch_falls_back_to_sequential_requests():
+    with _StubServer(batch=False) as server:
+        geometries = [_geometry(shift) for shift in (0.0, 0.1)]
+        result = run_mlip_batch(geometries, server_url=server.url)
+        assert len(result.energies) == 2
+        assert server.requests.count("/calculate") == 2
+
+        # Batch endpoint is not requested again for this server
+        run_mlip_batch(geometries, server_url=server.url)
+        assert server.requests.count("/calculate_batch") == 1
+
+    mlip_external._servers_without_batch.discard(server.url)
+
+
+@work_in_tmp_dir()
+def test_conformer_single_points_are_batched():
+    with _StubServer() as server:
+        method = MLIP(server_url=server.url)
+        assert method.implements_batch
+
+        h2 = Molecule(atoms=[Atom("H"), Atom("H", x=0.7)])
+        confs = Conformers(
+            [Conformer(name=f"conf{i}", species=h2) for i in range(3)]
+        )
+        confs.single_point(method=method, keywords=method.keywords.sp)
+
+        assert server.requests == ["/calculate_batch"]
+        assert all(conf.energy is not None for conf in confs)
+        assert np.isclose(confs[1].energy, 0.5 * _k * 0.7**2)
+
+
+@work_in_tmp_dir()
+@pytest.mark.parametrize("c_diff", [True, False])
+def test_numerical_hessian_is_batched(c_diff):
+    with _StubServer() as server:
+        method = MLIP(server_url=server.url)
+        h2 = Molecule(atoms=[Atom("H"), Atom("H", x=0.7)])
+
+        calculator = NumericalHessianCalculator(
+            species=h2,
+            method=method,
+            keywords=method.keywords.grad,
+            do_c_diff=c_diff,
+            shift=Distance(0.001, units="Å"),
+        )
+        calculator.calculate()
+
+        assert server.requests == ["/calculate_batch"]
+        assert np.allclose(
+            calculator.hessian.to("Ha Å^-2"), _k * np.eye(6), atol=1e-4
+        )
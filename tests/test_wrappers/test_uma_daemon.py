@@ -0,0 +1,95 @@
+import os
+import sys
+import json
+import numpy as np
+import pytest
+
+from autode import Molecule
+from autode.atoms import Atom
+from autode.config import Config
+from autode.calculations import Calculation
+from autode.wrappers import UMA as uma_module
+from autode.wrappers.UMA import UMA
+from autode.wrappers.keywords import GradientKeywords
+from autode.utils import work_in_tmp_dir
+
+_provider_dir = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "providers")
+)
+
+# Provider with the real command line and serve loop but a harmonic potential
+# in place of the UMA model, so no torch/fairchem is required
+_stub_provider = f"""
+import os
+import sys
+sys.path.insert(0, {_provider_dir!r})
+import uma_provider
+
+
+def run(spec):
+    x = spec["coords"]
+    energy = 0.5 * sum(c**2 for xyz in x for c in xyz)
+    return {{"ok": True, "energy": energy, "gradient": x, "pid": os.getpid()}}
+
+
+uma_provider.run = run
+sys.exit(uma_provider.main(sys.argv))
+"""
+
+
+@pytest.fixture
+def stub_uma(tmp_path):
+    provider = tmp_path / "stub_provider.py"
+    provider.write_text(_stub_provider)
+
+    method = UMA()
+    method.path = sys.executable
+    method.provider = str(provider)
+    yield method
+
+    uma_module.shutdown_daemons()
+
+
+def _gradient_calc_pid(method, name):
+    h2 = Molecule(atoms=[Atom("H"), Atom("H", x=0.7)])
+    calc = Calculation(
+        name=name,
+        molecule=h2,
+        method=method,
+        keywords=GradientKeywords(["grad"]),
+    )
+    calc.run()
+
+    assert calc.terminated_normally
+    assert np.isclose(h2.energy, 0.5 * 0.7**2)
+    assert np.allclose(h2.gradient[1], [0.7, 0.0, 0.0])
+
+    with open("results.json", "r") as file:
+        return json.load(file)["pid"]
+
+
+@work_in_tmp_dir()
+def test_uma_daemon_is_reused(stub_uma):
+    assert stub_uma.is_available
+
+    pids = {_gradient_calc_pid(stub_uma, name=f"h2_{i}") for i in range(3)}
+    assert len(pids) == 1
+    assert os.getpid() not in pids
+
+    # A daemon that has died is restarted
+    uma_module._daemons[os.getpid()].process.kill()
+    uma_module._daemons[os.getpid()].process.wait()
+    assert _gradient_calc_pid(stub_uma, name="h2_restart") not in pids
+
+
+@work_in_tmp_dir()
+def test_uma_subprocess_per_calculation(stub_uma):
+    Config.UMA.persistent = False
+
+    try:
+        pids = {_gradient_calc_pid(stub_uma, name=f"h2_{i}") for i in range(2)}
+    finally:
+        Config.UMA.persistent = True
+
+    assert len(pids) == 2
+    assert os.getpid() not in uma_module._daemons